@@ -17,7 +17,8 @@ from alembic import context
 from app.core.database import Base, DATABASE_URL
 from app.models.user import User
 from app.models.template import Template
-from app.models.project import Project  # Import all models here
+from app.models.project import Project
+from app.models.revoked_token import RevokedToken  # Import all models here
 
 # this is the Alembic Config object
 config = context.config
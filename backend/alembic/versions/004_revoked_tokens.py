@@ -0,0 +1,40 @@
+"""Add revoked_tokens table
+
+Revision ID: 004_revoked_tokens
+Revises: 003_projects
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_revoked_tokens'
+down_revision: Union[str, None] = '003_projects'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create revoked_tokens table."""
+    op.create_table(
+        'revoked_tokens',
+        sa.Column('jti', sa.String(length=64), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('jti')
+    )
+    op.create_index(op.f('ix_revoked_tokens_user_id'), 'revoked_tokens', ['user_id'], unique=False)
+    op.create_index(op.f('ix_revoked_tokens_revoked_at'), 'revoked_tokens', ['revoked_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop revoked_tokens table."""
+    op.drop_index(op.f('ix_revoked_tokens_revoked_at'), table_name='revoked_tokens')
+    op.drop_index(op.f('ix_revoked_tokens_user_id'), table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
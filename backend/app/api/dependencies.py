@@ -9,46 +9,39 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.services.auth import AuthService
+from app.core.database import async_read_session, get_db, get_read_db
+from app.core.tracing import tracer
+from app.services.auth import AuthService, is_admin
 from app.models.user import User
-from app.core.exceptions import UnauthorizedException, NotFoundException
+from app.core.exceptions import (
+    AppException,
+    ForbiddenException,
+    UnauthorizedException,
+    NotFoundException,
+)
 
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    session: Annotated[AsyncSession, Depends(get_db)]
-) -> User:
-    """Get the current authenticated user from JWT token.
-
-    This dependency extracts the JWT token from the Authorization header,
-    verifies it, and returns the corresponding user.
+async def _authenticate(token: str, session: AsyncSession) -> User:
+    """Resolve a bearer token to its user, mapping failures to 401.
 
     Args:
-        credentials: HTTP Bearer credentials containing the JWT token
-        session: Database session from dependency injection
+        token: JWT access token
+        session: Session used for user and revocation lookups
 
     Returns:
         The authenticated User instance
 
     Raises:
         HTTPException: 401 if token is invalid or user not found
-
-    Example:
-        >>> @router.get("/protected")
-        >>> async def protected_route(
-        ...     user: User = Depends(get_current_user)
-        ... ):
-        ...     return {"user": user.email}
     """
     try:
-        token = credentials.credentials
         auth_service = AuthService(session)
-        user = await auth_service.get_current_user(token)
+        with tracer.start_as_current_span("auth.get_current_user"):
+            user = await auth_service.get_current_user(token)
         return user
 
     except (UnauthorizedException, NotFoundException) as e:
@@ -65,6 +58,77 @@ async def get_current_user(
         )
 
 
+def _require_active(user: User) -> User:
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Inactive user account"
+        )
+    return user
+
+
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    session: Annotated[AsyncSession, Depends(get_db)]
+) -> User:
+    """Get the current authenticated user from JWT token.
+
+    This dependency extracts the JWT token from the Authorization header,
+    verifies it, and returns the corresponding user. Lookups use the
+    ``get_db`` session, which FastAPI shares with an endpoint that also
+    depends on ``get_db``, so writing endpoints use a single session.
+    Endpoints that only read use ``get_current_user_read_only``.
+
+    Args:
+        credentials: HTTP Bearer credentials containing the JWT token
+        session: Database session from dependency injection
+
+    Returns:
+        The authenticated User instance
+
+    Raises:
+        HTTPException: 401 if token is invalid or user not found
+
+    Example:
+        >>> @router.post("/protected")
+        >>> async def protected_route(
+        ...     user: User = Depends(get_current_user),
+        ...     session: AsyncSession = Depends(get_db)
+        ... ):
+        ...     return {"user": user.email}
+    """
+    return await _authenticate(credentials.credentials, session)
+
+
+async def get_current_user_read_only(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> User:
+    """Get the current authenticated user through the read-only session.
+
+    Like ``get_current_user``, for endpoints that never write: the lookup
+    shares the endpoint's ``get_read_db`` session.
+
+    Args:
+        credentials: HTTP Bearer credentials containing the JWT token
+        session: Read-only database session from dependency injection
+
+    Returns:
+        The authenticated User instance
+
+    Raises:
+        HTTPException: 401 if token is invalid or user not found
+
+    Example:
+        >>> @router.get("/protected")
+        >>> async def protected_route(
+        ...     user: User = Depends(get_current_user_read_only)
+        ... ):
+        ...     return {"user": user.email}
+    """
+    return await _authenticate(credentials.credentials, session)
+
+
 async def get_current_active_user(
     current_user: Annotated[User, Depends(get_current_user)]
 ) -> User:
@@ -83,15 +147,73 @@ async def get_current_active_user(
         HTTPException: 401 if user account is not active
 
     Example:
-        >>> @router.get("/active-only")
+        >>> @router.put("/active-only")
         >>> async def active_route(
         ...     user: User = Depends(get_current_active_user)
         ... ):
         ...     return {"user": user.email}
     """
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Inactive user account"
-        )
+    return _require_active(current_user)
+
+
+async def get_current_active_user_read_only(
+    current_user: Annotated[User, Depends(get_current_user_read_only)]
+) -> User:
+    """Get the current active user through the read-only session.
+
+    Args:
+        current_user: The authenticated user from get_current_user_read_only
+
+    Returns:
+        The active User instance
+
+    Raises:
+        HTTPException: 401 if user account is not active
+    """
+    return _require_active(current_user)
+
+
+async def get_current_admin_user(
+    current_user: Annotated[User, Depends(get_current_active_user_read_only)]
+) -> User:
+    """Get the current user, requiring admin access.
+
+    Admin endpoints do not write to the database, so the user is resolved
+    through the read-only session.
+
+    Args:
+        current_user: The active user from get_current_active_user_read_only
+
+    Returns:
+        The admin User instance
+
+    Raises:
+        ForbiddenException: 403 if the user is not listed in ``ADMIN_EMAILS``
+    """
+    if not is_admin(current_user):
+        raise ForbiddenException("Admin access required")
     return current_user
+
+
+async def is_admin_authorization(authorization: str) -> bool:
+    """Check an ``Authorization`` header value for an active admin's token.
+
+    For middleware, which runs outside FastAPI's dependency injection. A
+    read-only session is opened only to resolve the user, so the check is
+    as cheap as authenticating a normal request.
+
+    Args:
+        authorization: Value of the request's ``Authorization`` header
+
+    Returns:
+        True if the header carries a valid bearer token of an active admin
+    """
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    async with async_read_session() as session:
+        try:
+            user = await AuthService(session).get_current_user(token)
+        except AppException:
+            return False
+    return user.is_active and is_admin(user)
@@ -0,0 +1,134 @@
+"""Admin diagnostics API endpoints.
+
+Memory diagnostics are per worker process: each call acts on whichever
+worker serves it.
+"""
+
+from typing import Annotated, List, Literal
+
+from fastapi import APIRouter, Depends, Query
+from starlette.concurrency import run_in_threadpool
+
+from app.api.dependencies import get_current_admin_user
+from app.core.exceptions import ValidationException
+from app.core.memory import memory_tracker
+from app.models.user import User
+from app.schemas.admin import AllocationSite, MemoryStatus, MemoryTraceStart
+from app.schemas.common import ApiResponse
+
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+GroupBy = Literal["lineno", "filename", "traceback"]
+
+
+@router.get(
+    "/memory",
+    response_model=ApiResponse[MemoryStatus],
+    summary="Get allocation tracing status"
+)
+async def memory_status(
+    admin: Annotated[User, Depends(get_current_admin_user)]
+) -> ApiResponse[MemoryStatus]:
+    """Get tracing state, traced memory and peak allocations of sampled routes."""
+    return ApiResponse[MemoryStatus](
+        message="Memory status retrieved successfully",
+        data=MemoryStatus.model_validate(memory_tracker.status())
+    )
+
+
+@router.post(
+    "/memory/start",
+    response_model=ApiResponse[MemoryStatus],
+    summary="Start allocation tracing"
+)
+async def start_memory_tracing(
+    data: MemoryTraceStart,
+    admin: Annotated[User, Depends(get_current_admin_user)]
+) -> ApiResponse[MemoryStatus]:
+    """Start (or restart) tracemalloc, clearing the baseline and route peaks."""
+    memory_tracker.start(data.frames)
+    return ApiResponse[MemoryStatus](
+        message="Memory tracing started",
+        data=MemoryStatus.model_validate(memory_tracker.status())
+    )
+
+
+@router.post(
+    "/memory/stop",
+    response_model=ApiResponse[MemoryStatus],
+    summary="Stop allocation tracing"
+)
+async def stop_memory_tracing(
+    admin: Annotated[User, Depends(get_current_admin_user)]
+) -> ApiResponse[MemoryStatus]:
+    """Stop tracemalloc and free the memory it holds."""
+    memory_tracker.stop()
+    return ApiResponse[MemoryStatus](
+        message="Memory tracing stopped",
+        data=MemoryStatus.model_validate(memory_tracker.status())
+    )
+
+
+@router.post(
+    "/memory/snapshot",
+    response_model=ApiResponse[MemoryStatus],
+    summary="Take a baseline snapshot"
+)
+async def take_memory_snapshot(
+    admin: Annotated[User, Depends(get_current_admin_user)]
+) -> ApiResponse[MemoryStatus]:
+    """Snapshot current allocations as the baseline for `/memory/diff`."""
+    try:
+        await run_in_threadpool(memory_tracker.take_baseline)
+    except RuntimeError as e:
+        raise ValidationException(str(e))
+
+    return ApiResponse[MemoryStatus](
+        message="Baseline snapshot taken",
+        data=MemoryStatus.model_validate(memory_tracker.status())
+    )
+
+
+@router.get(
+    "/memory/top",
+    response_model=ApiResponse[List[AllocationSite]],
+    summary="Get top allocation sites"
+)
+async def top_allocations(
+    admin: Annotated[User, Depends(get_current_admin_user)],
+    limit: int = Query(20, ge=1, le=500, description="Number of sites"),
+    group_by: GroupBy = Query("lineno", description="Group allocations by line, file or stack"),
+) -> ApiResponse[List[AllocationSite]]:
+    """Get the allocation sites currently holding the most memory."""
+    try:
+        sites = await run_in_threadpool(memory_tracker.top, limit, group_by)
+    except RuntimeError as e:
+        raise ValidationException(str(e))
+
+    return ApiResponse[List[AllocationSite]](
+        message="Top allocation sites retrieved successfully",
+        data=[AllocationSite.model_validate(site) for site in sites]
+    )
+
+
+@router.get(
+    "/memory/diff",
+    response_model=ApiResponse[List[AllocationSite]],
+    summary="Compare allocations with the baseline"
+)
+async def diff_allocations(
+    admin: Annotated[User, Depends(get_current_admin_user)],
+    limit: int = Query(20, ge=1, le=500, description="Number of sites"),
+    group_by: GroupBy = Query("lineno", description="Group allocations by line, file or stack"),
+) -> ApiResponse[List[AllocationSite]]:
+    """Get the allocation sites that grew most since the baseline snapshot."""
+    try:
+        sites = await run_in_threadpool(memory_tracker.diff, limit, group_by)
+    except RuntimeError as e:
+        raise ValidationException(str(e))
+
+    return ApiResponse[List[AllocationSite]](
+        message="Allocation diff retrieved successfully",
+        data=[AllocationSite.model_validate(site) for site in sites]
+    )
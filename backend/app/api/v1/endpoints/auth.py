@@ -4,14 +4,29 @@ This module provides REST API endpoints for user authentication operations
 including registration, login, logout, and profile management.
 """
 
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.api.dependencies import get_current_user, get_current_active_user
+from app.api.dependencies import (
+    get_current_user,
+    get_current_active_user,
+    get_current_active_user_read_only,
+    security,
+)
 from app.services.auth import AuthService
-from app.schemas.auth import RegisterRequest, LoginRequest, TokenResponse, UserResponse
+from app.schemas.auth import (
+    RegisterRequest,
+    LoginRequest,
+    RefreshRequest,
+    LogoutRequest,
+    UserResponse,
+    UserTokenResponse,
+    UserTokenPairResponse,
+)
+from app.schemas.common import ApiResponse
 from app.models.user import User
 
 
@@ -20,14 +35,14 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 @router.post(
     "/register",
-    response_model=dict,
+    response_model=ApiResponse[UserTokenResponse],
     status_code=status.HTTP_201_CREATED,
     summary="Register a new user"
 )
 async def register(
     data: RegisterRequest,
     session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
+) -> ApiResponse[UserTokenResponse]:
     """Register a new user account.
 
     Creates a new user with the provided email, password, and full name.
@@ -38,7 +53,7 @@ async def register(
         session: Database session
 
     Returns:
-        Dictionary with user data and access token
+        Response envelope with user data and access token
 
     Raises:
         422: If email is already registered
@@ -46,26 +61,24 @@ async def register(
     auth_service = AuthService(session)
     user, access_token = await auth_service.register(data)
 
-    return {
-        "success": True,
-        "message": "User registered successfully",
-        "data": {
-            "user": UserResponse.model_validate(user),
-            "access_token": access_token,
-            "token_type": "bearer"
-        }
-    }
+    return ApiResponse[UserTokenResponse](
+        message="User registered successfully",
+        data=UserTokenResponse(
+            user=UserResponse.model_validate(user),
+            access_token=access_token,
+        )
+    )
 
 
 @router.post(
     "/login",
-    response_model=dict,
+    response_model=ApiResponse[UserTokenPairResponse],
     summary="Login user"
 )
 async def login(
     data: LoginRequest,
     session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
+) -> ApiResponse[UserTokenPairResponse]:
     """Authenticate a user and return tokens.
 
     Verifies the email and password, then generates access and refresh tokens.
@@ -75,7 +88,7 @@ async def login(
         session: Database session
 
     Returns:
-        Dictionary with tokens and user data
+        Response envelope with tokens and user data
 
     Raises:
         401: If credentials are invalid
@@ -86,52 +99,101 @@ async def login(
         data.password
     )
 
-    return {
-        "success": True,
-        "message": "Login successful",
-        "data": {
-            "user": UserResponse.model_validate(user),
-            "access_token": access_token,
-            "refresh_token": refresh_token,
-            "token_type": "bearer"
-        }
-    }
+    return ApiResponse[UserTokenPairResponse](
+        message="Login successful",
+        data=UserTokenPairResponse(
+            user=UserResponse.model_validate(user),
+            access_token=access_token,
+            refresh_token=refresh_token,
+        )
+    )
+
+
+@router.post(
+    "/refresh",
+    response_model=ApiResponse[UserTokenPairResponse],
+    summary="Refresh tokens"
+)
+async def refresh(
+    data: RefreshRequest,
+    session: Annotated[AsyncSession, Depends(get_db)]
+) -> ApiResponse[UserTokenPairResponse]:
+    """Exchange a refresh token for a new access and refresh token.
+
+    The presented refresh token is revoked, so clients must store the new
+    refresh token returned here.
+
+    Args:
+        data: The refresh token
+        session: Database session
+
+    Returns:
+        Response envelope with new tokens and user data
+
+    Raises:
+        401: If the refresh token is invalid, expired or revoked
+    """
+    auth_service = AuthService(session)
+    user, access_token, refresh_token = await auth_service.refresh(
+        data.refresh_token
+    )
+
+    return ApiResponse[UserTokenPairResponse](
+        message="Tokens refreshed",
+        data=UserTokenPairResponse(
+            user=UserResponse.model_validate(user),
+            access_token=access_token,
+            refresh_token=refresh_token,
+        )
+    )
 
 
 @router.post(
     "/logout",
-    response_model=dict,
+    response_model=ApiResponse[None],
     summary="Logout user"
 )
 async def logout(
-    current_user: Annotated[User, Depends(get_current_user)]
-) -> dict:
+    current_user: Annotated[User, Depends(get_current_user)],
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    session: Annotated[AsyncSession, Depends(get_db)],
+    data: Optional[LogoutRequest] = None
+) -> ApiResponse[None]:
     """Logout the current user.
 
-    Note: In a stateless JWT system, logout is handled client-side by
-    removing the token. This endpoint confirms the logout action.
+    Revokes the access token used for this request and, if supplied in the
+    body, the matching refresh token. Revoked tokens are rejected by every
+    worker from then on.
 
     Args:
         current_user: The authenticated user
+        credentials: Bearer credentials of this request
+        session: Database session
+        data: Optional body with the refresh token to revoke
 
     Returns:
         Success message
     """
-    return {
-        "success": True,
-        "message": "Logged out successfully",
-        "data": None
-    }
+    auth_service = AuthService(session)
+    await auth_service.logout(
+        credentials.credentials,
+        data.refresh_token if data else None
+    )
+
+    return ApiResponse[None](
+        message="Logged out successfully",
+        data=None
+    )
 
 
 @router.get(
     "/me",
-    response_model=dict,
+    response_model=ApiResponse[UserResponse],
     summary="Get current user"
 )
 async def get_me(
-    current_user: Annotated[User, Depends(get_current_active_user)]
-) -> dict:
+    current_user: Annotated[User, Depends(get_current_active_user_read_only)]
+) -> ApiResponse[UserResponse]:
     """Get the currently authenticated user's profile.
 
     Args:
@@ -140,23 +202,22 @@ async def get_me(
     Returns:
         Current user's profile data
     """
-    return {
-        "success": True,
-        "message": "User profile retrieved",
-        "data": UserResponse.model_validate(current_user)
-    }
+    return ApiResponse[UserResponse](
+        message="User profile retrieved",
+        data=UserResponse.model_validate(current_user)
+    )
 
 
 @router.put(
     "/me",
-    response_model=dict,
+    response_model=ApiResponse[UserResponse],
     summary="Update current user profile"
 )
 async def update_me(
     full_name: str,
     current_user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
+) -> ApiResponse[UserResponse]:
     """Update the current user's profile.
 
     Args:
@@ -173,8 +234,7 @@ async def update_me(
         full_name
     )
 
-    return {
-        "success": True,
-        "message": "Profile updated successfully",
-        "data": UserResponse.model_validate(updated_user)
-    }
+    return ApiResponse[UserResponse](
+        message="Profile updated successfully",
+        data=UserResponse.model_validate(updated_user)
+    )
@@ -1,14 +1,26 @@
 """Project API endpoints."""
 
-from typing import Annotated, Dict, Any
-from fastapi import APIRouter, Depends, status, Body
+from typing import Annotated, Dict, Any, List
+from fastapi import APIRouter, Depends, Request, Response, status, Body
 from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
-from app.core.database import get_db
-from app.api.dependencies import get_current_active_user
+from app.core.database import get_db, get_read_db
+from app.core.http_cache import (
+    ResourceValidator,
+    is_conditional,
+    is_not_modified,
+    not_modified_response,
+)
+from app.api.dependencies import get_current_active_user, get_current_active_user_read_only
 from app.services.project import ProjectService
-from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.schemas.common import ApiResponse
+from app.schemas.project import (
+    ProjectCreate,
+    ProjectUpdate,
+    ProjectResponse,
+    GeneratedCodeResponse,
+)
 from app.models.user import User
 
 
@@ -17,7 +29,7 @@ router = APIRouter(prefix="/projects", tags=["Projects"])
 
 @router.post(
     "",
-    response_model=dict,
+    response_model=ApiResponse[ProjectResponse],
     status_code=status.HTTP_201_CREATED,
     summary="Create a new project"
 )
@@ -25,65 +37,72 @@ async def create_project(
     data: ProjectCreate,
     current_user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
+) -> ApiResponse[ProjectResponse]:
     """Create a new code generation project."""
     service = ProjectService(session)
     project = await service.create_project(data, current_user.id)
 
-    return {
-        "success": True,
-        "message": "Project created successfully",
-        "data": ProjectResponse.model_validate(project)
-    }
+    return ApiResponse[ProjectResponse](
+        message="Project created successfully",
+        data=ProjectResponse.model_validate(project)
+    )
 
 
 @router.get(
     "",
-    response_model=dict,
+    response_model=ApiResponse[List[ProjectResponse]],
     summary="List user's projects"
 )
 async def list_projects(
-    current_user: Annotated[User, Depends(get_current_active_user)],
-    session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
+    current_user: Annotated[User, Depends(get_current_active_user_read_only)],
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> ApiResponse[List[ProjectResponse]]:
     """List all projects for the current user."""
     service = ProjectService(session)
     projects = await service.repository.get_by_user(current_user.id)
 
-    return {
-        "success": True,
-        "message": "Projects retrieved successfully",
-        "data": [ProjectResponse.model_validate(p) for p in projects]
-    }
+    return ApiResponse[List[ProjectResponse]](
+        message="Projects retrieved successfully",
+        data=[ProjectResponse.model_validate(p) for p in projects]
+    )
 
 
 @router.get(
     "/{project_id}",
-    response_model=dict,
+    response_model=ApiResponse[ProjectResponse],
     summary="Get project by ID"
 )
 async def get_project(
     project_id: uuid.UUID,
-    session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
-    """Get a specific project by ID."""
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> ApiResponse[ProjectResponse]:
+    """Get a specific project by ID.
+
+    Supports conditional requests via ``If-None-Match`` /
+    ``If-Modified-Since``.
+    """
     service = ProjectService(session)
-    project = await service.repository.get(project_id)
-
-    if not project:
-        from app.core.exceptions import NotFoundException
-        raise NotFoundException(f"Project {project_id} not found")
-
-    return {
-        "success": True,
-        "message": "Project retrieved successfully",
-        "data": ProjectResponse.model_validate(project)
-    }
+    if is_conditional(request):
+        validator = ResourceValidator.for_record(
+            await service.get_project_validator(project_id)
+        )
+        if is_not_modified(request, validator):
+            return not_modified_response(validator)
+
+    project = await service.get_project(project_id)
+    ResourceValidator.for_record(project).apply(response)
+
+    return ApiResponse[ProjectResponse](
+        message="Project retrieved successfully",
+        data=ProjectResponse.model_validate(project)
+    )
 
 
 @router.put(
     "/{project_id}",
-    response_model=dict,
+    response_model=ApiResponse[ProjectResponse],
     summary="Update project"
 )
 async def update_project(
@@ -91,51 +110,64 @@ async def update_project(
     data: ProjectUpdate,
     current_user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
-    """Update a project."""
+) -> ApiResponse[ProjectResponse]:
+    """Update a project.
+
+    Raises:
+        403: If the project belongs to another user
+        404: If the project does not exist
+    """
     service = ProjectService(session)
     project = await service.update_project(project_id, data, current_user.id)
 
-    return {
-        "success": True,
-        "message": "Project updated successfully",
-        "data": ProjectResponse.model_validate(project)
-    }
+    return ApiResponse[ProjectResponse](
+        message="Project updated successfully",
+        data=ProjectResponse.model_validate(project)
+    )
 
 
 @router.delete(
     "/{project_id}",
-    response_model=dict,
+    response_model=ApiResponse[None],
     summary="Delete project"
 )
 async def delete_project(
     project_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
-    """Delete a project."""
+) -> ApiResponse[None]:
+    """Delete a project.
+
+    Raises:
+        403: If the project belongs to another user
+        404: If the project does not exist
+    """
     service = ProjectService(session)
     await service.delete_project(project_id, current_user.id)
 
-    return {
-        "success": True,
-        "message": "Project deleted successfully",
-        "data": None
-    }
+    return ApiResponse[None](
+        message="Project deleted successfully",
+        data=None
+    )
 
 
 @router.post(
     "/{project_id}/generate",
-    response_model=dict,
+    response_model=ApiResponse[ProjectResponse],
     summary="Generate code for project"
 )
 async def generate_code(
     project_id: uuid.UUID,
-    variables: Dict[str, Any] = Body(..., description="Template variables"),
     current_user: Annotated[User, Depends(get_current_active_user)],
-    session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
-    """Generate code for a project using its template."""
+    session: Annotated[AsyncSession, Depends(get_db)],
+    variables: Dict[str, Any] = Body(..., description="Template variables"),
+) -> ApiResponse[ProjectResponse]:
+    """Generate code for a project using its template.
+
+    Raises:
+        403: If the project belongs to another user
+        404: If the project does not exist
+    """
     service = ProjectService(session)
     project = await service.generate_code_for_project(
         project_id,
@@ -143,36 +175,45 @@ async def generate_code(
         variables
     )
 
-    return {
-        "success": True,
-        "message": "Code generated successfully",
-        "data": ProjectResponse.model_validate(project)
-    }
+    return ApiResponse[ProjectResponse](
+        message="Code generated successfully",
+        data=ProjectResponse.model_validate(project)
+    )
 
 
 @router.get(
     "/{project_id}/code",
-    response_model=dict,
+    response_model=ApiResponse[GeneratedCodeResponse],
     summary="Get generated code"
 )
 async def get_generated_code(
     project_id: uuid.UUID,
-    session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
-    """Get the generated code for a project."""
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> ApiResponse[GeneratedCodeResponse]:
+    """Get the generated code for a project.
+
+    Supports conditional requests via ``If-None-Match`` /
+    ``If-Modified-Since``; a 304 never loads the generated code.
+    """
     service = ProjectService(session)
-    project = await service.repository.get(project_id)
-
-    if not project:
-        from app.core.exceptions import NotFoundException
-        raise NotFoundException(f"Project {project_id} not found")
-
-    return {
-        "success": True,
-        "message": "Generated code retrieved",
-        "data": {
-            "project_id": project.id,
-            "code": project.generated_code,
-            "status": project.status
-        }
-    }
+    if is_conditional(request):
+        validator = ResourceValidator.for_record(
+            await service.get_project_validator(project_id),
+            variant="code",
+        )
+        if is_not_modified(request, validator):
+            return not_modified_response(validator)
+
+    project = await service.get_project(project_id)
+    ResourceValidator.for_record(project, variant="code").apply(response)
+
+    return ApiResponse[GeneratedCodeResponse](
+        message="Generated code retrieved",
+        data=GeneratedCodeResponse(
+            project_id=project.id,
+            code=project.generated_code,
+            status=project.status,
+        )
+    )
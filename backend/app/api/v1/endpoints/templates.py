@@ -1,18 +1,29 @@
 """Template API endpoints."""
 
-from typing import Annotated, Optional
-from fastapi import APIRouter, Depends, Query, status
+from typing import Annotated, Literal, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.api.dependencies import get_current_active_user
+from app.core.config import settings
+from app.core.database import async_session, get_db, get_read_db
+from app.core.ndjson import NDJSON_MEDIA_TYPE, iter_lines
+from app.core.http_cache import (
+    ResourceValidator,
+    is_conditional,
+    is_not_modified,
+    not_modified_response,
+)
+from app.api.dependencies import get_current_active_user, get_current_active_user_read_only
 from app.services.template import TemplateService
 from app.schemas.template import (
     TemplateCreate,
     TemplateUpdate,
     TemplateResponse,
-    TemplateListResponse
+    TemplateListResponse,
+    TemplateImportReport,
 )
+from app.schemas.common import ApiResponse
 from app.models.user import User
 import uuid
 
@@ -22,7 +33,7 @@ router = APIRouter(prefix="/templates", tags=["Templates"])
 
 @router.post(
     "",
-    response_model=dict,
+    response_model=ApiResponse[TemplateResponse],
     status_code=status.HTTP_201_CREATED,
     summary="Create a new template"
 )
@@ -30,33 +41,32 @@ async def create_template(
     data: TemplateCreate,
     current_user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
+) -> ApiResponse[TemplateResponse]:
     """Create a new code generation template."""
     service = TemplateService(session)
     template = await service.create_template(data, current_user.id)
 
-    return {
-        "success": True,
-        "message": "Template created successfully",
-        "data": TemplateResponse.model_validate(template)
-    }
+    return ApiResponse[TemplateResponse](
+        message="Template created successfully",
+        data=TemplateResponse.model_validate(template)
+    )
 
 
 @router.get(
     "",
-    response_model=dict,
+    response_model=ApiResponse[TemplateListResponse],
     summary="List templates"
 )
 async def list_templates(
-    session: Annotated[AsyncSession, Depends(get_db)],
+    session: Annotated[AsyncSession, Depends(get_read_db)],
     category: Optional[str] = Query(None, description="Filter by category"),
     language: Optional[str] = Query(None, description="Filter by language"),
     search: Optional[str] = Query(None, description="Search query"),
     my_templates: bool = Query(False, description="Show only my templates"),
     skip: int = Query(0, ge=0, description="Skip N templates"),
     limit: int = Query(20, ge=1, le=100, description="Limit results"),
-    current_user: Annotated[User, Depends(get_current_active_user)] = None
-) -> dict:
+    current_user: Annotated[User, Depends(get_current_active_user_read_only)] = None
+) -> ApiResponse[TemplateListResponse]:
     """List templates with optional filters."""
     service = TemplateService(session)
 
@@ -76,42 +86,123 @@ async def list_templates(
     total = len(templates)
     pages = (total + limit - 1) // limit if limit > 0 else 1
 
-    return {
-        "success": True,
-        "message": "Templates retrieved successfully",
-        "data": {
-            "items": [TemplateResponse.model_validate(t) for t in templates],
-            "total": total,
-            "page": skip // limit + 1 if limit > 0 else 1,
-            "size": limit,
-            "pages": pages
+    return ApiResponse[TemplateListResponse](
+        message="Templates retrieved successfully",
+        data=TemplateListResponse(
+            items=[TemplateResponse.model_validate(t) for t in templates],
+            total=total,
+            page=skip // limit + 1 if limit > 0 else 1,
+            size=limit,
+            pages=pages,
+        )
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export templates as NDJSON",
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def export_templates(
+    current_user: Annotated[User, Depends(get_current_active_user_read_only)],
+    scope: Literal["mine", "public"] = Query("mine", description="Export my templates or all public ones"),
+) -> StreamingResponse:
+    """Stream templates as newline-delimited JSON.
+
+    Rows are read through a server-side cursor and written as they arrive,
+    so memory use stays constant however many templates are exported. The
+    output can be fed back to ``POST /templates/import``.
+    """
+    user_id = current_user.id if scope == "mine" else None
+
+    async def body():
+        # Own session: dependency sessions are closed before streaming starts.
+        # Cursors need a transaction, so this uses the primary, not a replica.
+        async with async_session() as session:
+            async for chunk in TemplateService(session).export_templates(user_id):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="templates.ndjson"'},
+    )
+
+
+@router.post(
+    "/import",
+    response_model=ApiResponse[TemplateImportReport],
+    summary="Import templates from NDJSON",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}},
         }
-    }
+    },
+)
+async def import_templates(
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    session: Annotated[AsyncSession, Depends(get_db)]
+) -> ApiResponse[TemplateImportReport]:
+    """Import templates from a newline-delimited JSON upload.
+
+    Each line is a template in ``TemplateCreate`` form (export lines are
+    accepted; extra fields are ignored). The body is consumed as a stream
+    and inserted in batches, each committed separately. The response
+    reports imported and failed lines per batch.
+    """
+    service = TemplateService(session)
+    report = await service.import_templates(
+        iter_lines(request.stream(), settings.TEMPLATE_IMPORT_MAX_LINE_BYTES),
+        current_user.id
+    )
+
+    return ApiResponse[TemplateImportReport](
+        success=report.failed == 0,
+        message=f"Imported {report.imported} templates, {report.failed} failed",
+        data=report
+    )
 
 
 @router.get(
     "/{template_id}",
-    response_model=dict,
+    response_model=ApiResponse[TemplateResponse],
     summary="Get template by ID"
 )
 async def get_template(
     template_id: uuid.UUID,
-    session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
-    """Get a specific template by ID."""
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_read_db)]
+) -> ApiResponse[TemplateResponse]:
+    """Get a specific template by ID.
+
+    Supports conditional requests: a matching ``If-None-Match`` or
+    ``If-Modified-Since`` header yields ``304 Not Modified`` without
+    loading the template content.
+    """
     service = TemplateService(session)
+    if is_conditional(request):
+        validator = ResourceValidator.for_record(
+            await service.get_template_validator(template_id)
+        )
+        if is_not_modified(request, validator):
+            return not_modified_response(validator)
+
     template = await service.get_template(template_id)
+    ResourceValidator.for_record(template).apply(response)
 
-    return {
-        "success": True,
-        "message": "Template retrieved successfully",
-        "data": TemplateResponse.model_validate(template)
-    }
+    return ApiResponse[TemplateResponse](
+        message="Template retrieved successfully",
+        data=TemplateResponse.model_validate(template)
+    )
 
 
 @router.put(
     "/{template_id}",
-    response_model=dict,
+    response_model=ApiResponse[TemplateResponse],
     summary="Update template"
 )
 async def update_template(
@@ -119,34 +210,42 @@ async def update_template(
     data: TemplateUpdate,
     current_user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
-    """Update a template."""
+) -> ApiResponse[TemplateResponse]:
+    """Update a template.
+
+    Raises:
+        403: If the template belongs to another user
+        404: If the template does not exist
+    """
     service = TemplateService(session)
     template = await service.update_template(template_id, data, current_user.id)
 
-    return {
-        "success": True,
-        "message": "Template updated successfully",
-        "data": TemplateResponse.model_validate(template)
-    }
+    return ApiResponse[TemplateResponse](
+        message="Template updated successfully",
+        data=TemplateResponse.model_validate(template)
+    )
 
 
 @router.delete(
     "/{template_id}",
-    response_model=dict,
+    response_model=ApiResponse[None],
     summary="Delete template"
 )
 async def delete_template(
     template_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_active_user)],
     session: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
-    """Delete a template."""
+) -> ApiResponse[None]:
+    """Delete a template.
+
+    Raises:
+        403: If the template belongs to another user
+        404: If the template does not exist
+    """
     service = TemplateService(session)
     await service.delete_template(template_id, current_user.id)
 
-    return {
-        "success": True,
-        "message": "Template deleted successfully",
-        "data": None
-    }
+    return ApiResponse[None](
+        message="Template deleted successfully",
+        data=None
+    )
@@ -5,7 +5,7 @@ This module combines all API endpoints under the /api/v1 prefix.
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, templates, projects
+from app.api.v1.endpoints import admin, auth, templates, projects
 
 
 # Create main API router with v1 prefix
@@ -15,3 +15,4 @@ api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(auth.router)
 api_router.include_router(templates.router)
 api_router.include_router(projects.router)
+api_router.include_router(admin.router)
@@ -0,0 +1,179 @@
+"""In-process caching utilities.
+
+This module provides a small bounded LRU cache with per-entry expiry, used
+for hot-path lookups (authenticated users, verified tokens) that would
+otherwise cost a database round trip or repeated decoding on every request,
+and a Bloom filter for cheap negative membership checks.
+"""
+
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache whose entries expire after a time-to-live.
+
+    Entries are evicted least-recently-used first once ``maxsize`` is
+    reached, and are dropped lazily on lookup once expired. The cache is
+    meant to be used from a single event loop and performs no locking.
+
+    Attributes:
+        maxsize: Maximum number of entries kept
+        ttl: Default time-to-live of an entry, in seconds
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that found no live entry
+        evictions: Number of entries dropped to make room
+
+    Example:
+        >>> cache = TTLCache(maxsize=1000, ttl=30)
+        >>> cache.set("key", "value")
+        >>> cache.get("key")
+        'value'
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Default time-to-live of an entry, in seconds
+            clock: Monotonic time source (overridable for testing)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Get a live entry, refreshing its LRU position.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The cached value, or ``default``
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Store an entry, evicting the least recently used one if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live for this entry; defaults to the cache's ``ttl``
+        """
+        if self.maxsize <= 0:
+            return
+
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove an entry, returning its value if present.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The removed value (even if expired), or None
+        """
+        entry = self._data.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._data.get(key)  # type: ignore[arg-type]
+        return entry is not None and entry[0] > self._clock()
+
+
+class BloomFilter:
+    """Probabilistic set answering "definitely absent" without false negatives.
+
+    Membership tests may return false positives at roughly ``error_rate``
+    while fewer than ``capacity`` items have been added. Items cannot be
+    removed; rebuild the filter to drop them.
+
+    Attributes:
+        capacity: Number of items the filter is sized for
+        error_rate: Target false-positive probability at capacity
+        count: Number of items added
+
+    Example:
+        >>> bloom = BloomFilter(capacity=1000, error_rate=0.001)
+        >>> bloom.add("a1b2")
+        >>> "a1b2" in bloom
+        True
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        """Initialize an empty filter.
+
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: Target false-positive probability at capacity
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self._size
+        return ((h1 + i * h2) % size for i in range(self._hashes))
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
@@ -0,0 +1,269 @@
+"""Negotiated HTTP response compression.
+
+This module provides an ASGI middleware that compresses text-like responses
+with the best encoding the client accepts: zstd and Brotli when the optional
+``zstandard`` / ``brotli`` packages are installed, gzip otherwise. Small
+bodies are sent as-is, streamed bodies are compressed chunk by chunk and
+flushed as they go, and responses that already carry a ``Content-Encoding``
+pass through untouched.
+"""
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# Media types worth compressing; everything else (images, archives) is sent as-is
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+)
+
+
+class _Compressor(ABC):
+    """Incremental compressor for one response body."""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it, so streamed output is not delayed."""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Return the remaining output and end the stream."""
+
+
+class _GzipCompressor(_Compressor):
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor(_Compressor):
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdCompressor(_Compressor):
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encodings(
+    gzip_level: int = 6,
+    brotli_quality: int = 4,
+    zstd_level: int = 3,
+) -> Dict[str, Callable[[], _Compressor]]:
+    """Get compressor factories for the installed encodings, best first.
+
+    Args:
+        gzip_level: zlib compression level (1-9)
+        brotli_quality: Brotli quality (0-11)
+        zstd_level: zstd compression level (1-22)
+
+    Returns:
+        Mapping of content-coding name to compressor factory
+    """
+    encodings: Dict[str, Callable[[], _Compressor]] = {}
+    if zstandard is not None:
+        encodings["zstd"] = lambda: _ZstdCompressor(zstd_level)
+    if brotli is not None:
+        encodings["br"] = lambda: _BrotliCompressor(brotli_quality)
+    encodings["gzip"] = lambda: _GzipCompressor(gzip_level)
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, supported: List[str]) -> Optional[str]:
+    """Choose a content-coding from an ``Accept-Encoding`` header.
+
+    Codings the client accepts with a non-zero q-value are eligible; among
+    those the highest q-value wins, ties going to the server's preference
+    order in ``supported``. ``*`` matches any coding not listed explicitly.
+
+    Args:
+        accept_encoding: Value of the request's ``Accept-Encoding`` header
+        supported: Supported codings, most preferred first
+
+    Returns:
+        The chosen coding, or None to send the body uncompressed
+
+    Example:
+        >>> negotiate_encoding("gzip, br;q=0.9", ["zstd", "br", "gzip"])
+        'gzip'
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+
+    best, best_q = None, 0.0
+    for coding in supported:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses per ``Accept-Encoding``.
+
+    Complete bodies smaller than ``minimum_size`` are sent uncompressed.
+    Streaming bodies are always compressed when negotiated, with each chunk
+    flushed so clients receive data as it is produced. A strong ``ETag`` is
+    made weak on compressed responses, since the bytes differ from the
+    identity representation.
+
+    Example:
+        >>> app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            minimum_size: Smallest complete body, in bytes, worth compressing
+            gzip_level: zlib compression level (1-9)
+            brotli_quality: Brotli quality (0-11), if ``brotli`` is installed
+            zstd_level: zstd compression level, if ``zstandard`` is installed
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings(gzip_level, brotli_quality, zstd_level)
+        self._supported = list(self.encodings)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self._supported
+        )
+        responder = _CompressionResponder(self, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-response state of ``CompressionMiddleware``."""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: Optional[str]):
+        self.middleware = middleware
+        self._send = send
+        self.encoding = encoding
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # Held back until the first body chunk shows the body's size
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            compressible = (
+                message["status"] not in (204, 304)
+                and "content-encoding" not in headers
+                and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            )
+            if compressible:
+                MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+            self.passthrough = not compressible or self.encoding is None
+            if self.passthrough:
+                await self._send(message)
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                # Whole body is small: not worth the CPU or the extra headers
+                await self._send(self.start_message)
+                await self._send(message)
+                self.passthrough = True
+                return
+
+            self.compressor = self.middleware.encodings[self.encoding]()
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+
+            if not more_body:
+                compressed = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(compressed))
+                await self._send(self.start_message)
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+
+            del headers["Content-Length"]
+            await self._send(self.start_message)
+
+        chunk = self.compressor.compress(body) if body else b""
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self._send({
+            "type": "http.response.body",
+            "body": chunk,
+            "more_body": more_body,
+        })
+
@@ -17,17 +17,25 @@ class AppException(Exception):
     Attributes:
         status_code: HTTP status code for the error response
         detail: Human-readable error message
+        headers: Extra response headers (e.g. Retry-After)
     """
 
-    def __init__(self, status_code: int, detail: str):
+    def __init__(
+        self,
+        status_code: int,
+        detail: str,
+        headers: Optional[Dict[str, str]] = None
+    ):
         """Initialize the exception.
 
         Args:
             status_code: HTTP status code
             detail: Error message
+            headers: Optional extra response headers
         """
         self.status_code = status_code
         self.detail = detail
+        self.headers = headers
         super().__init__(detail)
 
 
@@ -73,6 +81,27 @@ class UnauthorizedException(AppException):
         )
 
 
+class ForbiddenException(AppException):
+    """Exception raised when an authenticated user lacks permission.
+
+    Returns HTTP 403 Forbidden.
+
+    Example:
+        >>> raise ForbiddenException("Admin access required")
+    """
+
+    def __init__(self, message: str = "Forbidden"):
+        """Initialize the exception.
+
+        Args:
+            message: Description of the missing permission
+        """
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=message
+        )
+
+
 class ValidationException(AppException):
     """Exception raised when input validation fails.
 
@@ -102,6 +131,29 @@ class ValidationException(AppException):
         self.errors = errors or {}
 
 
+class ServiceUnavailableException(AppException):
+    """Exception raised when the server sheds load instead of queueing work.
+
+    Returns HTTP 503 Service Unavailable with a Retry-After header.
+
+    Example:
+        >>> raise ServiceUnavailableException("Too many concurrent logins")
+    """
+
+    def __init__(self, message: str = "Service temporarily unavailable", retry_after: int = 1):
+        """Initialize the exception.
+
+        Args:
+            message: Description of the overload condition
+            retry_after: Seconds the client should wait before retrying
+        """
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=message,
+            headers={"Retry-After": str(retry_after)}
+        )
+
+
 async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
     """Handle custom application exceptions.
 
@@ -125,6 +177,7 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
     return JSONResponse(
         status_code=exc.status_code,
         content=response_content,
+        headers=exc.headers,
     )
 
 
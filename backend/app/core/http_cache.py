@@ -0,0 +1,167 @@
+"""HTTP caching validators and conditional request handling.
+
+This module provides weak ETag / Last-Modified validators derived from a
+record's ``id`` and modification timestamp, and helpers for answering
+``If-None-Match`` / ``If-Modified-Since`` conditional GET requests with
+``304 Not Modified``.
+
+ETags are weak because they identify a version of the record, not the
+bytes of one encoding of it: ``CompressionMiddleware`` leaves weak tags
+alone, so a 304 carries exactly the tag the client got with the 200.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+
+# Clients must revalidate before reusing a cached representation
+CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class ResourceValidator:
+    """Cache validators for a single resource representation.
+
+    Attributes:
+        etag: Weak entity tag (``W/"..."``)
+        last_modified: Timestamp of the last modification (UTC)
+
+    Example:
+        >>> validator = ResourceValidator.for_record(template)
+        >>> validator.etag
+        'W/"5f2b..."'
+    """
+
+    etag: str
+    last_modified: datetime
+
+    @classmethod
+    def for_record(cls, record: Any, variant: str = "") -> "ResourceValidator":
+        """Build validators from a record's id and modification timestamp.
+
+        Works for both ORM instances and column-only rows, as long as they
+        expose ``id``, ``created_at`` and ``updated_at`` attributes.
+
+        Args:
+            record: Model instance or row with id/created_at/updated_at
+            variant: Representation name, so different views of the same
+                record (e.g. a project and its generated code) get
+                distinct ETags
+
+        Returns:
+            ResourceValidator for the record
+        """
+        modified = record.updated_at or record.created_at
+        if modified.tzinfo is None:
+            modified = modified.replace(tzinfo=timezone.utc)
+
+        digest = hashlib.sha256(
+            f"{variant}:{record.id}:{modified.isoformat()}".encode()
+        ).hexdigest()[:32]
+
+        return cls(etag=f'W/"{digest}"', last_modified=modified)
+
+    @property
+    def headers(self) -> dict:
+        """Response headers carrying these validators."""
+        return {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(
+                self.last_modified.astimezone(timezone.utc), usegmt=True
+            ),
+            "Cache-Control": CACHE_CONTROL,
+        }
+
+    def apply(self, response: Response) -> None:
+        """Set the validator headers on an outgoing response.
+
+        Args:
+            response: The response to annotate
+        """
+        response.headers.update(self.headers)
+
+
+def _strip_weak(tag: str) -> str:
+    """Return an entity tag without its weak ``W/`` prefix."""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    """Parse an HTTP-date header value, returning None if malformed."""
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def is_conditional(request: Request) -> bool:
+    """Check whether a request carries conditional GET headers.
+
+    Endpoints use this to skip the validator query on plain requests and
+    derive validators from the loaded record instead.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        True if ``If-None-Match`` or ``If-Modified-Since`` is present
+    """
+    headers = request.headers
+    return "if-none-match" in headers or "if-modified-since" in headers
+
+
+def is_not_modified(request: Request, validator: ResourceValidator) -> bool:
+    """Check whether a conditional GET can be answered with 304.
+
+    ``If-None-Match`` takes precedence over ``If-Modified-Since``, as
+    required by RFC 9110. Entity tags are compared weakly.
+
+    Args:
+        request: The incoming request
+        validator: Current validators of the requested resource
+
+    Returns:
+        True if the client's cached representation is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        current = _strip_weak(validator.etag)
+        return any(
+            _strip_weak(tag) == current for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        since = _parse_http_date(if_modified_since)
+        if since is None:
+            return False
+        # HTTP dates have one-second resolution
+        return validator.last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def not_modified_response(validator: ResourceValidator) -> Response:
+    """Build an empty ``304 Not Modified`` response.
+
+    Args:
+        validator: Current validators of the resource
+
+    Returns:
+        Response with status 304 and validator headers
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator.headers,
+    )
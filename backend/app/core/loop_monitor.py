@@ -0,0 +1,116 @@
+"""Event loop lag monitoring.
+
+Synchronous work inside async handlers (hashing, rendering, validating
+large payloads) stalls every request in the worker. This module measures
+how late the event loop runs a periodic timer and, when the loop stops
+responding for longer than a threshold, logs the stack of the code that
+is blocking it, captured from a watchdog thread.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from app.core.metrics import Counter, Histogram
+
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Delay between a timer's due time and the event loop running it",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+LOOP_STALLS = Counter(
+    "event_loop_stalls",
+    "Times the event loop was blocked longer than LOOP_LAG_THRESHOLD_MS",
+)
+
+
+class EventLoopMonitor:
+    """Measures event loop lag and reports stalls with the blocking stack.
+
+    A task on the loop sleeps for ``interval`` and records how late it
+    wakes up. It also stamps a heartbeat that a watchdog thread checks;
+    when the heartbeat is older than ``interval + threshold`` the loop is
+    blocked, and the watchdog logs the loop thread's current stack once
+    per stall.
+
+    Example:
+        >>> monitor = EventLoopMonitor(interval=0.05, threshold=0.1)
+        >>> monitor.start()
+        >>> ...
+        >>> await monitor.stop()
+    """
+
+    def __init__(self, interval: float, threshold: float):
+        """Initialize the monitor.
+
+        Args:
+            interval: Seconds between lag measurements
+            threshold: Seconds of blocking after which a stall is reported
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self._lag = LOOP_LAG.labels()
+        self._stalls = LOOP_STALLS.labels()
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._loop_thread_id = 0
+        self._heartbeat = 0.0
+
+    def start(self) -> None:
+        """Start measuring; must be called from the event loop."""
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._measure())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the measuring task and the watchdog thread."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+
+    async def _measure(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self._lag.observe(max(loop.time() - due, 0.0))
+            self._heartbeat = time.monotonic()
+
+    def _watch(self) -> None:
+        reported = None
+        limit = self.interval + self.threshold
+        while not self._stopped.wait(self.threshold / 2):
+            heartbeat = self._heartbeat
+            blocked_for = time.monotonic() - heartbeat
+            if blocked_for < limit or heartbeat == reported:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            reported = heartbeat
+            self._stalls.inc()
+            logger.warning(
+                "Event loop blocked for %.0f ms; stack of the blocking code:\n%s",
+                (blocked_for - self.interval) * 1000,
+                "".join(traceback.format_stack(frame)),
+            )
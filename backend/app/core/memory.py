@@ -0,0 +1,262 @@
+"""Allocation tracking with ``tracemalloc``.
+
+This module wraps ``tracemalloc`` for the admin diagnostics endpoints:
+starting and stopping tracing, top allocation sites, and differences
+against a baseline snapshot. While tracing is on, a middleware samples
+the peak memory allocated by selected routes.
+
+Tracing slows allocation-heavy code noticeably, so it is off until an
+admin starts it.
+"""
+
+import random
+import threading
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import Histogram
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+PEAK_ALLOCATION = Histogram(
+    "http_request_peak_allocated_bytes",
+    "Peak memory allocated while serving sampled requests (tracemalloc)",
+    ("method", "route"),
+    buckets=tuple(float(1 << shift) for shift in range(16, 31, 2)),
+)
+
+# Allocations made by the tracing machinery itself
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _describe(statistics: Iterable[Any], limit: int, diff: bool) -> List[Dict[str, Any]]:
+    sites = []
+    for stat in list(statistics)[:limit]:
+        frame = stat.traceback[0]
+        site = {
+            "location": f"{frame.filename}:{frame.lineno}",
+            "size_bytes": stat.size,
+            "count": stat.count,
+        }
+        if diff:
+            site["size_diff_bytes"] = stat.size_diff
+            site["count_diff"] = stat.count_diff
+        if len(stat.traceback) > 1:
+            site["traceback"] = [f"{f.filename}:{f.lineno}" for f in stat.traceback]
+        sites.append(site)
+    return sites
+
+
+class MemoryTracker:
+    """Process-wide ``tracemalloc`` session with a baseline snapshot.
+
+    Example:
+        >>> memory_tracker.start(frames=10)
+        >>> memory_tracker.take_baseline()
+        >>> ...
+        >>> memory_tracker.diff(limit=20)
+    """
+
+    def __init__(self):
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self.baseline_taken_at: Optional[datetime] = None
+        self._peaks: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        # Process-wide peak from before the latest per-request peak reset
+        self._earlier_peak = 0
+
+    @property
+    def tracing(self) -> bool:
+        """Whether ``tracemalloc`` is tracing allocations."""
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> None:
+        """Start tracing, clearing the baseline and route peaks.
+
+        Args:
+            frames: Stack frames stored per allocation; more frames give
+                full tracebacks at a higher memory and CPU cost
+        """
+        tracemalloc.stop()
+        tracemalloc.start(frames)
+        self._baseline = None
+        self.baseline_taken_at = None
+        self._peaks.clear()
+        self._earlier_peak = 0
+
+    def stop(self) -> None:
+        """Stop tracing and release its memory, including the baseline."""
+        tracemalloc.stop()
+        self._baseline = None
+        self.baseline_taken_at = None
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not tracing; start it first")
+        return tracemalloc.take_snapshot().filter_traces(_IGNORED)
+
+    def take_baseline(self) -> None:
+        """Snapshot current allocations as the baseline for ``diff``.
+
+        Raises:
+            RuntimeError: If tracing is off
+        """
+        with self._lock:
+            self._baseline = self._snapshot()
+            self.baseline_taken_at = datetime.now(timezone.utc)
+
+    def top(self, limit: int = 20, group_by: str = "lineno") -> List[Dict[str, Any]]:
+        """Get the allocation sites holding the most memory.
+
+        Args:
+            limit: Number of sites returned
+            group_by: ``lineno``, ``filename`` or ``traceback``
+
+        Returns:
+            Sites with ``location``, ``size_bytes`` and ``count``
+
+        Raises:
+            RuntimeError: If tracing is off
+        """
+        return _describe(self._snapshot().statistics(group_by), limit, diff=False)
+
+    def diff(self, limit: int = 20, group_by: str = "lineno") -> List[Dict[str, Any]]:
+        """Get the allocation sites that grew most since the baseline.
+
+        Args:
+            limit: Number of sites returned
+            group_by: ``lineno``, ``filename`` or ``traceback``
+
+        Returns:
+            Sites as for ``top``, plus ``size_diff_bytes`` and ``count_diff``
+
+        Raises:
+            RuntimeError: If tracing is off or no baseline was taken
+        """
+        with self._lock:
+            baseline = self._baseline
+        if baseline is None:
+            raise RuntimeError("No baseline snapshot; take one first")
+        return _describe(self._snapshot().compare_to(baseline, group_by), limit, diff=True)
+
+    def reset_peak(self) -> None:
+        """Reset ``tracemalloc``'s peak to measure one request.
+
+        The process-wide peak reached so far is remembered, so ``status``
+        still reports it.
+        """
+        self._earlier_peak = max(self._earlier_peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+    def record_peak(self, route: str, peak: int) -> None:
+        """Record a sampled request's peak allocation."""
+        stats = self._peaks.get(route)
+        if stats is None:
+            stats = self._peaks[route] = {"samples": 0, "last_bytes": 0, "max_bytes": 0}
+        stats["samples"] += 1
+        stats["last_bytes"] = peak
+        stats["max_bytes"] = max(stats["max_bytes"], peak)
+
+    def status(self) -> Dict[str, Any]:
+        """Get tracing state, traced memory and sampled route peaks."""
+        traced, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracing": self.tracing,
+            "frames": tracemalloc.get_traceback_limit(),
+            "traced_bytes": traced,
+            "peak_bytes": max(peak, self._earlier_peak) if self.tracing else peak,
+            "tracemalloc_overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+            "max_rss_bytes": (
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 if resource else None
+            ),
+            "baseline_taken_at": self.baseline_taken_at,
+            "route_peaks": [
+                {"route": route, **stats} for route, stats in sorted(self._peaks.items())
+            ],
+        }
+
+
+# Process-wide tracker used by the admin endpoints
+memory_tracker = MemoryTracker()
+
+
+class PeakAllocationMiddleware:
+    """ASGI middleware sampling the peak allocation of selected routes.
+
+    Only active while ``tracemalloc`` is tracing. Requests are matched
+    against the route templates before a sample is taken, so other paths
+    never use up the sampling slot. The traced peak is process-wide, so at
+    most one request is sampled at a time, and other requests running
+    concurrently still count towards it.
+
+    Example:
+        >>> app.add_middleware(
+        ...     PeakAllocationMiddleware,
+        ...     routes={("GET", "/api/v1/templates")},
+        ...     sample_rate=0.1,
+        ... )
+    """
+
+    def __init__(self, app: ASGIApp, routes: Iterable[Tuple[str, str]], sample_rate: float = 1.0):
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            routes: ``(method, route template)`` pairs to sample
+            sample_rate: Fraction of eligible requests sampled
+        """
+        self.app = app
+        self.routes = frozenset(routes)
+        # Route templates compiled as Starlette does, grouped by method
+        self._patterns: Dict[str, List[Tuple[Any, str]]] = {}
+        for method, route in self.routes:
+            self._patterns.setdefault(method, []).append((compile_path(route)[0], route))
+        self.sample_rate = sample_rate
+        self._sampling = False
+
+    def _match(self, scope: Scope) -> Optional[str]:
+        for pattern, route in self._patterns.get(scope["method"], ()):
+            if pattern.match(scope["path"]):
+                return route
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or self._sampling
+            or scope["method"] not in self._patterns
+            or not tracemalloc.is_tracing()
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        route = self._match(scope)
+        if route is None or random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        self._sampling = True
+        try:
+            memory_tracker.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            await self.app(scope, receive, send)
+            peak = tracemalloc.get_traced_memory()[1] - before
+        finally:
+            self._sampling = False
+
+        if tracemalloc.is_tracing():
+            PEAK_ALLOCATION.labels(scope["method"], route).observe(peak)
+            memory_tracker.record_peak(f"{scope['method']} {route}", peak)
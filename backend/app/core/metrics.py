@@ -0,0 +1,364 @@
+"""Lightweight in-process metrics.
+
+This module provides Prometheus-style counters, gauges and histograms with
+pre-bound label children, plus a registry that renders them in the
+Prometheus text exposition format. Metrics are process-local; each worker
+reports its own values.
+
+Hot paths should bind label values once and keep the child::
+
+    >>> requests = Counter("requests", "Requests served", ("route",))
+    >>> list_templates = requests.labels("/api/v1/templates")
+    >>> list_templates.inc()
+"""
+
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, LabelValues, float]
+
+# Default latency buckets, in seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the text exposition format."""
+    if value == math.inf:
+        return "+Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class Metric(ABC):
+    """Base class for a metric family.
+
+    Attributes:
+        name: Metric name
+        documentation: Help text
+        labelnames: Names of the labels children are keyed by
+    """
+
+    type: str = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: "Registry" = None,
+    ):
+        """Initialize and register the metric.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names; empty for an unlabelled metric
+            registry: Registry to register with (defaults to ``REGISTRY``)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+        (registry if registry is not None else REGISTRY).register(self)
+
+    @abstractmethod
+    def _new_child(self):
+        """Create the child holding one label combination's value."""
+
+    def labels(self, *values: str):
+        """Get the child for a combination of label values.
+
+        Children are created once and cached; callers on hot paths should
+        keep the returned child rather than calling ``labels`` per event.
+
+        Args:
+            *values: Label values, in ``labelnames`` order
+
+        Returns:
+            The metric child for these label values
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _unlabelled(self):
+        return self.labels()
+
+    @abstractmethod
+    def samples(self) -> Iterator[Sample]:
+        """Yield ``(name, label values, value)`` samples for this family."""
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    type = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled counter."""
+        self._unlabelled().inc(amount)
+
+    def samples(self) -> Iterator[Sample]:
+        for values, child in self._children.items():
+            yield f"{self.name}_total", values, child.value
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Gauge(Metric):
+    """Value that can go up and down."""
+
+    type = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled gauge."""
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement the unlabelled gauge."""
+        self._unlabelled().dec(amount)
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge."""
+        self._unlabelled().set(value)
+
+    def samples(self) -> Iterator[Sample]:
+        for values, child in self._children.items():
+            yield self.name, values, child.value
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class Histogram(Metric):
+    """Distribution of observations over fixed buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: "Registry" = None,
+    ):
+        """Initialize and register the histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names; empty for an unlabelled metric
+            buckets: Sorted upper bounds of the buckets (``+Inf`` is implied)
+            registry: Registry to register with (defaults to ``REGISTRY``)
+        """
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on the unlabelled histogram."""
+        self._unlabelled().observe(value)
+
+    def samples(self) -> Iterator[Sample]:
+        for values, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                yield f"{self.name}_bucket", values + (_format_value(bound),), cumulative
+            yield f"{self.name}_count", values, cumulative
+            yield f"{self.name}_sum", values, child.sum
+
+
+class CallbackMetric(Metric):
+    """Metric whose samples are computed at collection time.
+
+    Useful for exposing values owned by other objects (cache statistics,
+    pool state) without updating a metric on every event.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        type: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Iterable[Tuple[LabelValues, float]]],
+        registry: "Registry" = None,
+    ):
+        """Initialize and register the metric.
+
+        Args:
+            name: Sample name, including any ``_total`` suffix
+            documentation: Help text
+            type: Prometheus metric type (``counter`` or ``gauge``)
+            labelnames: Label names
+            callback: Returns ``(label values, value)`` pairs when called
+            registry: Registry to register with (defaults to ``REGISTRY``)
+        """
+        self.type = type
+        self._callback = callback
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        raise TypeError(f"{self.name} is computed by its callback and has no children")
+
+    def samples(self) -> Iterator[Sample]:
+        for values, value in self._callback():
+            yield self.name, values, value
+
+
+class Registry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        """Register a metric family.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            family = metric.name
+            if metric.type == "counter" and family.endswith("_total"):
+                family = family[: -len("_total")]
+            lines.append(f"# HELP {family} {metric.documentation}")
+            lines.append(f"# TYPE {family} {metric.type}")
+
+            labelnames = metric.labelnames
+            bucket_labelnames = labelnames + ("le",)
+
+            for name, values, value in metric.samples():
+                names = bucket_labelnames if name.endswith("_bucket") else labelnames
+                if names:
+                    labels = ",".join(
+                        f'{label}="{_escape(str(v))}"' for label, v in zip(names, values)
+                    )
+                    lines.append(f"{name}{{{labels}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+# Default process-wide registry
+REGISTRY = Registry()
+
+
+# Statistics of the in-process caches registered with ``track_cache``
+_tracked_caches: Dict[str, object] = {}
+
+
+def track_cache(name: str, cache) -> None:
+    """Expose a ``TTLCache``'s hit/miss/eviction statistics.
+
+    Args:
+        name: Value of the ``cache`` label
+        cache: The cache instance
+    """
+    _tracked_caches[name] = cache
+
+
+def _cache_stat(attribute: str) -> Callable[[], Iterable[Tuple[LabelValues, float]]]:
+    def collect() -> Iterable[Tuple[LabelValues, float]]:
+        return [((name,), getattr(cache, attribute)) for name, cache in _tracked_caches.items()]
+    return collect
+
+
+CallbackMetric(
+    "cache_hits_total", "Lookups answered from an in-process cache",
+    "counter", ("cache",), _cache_stat("hits"),
+)
+CallbackMetric(
+    "cache_misses_total", "Lookups that missed an in-process cache",
+    "counter", ("cache",), _cache_stat("misses"),
+)
+CallbackMetric(
+    "cache_evictions_total", "Entries evicted from an in-process cache to make room",
+    "counter", ("cache",), _cache_stat("evictions"),
+)
+
+
+def _cache_hit_ratios() -> Iterable[Tuple[LabelValues, float]]:
+    ratios = []
+    for name, cache in _tracked_caches.items():
+        lookups = cache.hits + cache.misses
+        if lookups:
+            ratios.append(((name,), cache.hits / lookups))
+    return ratios
+
+
+CallbackMetric(
+    "cache_hit_ratio", "Fraction of lookups answered from an in-process cache since startup",
+    "gauge", ("cache",), _cache_hit_ratios,
+)
+CallbackMetric(
+    "cache_entries", "Entries currently held by an in-process cache",
+    "gauge", ("cache",), lambda: [((name,), len(cache)) for name, cache in _tracked_caches.items()],
+)
@@ -0,0 +1,66 @@
+"""Newline-delimited JSON (NDJSON) streaming helpers.
+
+NDJSON carries one JSON document per line, so large collections can be
+produced and consumed incrementally without holding them in memory.
+"""
+
+from typing import AsyncIterator, Optional, Tuple
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int,
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """Split a byte stream into numbered NDJSON lines.
+
+    Blank lines are skipped but still counted, so line numbers match the
+    input. A line longer than ``max_line_bytes`` is discarded up to its
+    newline and reported as ``None`` instead of being buffered.
+
+    Args:
+        chunks: Byte chunks, e.g. ``request.stream()``
+        max_line_bytes: Maximum length of a single line
+
+    Yields:
+        ``(line number, line bytes)``, with ``None`` for oversized lines
+
+    Example:
+        >>> async for number, line in iter_lines(request.stream(), 1 << 20):
+        ...     record = TemplateCreate.model_validate_json(line)
+    """
+    buffer = bytearray()
+    number = 0
+    oversized = False
+
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end < 0:
+                if not oversized:
+                    buffer += chunk[start:]
+                    if len(buffer) > max_line_bytes:
+                        oversized = True
+                        buffer.clear()
+                break
+
+            number += 1
+            if oversized:
+                oversized = False
+                yield number, None
+            else:
+                buffer += chunk[start:end]
+                if len(buffer) > max_line_bytes:
+                    yield number, None
+                elif buffer.strip():
+                    yield number, bytes(buffer)
+            buffer.clear()
+            start = end + 1
+
+    if oversized:
+        yield number + 1, None
+    elif buffer.strip():
+        yield number + 1, bytes(buffer)
@@ -0,0 +1,219 @@
+"""On-demand profiling of single requests.
+
+An authorized request carrying an ``X-Profile`` header is run under a
+profiler, and the response body is replaced by the profile as a download:
+
+- ``X-Profile: pstats`` uses the deterministic ``cProfile`` profiler and
+  returns a ``.pstats`` file for ``pstats``/snakeviz.
+- ``X-Profile: collapsed`` samples the event loop thread's stack every
+  ``PROFILING_SAMPLE_INTERVAL_MS`` and returns collapsed stacks
+  (``frame;frame;frame count`` per line) for flamegraph tools.
+
+Both profilers observe the whole event loop thread, so work of other
+requests running concurrently in the same worker appears in the profile.
+One request per worker is profiled at a time.
+"""
+
+import cProfile
+import marshal
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+PROFILE_HEADER = "x-profile"
+
+
+class RequestProfiler(ABC):
+    """Profiler for the duration of one request."""
+
+    media_type = "application/octet-stream"
+    extension = "prof"
+
+    @abstractmethod
+    def start(self) -> None:
+        """Start profiling."""
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop profiling."""
+
+    @abstractmethod
+    def artifact(self) -> bytes:
+        """Get the profile in the downloadable format."""
+
+
+class DeterministicProfiler(RequestProfiler):
+    """``cProfile`` profile, saved in the format ``pstats.Stats`` loads."""
+
+    extension = "pstats"
+
+    def __init__(self):
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+
+    def artifact(self) -> bytes:
+        self._profile.create_stats()
+        return marshal.dumps(self._profile.stats)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler(RequestProfiler):
+    """Samples one thread's stack from a background thread.
+
+    Attributes:
+        interval: Seconds between samples
+    """
+
+    media_type = "text/plain; charset=utf-8"
+    extension = "folded"
+
+    def __init__(self, interval: float, thread_id: Optional[int] = None):
+        """Initialize the profiler.
+
+        Args:
+            interval: Seconds between samples
+            thread_id: Thread to sample (defaults to the calling thread)
+        """
+        self.interval = interval
+        self._thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self._stacks: Counter = Counter()
+        self._stopped = threading.Event()
+        self._sampler = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._sampler.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack: List[str] = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self._stacks[";".join(reversed(stack))] += 1
+
+    def artifact(self) -> bytes:
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self._stacks.most_common()
+        ).encode()
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests that ask for it.
+
+    The ``X-Profile`` header is honoured only when ``authorize`` accepts the
+    request's ``Authorization`` header; otherwise, or while another request
+    is being profiled (``X-Profile-Skipped: busy``), the request is served
+    normally. The profiled response's status is kept in
+    ``X-Profiled-Status`` and its body is discarded.
+
+    Example:
+        >>> app.add_middleware(ProfilingMiddleware, authorize=is_admin_authorization)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        authorize: Callable[[str], Awaitable[bool]],
+        sample_interval: float = 0.001,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            authorize: Returns whether an ``Authorization`` header value
+                may request profiling
+            sample_interval: Seconds between samples of the sampling profiler
+        """
+        self.app = app
+        self.authorize = authorize
+        self.profilers: Dict[str, Callable[[], RequestProfiler]] = {
+            "pstats": DeterministicProfiler,
+            "collapsed": lambda: SamplingProfiler(sample_interval),
+        }
+        self._busy = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        mode = headers.get(PROFILE_HEADER)
+        if mode is None or mode.lower() not in self.profilers:
+            await self.app(scope, receive, send)
+            return
+        if not await self.authorize(headers.get("authorization", "")):
+            await self.app(scope, receive, send)
+            return
+        if self._busy:
+            await self.app(scope, receive, _with_header(send, b"x-profile-skipped", b"busy"))
+            return
+
+        self._busy = True
+        try:
+            await self._profile(self.profilers[mode.lower()](), scope, receive, send)
+        finally:
+            self._busy = False
+
+    async def _profile(self, profiler: RequestProfiler, scope: Scope, receive: Receive, send: Send) -> None:
+        status = 500
+
+        async def discard_body(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        start = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard_body)
+        finally:
+            profiler.stop()
+        elapsed = time.perf_counter() - start
+
+        body = profiler.artifact()
+        filename = f"profile-{time.strftime('%Y%m%d-%H%M%S')}.{profiler.extension}"
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", profiler.media_type.encode()),
+                (b"content-length", str(len(body)).encode()),
+                (b"content-disposition", f'attachment; filename="{filename}"'.encode()),
+                (b"x-profiled-status", str(status).encode()),
+                (b"x-profiled-duration-ms", f"{elapsed * 1000:.1f}".encode()),
+                (b"cache-control", b"no-store"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def _with_header(send: Send, name: bytes, value: bytes) -> Send:
+    async def send_with_header(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            message["headers"] = list(message["headers"]) + [(name, value)]
+        await send(message)
+    return send_with_header
@@ -0,0 +1,214 @@
+"""Per-request metrics.
+
+This module provides an ASGI middleware that records request latency per
+route template and status, the number of requests in flight, and the time
+each request spent waiting on the database. Work done on behalf of a
+request (SQL statements, template rendering) is attributed to it through
+a ``RequestStats`` object kept in a context variable.
+
+The same statistics flag probable N+1 query patterns, and can be returned
+to the client in a ``Server-Timing`` header for browser developer tools.
+"""
+
+import logging
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import Counter, Gauge, Histogram
+
+
+logger = logging.getLogger(__name__)
+
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to serve HTTP requests, by route template and status",
+    ("method", "route", "status"),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served",
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds",
+    "Time HTTP requests spent executing SQL statements",
+    ("method", "route"),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "SQL statements executed per HTTP request",
+    ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+REPEATED_STATEMENTS = Counter(
+    "db_repeated_statements",
+    "Statements repeated within one request often enough to suggest an N+1 pattern",
+    ("method", "route"),
+)
+
+# Label for requests no route matched, so unknown paths cannot add series
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestStats:
+    """Work attributed to the request being served.
+
+    Attributes:
+        db_time: Seconds spent executing SQL statements
+        db_statements: Number of SQL statements executed
+        statement_counts: Executions per distinct SQL string
+        render_time: Seconds spent rendering code templates
+    """
+
+    __slots__ = ("db_time", "db_statements", "statement_counts", "render_time")
+
+    def __init__(self):
+        self.db_time = 0.0
+        self.db_statements = 0
+        self.statement_counts: Dict[str, int] = {}
+        self.render_time = 0.0
+
+    def server_timing(self, app_time: float) -> bytes:
+        """Format the stats as a ``Server-Timing`` header value.
+
+        Args:
+            app_time: Seconds from the start of the request to the response
+
+        Returns:
+            Header value, e.g. ``app;dur=12.4, db;dur=3.1;desc="4 queries", render;dur=0.2``
+        """
+        return (
+            f'app;dur={app_time * 1000:.1f}, '
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.db_statements} queries", '
+            f'render;dur={self.render_time * 1000:.1f}'
+        ).encode("latin-1")
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    """Get the stats of the request being served.
+
+    Returns:
+        The request's ``RequestStats``, or None outside a request
+        (startup tasks, scripts)
+    """
+    return _request_stats.get()
+
+
+def route_label(scope: Scope) -> str:
+    """Get the route template of a routed request, for use as a label.
+
+    Args:
+        scope: ASGI scope, after the router has run
+
+    Returns:
+        The matched path template, or ``unmatched``
+    """
+    route = scope.get("route")
+    if route is not None:
+        return route.path_format
+    if "endpoint" in scope:
+        # Plain Starlette routes (docs, OpenAPI schema) have fixed paths
+        return scope["path"]
+    return UNMATCHED_ROUTE
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware recording per-route request metrics.
+
+    The route label is the matched route's path template (e.g.
+    ``/api/v1/templates/{template_id}``), read from the scope after routing,
+    so path parameters never create new series. Histogram children are
+    bound once per (method, route, status) and reused.
+
+    A request that executes the same SQL string ``repeated_statement_threshold``
+    times or more (typically a query per row of an earlier result) is
+    logged as a probable N+1 pattern.
+
+    Example:
+        >>> app.add_middleware(RequestMetricsMiddleware, server_timing=settings.DEBUG)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = False,
+        repeated_statement_threshold: int = 5,
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            server_timing: Add a ``Server-Timing`` header to responses
+            repeated_statement_threshold: Executions of one statement within
+                a request that are flagged as a probable N+1 pattern
+        """
+        self.app = app
+        self.server_timing = server_timing
+        self.repeated_statement_threshold = repeated_statement_threshold
+        self._in_flight = REQUESTS_IN_FLIGHT.labels()
+        self._children: Dict[Tuple[str, str, int], Tuple[object, ...]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        stats = RequestStats()
+        server_timing = self.server_timing
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if server_timing:
+                    # Streamed bodies may run more queries after this point
+                    timing = stats.server_timing(time.perf_counter() - start)
+                    message["headers"] = list(message["headers"]) + [(b"server-timing", timing)]
+            await send(message)
+
+        token = _request_stats.set(stats)
+        self._in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start
+            self._in_flight.dec()
+            _request_stats.reset(token)
+
+            key = (scope["method"], route_label(scope), status)
+            children = self._children.get(key)
+            if children is None:
+                children = self._children[key] = self._bind(*key)
+            children[0].observe(duration)
+            children[1].observe(stats.db_time)
+            children[2].observe(stats.db_statements)
+
+            if stats.db_statements >= self.repeated_statement_threshold:
+                self._flag_repeated_statements(stats, key, children[3])
+
+    def _flag_repeated_statements(self, stats: RequestStats, key: Tuple, counter) -> None:
+        for statement, count in stats.statement_counts.items():
+            if count >= self.repeated_statement_threshold:
+                counter.inc()
+                logger.warning(
+                    "Probable N+1 query: statement executed %d times in %s %s: %s",
+                    count, key[0], key[1], statement,
+                )
+
+    @staticmethod
+    def _bind(method: str, route: str, status: int) -> Tuple[object, ...]:
+        return (
+            REQUEST_DURATION.labels(method, route, str(status)),
+            REQUEST_DB_TIME.labels(method, route),
+            REQUEST_DB_STATEMENTS.labels(method, route),
+            REPEATED_STATEMENTS.labels(method, route),
+        )
@@ -1,21 +1,75 @@
 """Security utilities for password hashing and JWT token management.
 
 This module provides functions for secure password hashing using bcrypt
-and JWT token creation/verification using python-jose.
+and JWT token creation/verification using python-jose. Verified tokens are
+kept in a bounded in-process cache until they expire, so repeated requests
+carrying the same bearer token skip signature verification and decoding.
+
+Async code should use ``hash_password_async`` / ``verify_password_async``,
+which run bcrypt on a dedicated bounded thread pool instead of blocking the
+event loop, and shed load once too many hash jobs are waiting.
 """
 
+import asyncio
+import hashlib
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional, TypeVar
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.cache import TTLCache
+from app.core.exceptions import ServiceUnavailableException
+from app.core.metrics import Counter, Gauge, Histogram, track_cache
 
 
 # Password hashing context using bcrypt
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Decoded claims of verified tokens, keyed by the token's SHA-256 digest and
+# kept until the token's "exp" time
+token_cache: TTLCache[bytes, Dict[str, any]] = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=0,
+)
+track_cache("token", token_cache)
+
+# Dedicated pool for bcrypt, so hashing never runs on the event loop
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+# Hash jobs queued or running; only touched from the event loop thread
+_hash_jobs = 0
+
+_HASH_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5, 5.0)
+HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time password hash jobs wait for a hashing thread",
+    ("operation",),
+    buckets=_HASH_BUCKETS,
+)
+HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent computing password hashes",
+    ("operation",),
+    buckets=_HASH_BUCKETS,
+)
+HASH_REJECTED = Counter(
+    "password_hash_rejected",
+    "Password hash jobs rejected because the queue was full",
+)
+HASH_JOBS = Gauge(
+    "password_hash_jobs",
+    "Password hash jobs queued or running",
+)
+
+R = TypeVar("R")
+
 
 def hash_password(password: str) -> str:
     """Hash a plain-text password using bcrypt.
@@ -54,6 +108,83 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def _hash_job_done() -> None:
+    global _hash_jobs
+    _hash_jobs -= 1
+    HASH_JOBS.set(_hash_jobs)
+
+
+async def _run_hash_job(operation: str, func: Callable[..., R], *args) -> R:
+    """Run a bcrypt call on the hashing pool, shedding load when saturated.
+
+    Args:
+        operation: Metric label for the job ("hash" or "verify")
+        func: Blocking function to run
+        *args: Arguments for ``func``
+
+    Returns:
+        The function's result
+
+    Raises:
+        ServiceUnavailableException: If the hash queue is full
+    """
+    global _hash_jobs
+
+    if _hash_jobs >= settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_LIMIT:
+        HASH_REJECTED.inc()
+        raise ServiceUnavailableException("Authentication is busy, please retry shortly")
+
+    def job():
+        started = time.perf_counter()
+        result = func(*args)
+        return result, started, time.perf_counter()
+
+    _hash_jobs += 1
+    HASH_JOBS.set(_hash_jobs)
+    submitted = time.perf_counter()
+    future = _hash_executor.submit(job)
+    # Count the job until the pool is done with it: a cancelled await (client
+    # gone) leaves the bcrypt call running, and it still occupies a worker
+    loop = asyncio.get_running_loop()
+    future.add_done_callback(lambda _: loop.call_soon_threadsafe(_hash_job_done))
+    result, started, finished = await asyncio.wrap_future(future)
+
+    HASH_QUEUE_WAIT.labels(operation).observe(started - submitted)
+    HASH_DURATION.labels(operation).observe(finished - started)
+    return result
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the dedicated hashing pool.
+
+    Args:
+        password: Plain-text password to hash
+
+    Returns:
+        Hashed password string
+
+    Raises:
+        ServiceUnavailableException: If too many hash jobs are waiting
+    """
+    return await _run_hash_job("hash", hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the dedicated hashing pool.
+
+    Args:
+        plain_password: Plain-text password to verify
+        hashed_password: Hashed password to compare against
+
+    Returns:
+        True if password matches, False otherwise
+
+    Raises:
+        ServiceUnavailableException: If too many hash jobs are waiting
+    """
+    return await _run_hash_job("verify", verify_password, plain_password, hashed_password)
+
+
 def create_access_token(
     data: Dict[str, any],
     expires_delta: Optional[timedelta] = None
@@ -83,6 +214,8 @@ def create_access_token(
         )
 
     to_encode.update({"exp": expire})
+    # Unique token id, used to revoke individual tokens
+    to_encode.setdefault("jti", uuid.uuid4().hex)
 
     encoded_jwt = jwt.encode(
         to_encode,
@@ -93,6 +226,24 @@ def create_access_token(
     return encoded_jwt
 
 
+def create_refresh_token(data: Dict[str, any]) -> str:
+    """Create a JWT refresh token.
+
+    Refresh tokens carry ``"type": "refresh"`` so they are only accepted by
+    the refresh endpoint, never as access tokens.
+
+    Args:
+        data: Dictionary of claims to encode in the token (e.g., {"sub": user_id})
+
+    Returns:
+        Encoded JWT token string valid for REFRESH_TOKEN_EXPIRE_DAYS
+    """
+    return create_access_token(
+        {**data, "type": "refresh"},
+        expires_delta=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    )
+
+
 def verify_token(token: str) -> Dict[str, any]:
     """Verify and decode a JWT token.
 
@@ -111,12 +262,23 @@ def verify_token(token: str) -> Dict[str, any]:
         >>> print(payload["sub"])
         user@example.com
     """
+    key = hashlib.sha256(token.encode()).digest()
+    cached = token_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        return payload
     except JWTError as e:
         raise JWTError(f"Token verification failed: {str(e)}")
+
+    # Only tokens with an expiry are cached, and never past it
+    expires_in = payload.get("exp", 0) - time.time()
+    if expires_in > 0:
+        token_cache.set(key, payload, ttl=expires_in)
+
+    return dict(payload)
@@ -0,0 +1,341 @@
+"""Lightweight request tracing.
+
+This module provides spans around the layers of a request (auth,
+repositories, rendering, commit) behind a subset of the OpenTelemetry
+tracing API: ``tracer.start_as_current_span(name, attributes=...)`` and
+spans with ``set_attribute``, ``update_name``, ``record_exception`` and
+``is_recording``. The tracer is chosen by ``TRACING_EXPORTER``:
+
+- ``none`` (default): a no-op tracer; instrumented code runs unwrapped.
+- ``console`` / ``file``: built-in spans written as JSON lines to stderr
+  or ``TRACING_FILE``, with head sampling at ``TRACING_SAMPLE_RATE``.
+- ``opentelemetry``: the tracer of the ``opentelemetry`` package, whose
+  SDK configuration (exporter, sampler) is left to the deployment.
+"""
+
+import functools
+import inspect
+import random
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, TextIO, TypeVar
+
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.request_metrics import route_label
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """A timed operation within a trace.
+
+    Attributes:
+        name: Operation name
+        trace_id: 128-bit trace id, hex encoded
+        span_id: 64-bit span id, hex encoded
+        parent_id: Span id of the parent span, if any
+        attributes: Key/value annotations
+        status: ``ok`` or ``error``
+    """
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attributes", "status", "start", "duration")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Optional[Mapping[str, Any]]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = dict(attributes) if attributes else {}
+        self.status = "ok"
+        self.start = time.time()
+        self.duration = 0.0
+
+    def is_recording(self) -> bool:
+        """Whether attributes set on this span are kept."""
+        return True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def update_name(self, name: str) -> None:
+        self.name = name
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.status = "error"
+        self.attributes["exception.type"] = type(exception).__name__
+        self.attributes["exception.message"] = str(exception)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the span as a JSON-serializable dict."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NonRecordingSpan:
+    """Span of an unsampled trace; all operations are no-ops."""
+
+    __slots__ = ()
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def update_name(self, name: str) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+
+NON_RECORDING_SPAN = _NonRecordingSpan()
+
+
+class SpanExporter(ABC):
+    """Receives finished spans of sampled traces."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Export one finished span."""
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Writes each finished span as one JSON line to a text stream."""
+
+    def __init__(self, stream: TextIO):
+        """Initialize the exporter.
+
+        Args:
+            stream: Destination stream, e.g. ``sys.stderr`` or an open file
+        """
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = orjson.dumps(span.to_dict(), default=str).decode() + "\n"
+        with self._lock:
+            self._stream.write(line)
+            self._stream.flush()
+
+
+class _NoOpContext:
+    __slots__ = ()
+
+    def __enter__(self) -> _NonRecordingSpan:
+        return NON_RECORDING_SPAN
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NOOP_CONTEXT = _NoOpContext()
+
+
+class NoOpTracer:
+    """Tracer that records nothing, at the cost of one attribute lookup."""
+
+    def start_as_current_span(self, name: str, attributes: Optional[Mapping[str, Any]] = None) -> _NoOpContext:
+        return _NOOP_CONTEXT
+
+
+# Span that new spans in this context become children of
+_current_span: ContextVar[Any] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Tracer producing built-in spans with head-based sampling.
+
+    The sampling decision is made once per trace, when a span without a
+    parent starts; children of an unsampled span are non-recording too, so
+    unsampled requests cost a context-variable lookup per span.
+
+    Example:
+        >>> tracer = Tracer(JsonLinesSpanExporter(sys.stderr), sample_rate=0.1)
+        >>> with tracer.start_as_current_span("render", attributes={"bytes": 512}) as span:
+        ...     span.set_attribute("variables", 3)
+    """
+
+    def __init__(self, exporter: SpanExporter, sample_rate: float = 1.0):
+        """Initialize the tracer.
+
+        Args:
+            exporter: Destination of finished spans
+            sample_rate: Fraction of traces recorded (0-1)
+        """
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    @contextmanager
+    def start_as_current_span(
+        self,
+        name: str,
+        attributes: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """Start a span and make it current for the duration of the block.
+
+        An exception leaving the block is recorded on the span and re-raised.
+
+        Args:
+            name: Operation name
+            attributes: Initial span attributes
+
+        Yields:
+            The span, or a non-recording span if the trace is not sampled
+        """
+        parent = _current_span.get()
+        if parent is None:
+            if random.random() >= self.sample_rate:
+                token = _current_span.set(NON_RECORDING_SPAN)
+                try:
+                    yield NON_RECORDING_SPAN
+                finally:
+                    _current_span.reset(token)
+                return
+            span = Span(name, f"{random.getrandbits(128):032x}", None, attributes)
+        elif parent is NON_RECORDING_SPAN:
+            yield NON_RECORDING_SPAN
+            return
+        else:
+            span = Span(name, parent.trace_id, parent.span_id, attributes)
+
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            span.duration = time.perf_counter() - start
+            _current_span.reset(token)
+            self.exporter.export(span)
+
+
+def _create_tracer():
+    exporter = settings.TRACING_EXPORTER
+    if exporter == "console":
+        return Tracer(JsonLinesSpanExporter(sys.stderr), settings.TRACING_SAMPLE_RATE)
+    if exporter == "file":
+        stream = open(settings.TRACING_FILE, "a", encoding="utf-8")
+        return Tracer(JsonLinesSpanExporter(stream), settings.TRACING_SAMPLE_RATE)
+    if exporter == "opentelemetry":
+        from opentelemetry import trace  # optional dependency, only needed here
+
+        return trace.get_tracer("codegen-manager")
+    return NoOpTracer()
+
+
+# Process-wide tracer configured from settings
+tracer = _create_tracer()
+
+# Whether spans are recorded at all; instrumentation is skipped when not
+tracing_enabled = not isinstance(tracer, NoOpTracer)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorate a coroutine function to run inside a span.
+
+    With tracing disabled the function is returned unchanged, so the
+    decorator costs nothing.
+
+    Args:
+        name: Span name
+
+    Returns:
+        Decorator for async functions
+
+    Example:
+        >>> @traced("CodeGenService.generate_code")
+        ... async def generate_code(self, template_content, variables):
+        ...     ...
+    """
+    def decorator(func: F) -> F:
+        if not tracing_enabled:
+            return func
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(name):
+                return await func(*args, **kwargs)
+        wrapper.__traced__ = True
+        return wrapper
+    return decorator
+
+
+def trace_methods(cls: type) -> None:
+    """Wrap every public coroutine method of a class (inherited ones too) in a span.
+
+    Spans are named ``<class name>.<method>``. Does nothing when tracing
+    is disabled.
+
+    Args:
+        cls: Class whose methods are instrumented in place
+    """
+    if not tracing_enabled:
+        return
+    for attr in dir(cls):
+        if attr.startswith("_"):
+            continue
+        method = getattr(cls, attr)
+        if getattr(method, "__traced__", False):
+            method = method.__wrapped__
+        if inspect.iscoroutinefunction(method):
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(method))
+
+
+class TracingMiddleware:
+    """ASGI middleware opening the root span of each HTTP request.
+
+    The span is renamed to ``<method> <route template>`` once routing is
+    done, and carries the response status.
+
+    Example:
+        >>> if tracing_enabled:
+        ...     app.add_middleware(TracingMiddleware)
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        with tracer.start_as_current_span(
+            f"{method} {scope['path']}", attributes={"http.method": method}
+        ) as span:
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = route_label(scope)
+                span.set_attribute("http.route", route)
+                span.update_name(f"{method} {route}")
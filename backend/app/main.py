@@ -6,13 +6,29 @@ with middleware, exception handlers, and API routers.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
 from app.core.exceptions import handlers
+from app.core.loop_monitor import EventLoopMonitor
+from app.core.memory import PeakAllocationMiddleware
+from app.core.metrics import REGISTRY
+from app.core.profiling import ProfilingMiddleware
+from app.core.request_metrics import RequestMetricsMiddleware
+from app.core.tracing import TracingMiddleware, tracing_enabled
+from app.api.dependencies import is_admin_authorization
 from app.api.v1.router import api_router
 
 
+# Endpoints whose peak allocations are sampled while tracemalloc runs
+PEAK_ALLOCATION_ROUTES = {
+    ("POST", "/api/v1/projects/{project_id}/generate"),
+    ("GET", "/api/v1/templates"),
+    ("GET", "/api/v1/projects"),
+}
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -26,6 +42,8 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         debug=settings.DEBUG,
+        # orjson renders the serialized response models much faster than json
+        default_response_class=ORJSONResponse,
     )
 
     # Configure CORS
@@ -37,6 +55,43 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Sample peak allocations of rendering and listing (only while tracing)
+    app.add_middleware(
+        PeakAllocationMiddleware,
+        routes=PEAK_ALLOCATION_ROUTES,
+        sample_rate=settings.MEMORY_PEAK_SAMPLE_RATE,
+    )
+
+    # Profile admin requests that send an X-Profile header
+    if settings.PROFILING_ENABLED:
+        app.add_middleware(
+            ProfilingMiddleware,
+            authorize=is_admin_authorization,
+            sample_interval=settings.PROFILING_SAMPLE_INTERVAL_MS / 1000,
+        )
+
+    # Compress large text responses. Added after the body-producing middleware
+    # so it sees final bodies; only tracing and request metrics wrap it
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+    )
+
+    # Open a root span per request when tracing is configured
+    if tracing_enabled:
+        app.add_middleware(TracingMiddleware)
+
+    # Record per-route latency and SQL usage (outermost, so timings include
+    # every layer); Server-Timing headers only in debug mode
+    app.add_middleware(
+        RequestMetricsMiddleware,
+        server_timing=settings.DEBUG,
+        repeated_statement_threshold=settings.DB_REPEATED_STATEMENT_THRESHOLD,
+    )
+
     # Add exception handlers
     for exc_class, handler in handlers.items():
         app.add_exception_handler(exc_class, handler)
@@ -71,18 +126,35 @@ def create_app() -> FastAPI:
             }
         }
 
+    if settings.METRICS_ENABLED:
+        @app.get("/metrics", tags=["Health"], include_in_schema=False)
+        async def metrics():
+            """Prometheus metrics of this worker process."""
+            return PlainTextResponse(
+                REGISTRY.render(),
+                media_type="text/plain; version=0.0.4; charset=utf-8",
+            )
+
     return app
 
 
 # Create application instance
 app = create_app()
 
+# Reports event loop stalls caused by blocking code in handlers
+loop_monitor = EventLoopMonitor(
+    interval=settings.LOOP_MONITOR_INTERVAL_MS / 1000,
+    threshold=settings.LOOP_LAG_THRESHOLD_MS / 1000,
+)
+
 
 # Startup event
 @app.on_event("startup")
 async def startup_event():
     """Execute on application startup."""
     print(f"Starting {settings.APP_NAME} in {settings.ENVIRONMENT} mode")
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor.start()
 
 
 # Shutdown event
@@ -90,3 +162,4 @@ async def startup_event():
 async def shutdown_event():
     """Execute on application shutdown."""
     print(f"Shutting down {settings.APP_NAME}")
+    await loop_monitor.stop()
@@ -2,14 +2,17 @@
 
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
 from sqlalchemy import String, Text, DateTime, ForeignKey, JSON
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
 
+if TYPE_CHECKING:
+    from app.models.template import Template
+
 
 class Project(Base):
     """Project model for code generation projects."""
@@ -53,5 +56,9 @@ class Project(Base):
         nullable=True,
     )
 
+    # Never lazy-loaded: async sessions cannot load on attribute access, so
+    # queries must join or eager-load the template explicitly
+    template: Mapped[Optional["Template"]] = relationship(lazy="raise")
+
     def __repr__(self) -> str:
         return f"<Project(id={self.id}, name={self.name}, status={self.status})>"
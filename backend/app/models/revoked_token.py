@@ -0,0 +1,58 @@
+"""Revoked token database model.
+
+This module defines the RevokedToken model, the persistent store of JWT ids
+(``jti``) that were revoked before their natural expiry (logout, refresh
+token rotation).
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import String, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class RevokedToken(Base):
+    """Revoked JWT, identified by its ``jti`` claim.
+
+    Rows only need to be kept until ``expires_at``; after that the token is
+    rejected by signature verification anyway.
+
+    Attributes:
+        jti: Unique token identifier from the token's claims
+        user_id: ID of the user the token was issued to
+        expires_at: Expiry time of the revoked token
+        revoked_at: Timestamp when the token was revoked
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    jti: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the RevokedToken."""
+        return f"<RevokedToken(jti={self.jti}, user_id={self.user_id})>"
@@ -2,12 +2,20 @@
 
 This module provides a generic async repository base class that can be extended
 for specific models, implementing common CRUD operations using SQLAlchemy async sessions.
+
+Bulk variants (``create_many``, ``update_many``, ``delete_many`` and the
+COPY-based ``copy_many``) write many rows in a handful of round trips
+instead of one flush per object.
 """
 
-from typing import Generic, List, Optional, Type, TypeVar
-from sqlalchemy import select
+import itertools
+from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, Type, TypeVar
+from sqlalchemy import Row, any_, bindparam, delete, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tracing import trace_methods
+
 
 # Generic type variable for SQLAlchemy models
 T = TypeVar("T")
@@ -36,6 +44,11 @@ class BaseRepository(Generic[T]):
         ...     user = await user_repo.get(user_id)
     """
 
+    def __init_subclass__(cls, **kwargs):
+        # Each repository method gets a span when tracing is enabled
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls)
+
     def __init__(self, model: Type[T], session: AsyncSession):
         """Initialize the repository.
 
@@ -62,6 +75,32 @@ class BaseRepository(Generic[T]):
         """
         return await self.session.get(self.model, id)
 
+    async def get_validator(self, id: any) -> Optional[Row]:
+        """Get only the cache-validator columns of a record.
+
+        Selects ``id``, ``created_at`` and ``updated_at`` without loading the
+        rest of the row, so conditional requests can be answered without
+        reading large text columns.
+
+        Args:
+            id: The primary key value to search for
+
+        Returns:
+            Row with id, created_at and updated_at if found, None otherwise
+
+        Example:
+            >>> row = await template_repo.get_validator(template_id)
+            >>> if row:
+            ...     print(row.updated_at or row.created_at)
+        """
+        stmt = select(
+            self.model.id,
+            self.model.created_at,
+            self.model.updated_at,
+        ).where(self.model.id == id)
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
         """Get all records with pagination.
 
@@ -96,7 +135,6 @@ class BaseRepository(Generic[T]):
         """
         self.session.add(obj)
         await self.session.flush()
-        await self.session.refresh(obj)
         return obj
 
     async def update(self, obj: T) -> T:
@@ -116,9 +154,71 @@ class BaseRepository(Generic[T]):
             >>> updated_user = await user_repo.update(user)
         """
         await self.session.flush()
-        await self.session.refresh(obj)
         return obj
 
+    async def update_owned(
+        self,
+        id: any,
+        user_id: any,
+        values: Dict[str, Any]
+    ) -> Optional[T]:
+        """Update a record owned by a user in one ``UPDATE ... RETURNING``.
+
+        The ownership check is part of the WHERE clause, so the record is
+        neither loaded beforehand nor refreshed afterwards. The model must
+        have a ``user_id`` column. If the record was already loaded in this
+        session, only the columns in ``values`` are updated on that instance.
+
+        Args:
+            id: The primary key value of the record to update
+            user_id: ID of the user who must own the record
+            values: Column values to set; must not be empty
+
+        Returns:
+            The updated model instance, or None if no record with this ID
+            is owned by the user
+
+        Example:
+            >>> template = await template_repo.update_owned(
+            ...     template_id, user.id, {"is_public": True}
+            ... )
+            >>> if template is None:
+            ...     print("Not found or not yours")
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id, self.model.user_id == user_id)
+            .values(**values)
+            .returning(self.model)
+        )
+        result = await self.session.scalars(stmt)
+        return result.one_or_none()
+
+    async def delete_owned(self, id: any, user_id: any) -> bool:
+        """Delete a record owned by a user in one ``DELETE ... RETURNING``.
+
+        The model must have a ``user_id`` column.
+
+        Args:
+            id: The primary key value of the record to delete
+            user_id: ID of the user who must own the record
+
+        Returns:
+            True if the record was deleted, False if no record with this ID
+            is owned by the user
+
+        Example:
+            >>> if not await template_repo.delete_owned(template_id, user.id):
+            ...     print("Not found or not yours")
+        """
+        stmt = (
+            delete(self.model)
+            .where(self.model.id == id, self.model.user_id == user_id)
+            .returning(self.model.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
     async def delete(self, id: any) -> bool:
         """Delete a record by ID.
 
@@ -133,9 +233,138 @@ class BaseRepository(Generic[T]):
             >>> if deleted:
             ...     print("User deleted successfully")
         """
-        obj = await self.get(id)
-        if obj:
-            await self.session.delete(obj)
-            await self.session.flush()
-            return True
-        return False
+        stmt = delete(self.model).where(self.model.id == id).returning(self.model.id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def create_many(self, values: Sequence[Dict[str, Any]]) -> List[T]:
+        """Create many records with multi-row ``INSERT ... RETURNING``.
+
+        Rows are sent as batched multi-row VALUES statements (SQLAlchemy's
+        "insertmanyvalues"), and the created instances come back from
+        RETURNING without a refresh per row.
+
+        Args:
+            values: Column values of each new record
+
+        Returns:
+            The created model instances, in input order
+
+        Example:
+            >>> templates = await template_repo.create_many([
+            ...     {"name": "CRUD", "content": "...", "user_id": user_id},
+            ...     {"name": "Model", "content": "...", "user_id": user_id},
+            ... ])
+        """
+        if not values:
+            return []
+        result = await self.session.scalars(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True),
+            list(values),
+        )
+        return list(result.all())
+
+    async def update_many(self, values: Sequence[Dict[str, Any]]) -> None:
+        """Update many records by primary key with one executemany ``UPDATE``.
+
+        Each dict must contain ``id`` plus the columns to change; rows that
+        no longer exist are skipped. Instances already loaded in the session
+        are not refreshed.
+
+        Args:
+            values: ``id`` and changed column values of each record
+
+        Example:
+            >>> await template_repo.update_many([
+            ...     {"id": first_id, "is_public": True},
+            ...     {"id": second_id, "is_public": True},
+            ... ])
+        """
+        if not values:
+            return
+        await self.session.execute(update(self.model), list(values))
+
+    async def delete_many(self, ids: Sequence[Any]) -> int:
+        """Delete many records with one ``DELETE ... WHERE id = ANY(:ids)``.
+
+        The ids are sent as a single array parameter, so the statement text
+        (and its prepared statement) is the same whatever the number of ids.
+
+        Args:
+            ids: Primary key values of the records to delete
+
+        Returns:
+            Number of records deleted
+
+        Example:
+            >>> deleted = await template_repo.delete_many([first_id, second_id])
+        """
+        if not ids:
+            return 0
+        id_column = self.model.id
+        stmt = delete(self.model).where(
+            id_column == any_(bindparam("ids", type_=ARRAY(id_column.type)))
+        )
+        result = await self.session.execute(stmt, {"ids": list(ids)})
+        return result.rowcount
+
+    async def copy_many(self, values: Iterable[Dict[str, Any]]) -> int:
+        """Load many records with PostgreSQL ``COPY``; the fastest bulk path.
+
+        Intended for very large loads where the created rows are not needed
+        back. Python-side column defaults (such as generated ids) are filled
+        in here, server defaults are applied by PostgreSQL, and values are
+        converted with the column types' bind processors. All dicts must have
+        the same keys. No instances are added to the session.
+
+        Args:
+            values: Column values of each new record
+
+        Returns:
+            Number of records copied
+
+        Example:
+            >>> copied = await template_repo.copy_many(
+            ...     {"name": f"T{i}", "content": "...", "user_id": user_id}
+            ...     for i in range(100_000)
+            ... )
+        """
+        rows = iter(values)
+        first = next(rows, None)
+        if first is None:
+            return 0
+
+        table = self.model.__table__
+        dialect = self.session.get_bind().dialect
+        columns = [table.c[key] for key in first]
+        # Python-side defaults are not applied by COPY, so fill them in here
+        defaults = [
+            column for column in table.columns
+            if column.key not in first
+            and column.default is not None
+            and (column.default.is_scalar or column.default.is_callable)
+        ]
+        processors = [column.type.bind_processor(dialect) for column in columns + defaults]
+
+        def records():
+            for row in itertools.chain((first,), rows):
+                record = [row[column.key] for column in columns]
+                record += [
+                    column.default.arg(None) if column.default.is_callable else column.default.arg
+                    for column in defaults
+                ]
+                yield tuple(
+                    process(value) if process is not None and value is not None else value
+                    for process, value in zip(processors, record)
+                )
+
+        await self.session.flush()
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        status = await raw.driver_connection.copy_records_to_table(
+            table.name,
+            records=records(),
+            columns=[column.name for column in columns + defaults],
+            schema_name=table.schema,
+        )
+        return int(status.rsplit(" ", 1)[-1])
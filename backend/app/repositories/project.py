@@ -1,11 +1,16 @@
-"""Project repository for database operations."""
+"""Project repository for database operations.
+
+List queries are built with ``lambda_stmt`` so the statement is constructed
+and compiled once per call site rather than on every call.
+"""
 
 import uuid
-from typing import List
-from sqlalchemy import select
+from typing import List, Optional
+from sqlalchemy import Row, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.project import Project
+from app.models.template import Template
 from app.repositories.base import BaseRepository
 
 
@@ -15,6 +20,30 @@ class ProjectRepository(BaseRepository[Project]):
     def __init__(self, session: AsyncSession):
         super().__init__(Project, session)
 
+    async def get_for_generation(self, project_id: uuid.UUID) -> Optional[Row]:
+        """Get what code generation needs for a project in one query.
+
+        Joins the project to its template and selects only the ownership
+        columns and the template content, without loading either row.
+
+        Returns:
+            Row with ``id``, ``user_id``, ``template_id`` and
+            ``template_content`` (None if the template is gone), or None if
+            the project does not exist
+        """
+        stmt = lambda_stmt(
+            lambda: select(
+                Project.id,
+                Project.user_id,
+                Project.template_id,
+                Template.content.label("template_content"),
+            )
+            .outerjoin(Project.template)
+            .where(Project.id == project_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
+
     async def get_by_user(
         self,
         user_id: uuid.UUID,
@@ -22,8 +51,8 @@ class ProjectRepository(BaseRepository[Project]):
         limit: int = 100
     ) -> List[Project]:
         """Get projects created by a user."""
-        stmt = (
-            select(Project)
+        stmt = lambda_stmt(
+            lambda: select(Project)
             .where(Project.user_id == user_id)
             .offset(skip)
             .limit(limit)
@@ -39,8 +68,8 @@ class ProjectRepository(BaseRepository[Project]):
         limit: int = 100
     ) -> List[Project]:
         """Get projects using a specific template."""
-        stmt = (
-            select(Project)
+        stmt = lambda_stmt(
+            lambda: select(Project)
             .where(Project.template_id == template_id)
             .offset(skip)
             .limit(limit)
@@ -55,8 +84,8 @@ class ProjectRepository(BaseRepository[Project]):
         limit: int = 10
     ) -> List[Project]:
         """Get recent projects for a user."""
-        stmt = (
-            select(Project)
+        stmt = lambda_stmt(
+            lambda: select(Project)
             .where(Project.user_id == user_id)
             .order_by(Project.updated_at.desc())
             .limit(limit)
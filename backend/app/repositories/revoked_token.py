@@ -0,0 +1,74 @@
+"""Revoked token repository for database operations."""
+
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import Row, delete, select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.revoked_token import RevokedToken
+from app.repositories.base import BaseRepository
+
+
+class RevokedTokenRepository(BaseRepository[RevokedToken]):
+    """Repository for RevokedToken model operations."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(RevokedToken, session)
+
+    async def revoke(
+        self,
+        jti: str,
+        user_id: uuid.UUID,
+        expires_at: datetime
+    ) -> bool:
+        """Record a token as revoked; revoking twice is a no-op.
+
+        The insert decides atomically, so of two concurrent revocations of
+        the same token exactly one returns True.
+
+        Returns:
+            True if this call revoked the token, False if it already was
+        """
+        stmt = (
+            insert(RevokedToken)
+            .values(jti=jti, user_id=user_id, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+            .returning(RevokedToken.jti)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def delete_expired(self) -> int:
+        """Delete revocations of tokens that have expired anyway.
+
+        Returns:
+            Number of rows deleted
+        """
+        stmt = delete(RevokedToken).where(RevokedToken.expires_at <= func.now())
+        result = await self.session.execute(stmt)
+        return result.rowcount
+
+    async def is_revoked(self, jti: str) -> bool:
+        """Check whether a token id has been revoked."""
+        stmt = select(RevokedToken.jti).where(RevokedToken.jti == jti)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def get_unexpired_since(
+        self,
+        since: Optional[datetime] = None
+    ) -> List[Row]:
+        """Get ``(jti, revoked_at)`` rows of unexpired revocations.
+
+        Optionally restricted to revocations made at or after ``since``.
+        """
+        stmt = select(RevokedToken.jti, RevokedToken.revoked_at).where(
+            RevokedToken.expires_at > func.now()
+        )
+        if since is not None:
+            stmt = stmt.where(RevokedToken.revoked_at >= since)
+        result = await self.session.execute(stmt)
+        return list(result.all())
@@ -1,8 +1,13 @@
-"""Template repository for database operations."""
+"""Template repository for database operations.
+
+List queries are built with ``lambda_stmt`` so SQLAlchemy caches the
+constructed and compiled statement per call site; only the bound values
+change between calls.
+"""
 
 import uuid
-from typing import Optional, List
-from sqlalchemy import select, or_
+from typing import AsyncIterator, Optional, List
+from sqlalchemy import Row, lambda_stmt, select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.template import Template
@@ -22,8 +27,8 @@ class TemplateRepository(BaseRepository[Template]):
         limit: int = 100
     ) -> List[Template]:
         """Get templates created by a specific user."""
-        stmt = (
-            select(Template)
+        stmt = lambda_stmt(
+            lambda: select(Template)
             .where(Template.user_id == user_id)
             .offset(skip)
             .limit(limit)
@@ -38,8 +43,8 @@ class TemplateRepository(BaseRepository[Template]):
         limit: int = 100
     ) -> List[Template]:
         """Get all public templates."""
-        stmt = (
-            select(Template)
+        stmt = lambda_stmt(
+            lambda: select(Template)
             .where(Template.is_public == True)
             .offset(skip)
             .limit(limit)
@@ -55,8 +60,8 @@ class TemplateRepository(BaseRepository[Template]):
         limit: int = 100
     ) -> List[Template]:
         """Get templates by category."""
-        stmt = (
-            select(Template)
+        stmt = lambda_stmt(
+            lambda: select(Template)
             .where(Template.category == category)
             .where(Template.is_public == True)
             .offset(skip)
@@ -73,8 +78,8 @@ class TemplateRepository(BaseRepository[Template]):
         limit: int = 100
     ) -> List[Template]:
         """Get templates by programming language."""
-        stmt = (
-            select(Template)
+        stmt = lambda_stmt(
+            lambda: select(Template)
             .where(Template.language == language)
             .where(Template.is_public == True)
             .offset(skip)
@@ -92,8 +97,8 @@ class TemplateRepository(BaseRepository[Template]):
     ) -> List[Template]:
         """Search templates by name or description."""
         search_pattern = f"%{query}%"
-        stmt = (
-            select(Template)
+        stmt = lambda_stmt(
+            lambda: select(Template)
             .where(
                 or_(
                     Template.name.ilike(search_pattern),
@@ -107,3 +112,44 @@ class TemplateRepository(BaseRepository[Template]):
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def stream_for_export(
+        self,
+        user_id: Optional[uuid.UUID],
+        batch_size: int
+    ) -> AsyncIterator[List[Row]]:
+        """Stream exportable template columns through a server-side cursor.
+
+        Rows are plain tuples rather than ORM objects, so nothing accumulates
+        in the session. The session must be in a transaction (not on an
+        AUTOCOMMIT connection), as PostgreSQL cursors require one.
+
+        Args:
+            user_id: Export this user's templates, or public ones if None
+            batch_size: Rows fetched per cursor round trip
+
+        Yields:
+            Lists of up to ``batch_size`` rows, oldest templates first
+        """
+        stmt = select(
+            Template.id,
+            Template.name,
+            Template.description,
+            Template.content,
+            Template.category,
+            Template.language,
+            Template.variables,
+            Template.is_public,
+            Template.created_at,
+            Template.updated_at,
+        ).order_by(Template.created_at, Template.id)
+        if user_id is not None:
+            stmt = stmt.where(Template.user_id == user_id)
+        else:
+            stmt = stmt.where(Template.is_public == True)
+
+        result = await self.session.stream(
+            stmt.execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            yield partition
@@ -4,8 +4,9 @@ This module provides the UserRepository class for user-specific database operati
 extending the generic BaseRepository with user-specific queries.
 """
 
-from typing import Optional
-from sqlalchemy import select
+from typing import Any, Dict, Optional
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -49,6 +50,37 @@ class UserRepository(BaseRepository[User]):
             ... else:
             ...     print("User not found")
         """
-        stmt = select(User).where(User.email == email)
+        # Cached lambda statement: built and compiled once, re-bound per call
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def create_if_email_available(self, values: Dict[str, Any]) -> Optional[User]:
+        """Create a user unless the email is taken, in one statement.
+
+        Uses ``INSERT ... ON CONFLICT (email) DO NOTHING RETURNING``, so the
+        uniqueness check and the insert are a single atomic round trip.
+
+        Args:
+            values: Column values of the new user, including ``email``
+
+        Returns:
+            The created User instance, or None if the email already exists
+
+        Example:
+            >>> user = await user_repo.create_if_email_available({
+            ...     "email": "user@example.com",
+            ...     "hashed_password": hashed,
+            ...     "full_name": "John Doe",
+            ... })
+            >>> if user is None:
+            ...     print("Email already registered")
+        """
+        stmt = (
+            insert(User)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
+        result = await self.session.scalars(stmt)
+        return result.one_or_none()
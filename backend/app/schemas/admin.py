@@ -0,0 +1,45 @@
+"""Admin diagnostics Pydantic schemas."""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class AllocationSite(BaseModel):
+    """Memory held by one allocation site."""
+
+    location: str = Field(..., description="file:line of the allocating code")
+    size_bytes: int
+    count: int = Field(..., description="Live memory blocks allocated here")
+    size_diff_bytes: Optional[int] = Field(default=None, description="Growth since the baseline")
+    count_diff: Optional[int] = Field(default=None, description="Block count growth since the baseline")
+    traceback: Optional[List[str]] = Field(default=None, description="Allocating stack, innermost first")
+
+
+class RoutePeak(BaseModel):
+    """Peak allocations sampled for one route."""
+
+    route: str
+    samples: int
+    last_bytes: int
+    max_bytes: int
+
+
+class MemoryStatus(BaseModel):
+    """State of allocation tracing in this worker."""
+
+    tracing: bool
+    frames: int = Field(..., description="Stack frames stored per allocation")
+    traced_bytes: int
+    peak_bytes: int
+    tracemalloc_overhead_bytes: int
+    max_rss_bytes: Optional[int] = Field(default=None, description="Peak resident set size of the worker")
+    baseline_taken_at: Optional[datetime]
+    route_peaks: List[RoutePeak]
+
+
+class MemoryTraceStart(BaseModel):
+    """Schema for starting allocation tracing."""
+
+    frames: int = Field(default=1, ge=1, le=100, description="Stack frames stored per allocation")
@@ -76,6 +76,40 @@ class LoginRequest(BaseModel):
     )
 
 
+class RefreshRequest(BaseModel):
+    """Schema for exchanging a refresh token for new tokens.
+
+    Attributes:
+        refresh_token: JWT refresh token issued at login or by a previous refresh
+
+    Example:
+        >>> request = RefreshRequest(refresh_token="eyJhbGci...")
+    """
+
+    refresh_token: str = Field(
+        ...,
+        description="JWT refresh token",
+        examples=["eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."]
+    )
+
+
+class LogoutRequest(BaseModel):
+    """Schema for the optional logout request body.
+
+    Attributes:
+        refresh_token: Refresh token to revoke along with the access token
+
+    Example:
+        >>> request = LogoutRequest(refresh_token="eyJhbGci...")
+    """
+
+    refresh_token: Optional[str] = Field(
+        None,
+        description="Refresh token to revoke as well",
+        examples=["eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..."]
+    )
+
+
 class TokenResponse(BaseModel):
     """Schema for authentication token response.
 
@@ -164,3 +198,27 @@ class UserResponse(BaseModel):
             }
         }
     )
+
+
+class UserTokenResponse(BaseModel):
+    """Schema for a user together with a freshly issued access token.
+
+    Attributes:
+        user: The authenticated user
+        access_token: JWT access token for API authentication
+        token_type: Type of token (always "bearer")
+    """
+
+    user: UserResponse = Field(..., description="Authenticated user")
+    access_token: str = Field(..., description="JWT access token")
+    token_type: str = Field(default="bearer", description="Token type")
+
+
+class UserTokenPairResponse(UserTokenResponse):
+    """Schema for a user together with an access and refresh token pair.
+
+    Attributes:
+        refresh_token: JWT refresh token for obtaining new access tokens
+    """
+
+    refresh_token: str = Field(..., description="JWT refresh token")
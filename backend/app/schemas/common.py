@@ -0,0 +1,33 @@
+"""Common Pydantic schemas shared by all endpoints.
+
+This module defines the response envelope every endpoint returns. Typed
+envelopes let FastAPI document the exact payload and serialize responses
+with pydantic-core instead of walking untyped dicts.
+"""
+
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+
+DataT = TypeVar("DataT")
+
+
+class ApiResponse(BaseModel, Generic[DataT]):
+    """Standard response envelope.
+
+    Attributes:
+        success: Whether the request succeeded
+        message: Human-readable outcome
+        data: Endpoint-specific payload, if any
+
+    Example:
+        >>> ApiResponse[TemplateResponse](
+        ...     message="Template retrieved successfully",
+        ...     data=TemplateResponse.model_validate(template)
+        ... )
+    """
+
+    success: bool = Field(default=True, description="Whether the request succeeded")
+    message: str = Field(..., description="Human-readable outcome")
+    data: Optional[DataT] = Field(default=None, description="Response payload")
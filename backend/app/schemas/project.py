@@ -40,3 +40,11 @@ class ProjectResponse(BaseModel):
     updated_at: Optional[datetime]
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class GeneratedCodeResponse(BaseModel):
+    """Schema for a project's generated code."""
+
+    project_id: uuid.UUID
+    code: Optional[str]
+    status: str
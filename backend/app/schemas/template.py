@@ -117,3 +117,53 @@ class TemplateListResponse(BaseModel):
     page: int = Field(..., description="Current page number")
     size: int = Field(..., description="Page size")
     pages: int = Field(..., description="Total number of pages")
+
+
+class TemplateExportRecord(BaseModel):
+    """One line of a template NDJSON export.
+
+    Holds the portable fields of a template; the owner is not exported, and
+    ``id`` and timestamps are informational (import assigns new ones).
+    """
+
+    id: uuid.UUID = Field(..., description="Template ID in the source environment")
+    name: str = Field(..., description="Template name")
+    description: Optional[str] = Field(None, description="Template description")
+    content: str = Field(..., description="Template content")
+    category: str = Field(..., description="Template category")
+    language: str = Field(..., description="Programming language")
+    variables: Optional[Dict[str, Any]] = Field(None, description="Template variables")
+    is_public: bool = Field(..., description="Is publicly accessible")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TemplateImportError(BaseModel):
+    """A line of an NDJSON import that was rejected."""
+
+    line: int = Field(..., description="1-based line number in the upload")
+    error: str = Field(..., description="Why the line was rejected")
+
+
+class TemplateImportBatch(BaseModel):
+    """Outcome of one batch of an NDJSON import."""
+
+    batch: int = Field(..., description="1-based batch number")
+    first_line: int = Field(..., description="First line number in the batch")
+    last_line: int = Field(..., description="Last line number in the batch")
+    imported: int = Field(..., description="Templates inserted")
+    failed: int = Field(..., description="Lines rejected or not inserted")
+    errors: List[TemplateImportError] = Field(
+        default_factory=list,
+        description="Rejected lines, or a single entry if the whole batch failed"
+    )
+
+
+class TemplateImportReport(BaseModel):
+    """Summary of an NDJSON template import."""
+
+    imported: int = Field(..., description="Templates inserted in total")
+    failed: int = Field(..., description="Lines rejected or not inserted in total")
+    batches: List[TemplateImportBatch] = Field(..., description="Per-batch results")
@@ -5,17 +5,70 @@ login, token management, and profile updates.
 """
 
 import uuid
-from typing import Tuple
-from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
+from datetime import datetime, timezone
 
+from jose import JWTError
+from sqlalchemy import event, inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.models.user import User
 from app.repositories.user import UserRepository
+from app.repositories.revoked_token import RevokedTokenRepository
 from app.schemas.auth import RegisterRequest
-from app.core.security import hash_password, verify_password, create_access_token, verify_token
+from app.core.security import (
+    hash_password_async,
+    verify_password_async,
+    create_access_token,
+    create_refresh_token,
+    verify_token,
+)
 from app.core.exceptions import UnauthorizedException, ValidationException, NotFoundException
 from app.core.config import settings
+from app.core.cache import TTLCache
+from app.core.metrics import track_cache
+from app.services.revocation import revocation_list
+
+
+# Per-worker cache of authenticated users, keyed by user id. Entries are
+# detached snapshots that are merged into the request's session on a hit,
+# so the hot path of every authenticated request needs no query.
+user_cache: TTLCache[uuid.UUID, User] = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE if settings.USER_CACHE_TTL_SECONDS > 0 else 0,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+track_cache("user", user_cache)
+
+# Accounts allowed to use admin diagnostics, compared case-insensitively
+_admin_emails = frozenset(email.lower() for email in settings.ADMIN_EMAILS)
+
+
+def _detached_snapshot(user: User) -> User:
+    """Copy a loaded user into a detached instance safe to share across sessions.
+
+    Args:
+        user: A fully loaded User instance
+
+    Returns:
+        A detached User with the same column values and no pending changes
+    """
+    values = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    snapshot = User(**values)
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def is_admin(user: User) -> bool:
+    """Check whether a user may use admin diagnostics.
+
+    Args:
+        user: The user to check
+
+    Returns:
+        True if the user's email is listed in ``ADMIN_EMAILS``
+    """
+    return user.email.lower() in _admin_emails
 
 
 class AuthService:
@@ -49,34 +102,28 @@ class AuthService:
 
         Raises:
             ValidationException: If email already exists
+            ServiceUnavailableException: If the password hashing queue is full
 
         Example:
             >>> service = AuthService(session)
             >>> user, token = await service.register(request_data)
             >>> print(f"User {user.email} registered with token {token[:10]}...")
         """
-        # Check if user already exists
-        existing_user = await self.user_repository.get_by_email(data.email)
-        if existing_user:
+        # Insert unless the email is taken; the unique index decides atomically
+        created_user = await self.user_repository.create_if_email_available({
+            "email": data.email,
+            "hashed_password": await hash_password_async(data.password),
+            "full_name": data.full_name,
+            "is_active": True,
+        })
+        if created_user is None:
             raise ValidationException(
                 "Email already registered",
                 errors={"email": "This email is already in use"}
             )
 
-        # Create new user
-        user = User(
-            email=data.email,
-            hashed_password=hash_password(data.password),
-            full_name=data.full_name,
-            is_active=True
-        )
-
-        created_user = await self.user_repository.create(user)
-
         # Generate access token
-        access_token = create_access_token(
-            data={"sub": str(created_user.id)}
-        )
+        access_token = create_access_token(data={"sub": str(created_user.id)})
 
         return created_user, access_token
 
@@ -92,6 +139,7 @@ class AuthService:
 
         Raises:
             UnauthorizedException: If credentials are invalid
+            ServiceUnavailableException: If the password hashing queue is full
 
         Example:
             >>> user, access_token, refresh_token = await service.login(
@@ -103,7 +151,7 @@ class AuthService:
         user = await self.user_repository.get_by_email(email)
 
         # Verify user exists and password is correct
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await verify_password_async(password, user.hashed_password):
             raise UnauthorizedException("Invalid email or password")
 
         # Check if user is active
@@ -111,20 +159,131 @@ class AuthService:
             raise UnauthorizedException("Account is disabled")
 
         # Generate tokens
-        access_token = create_access_token(
-            data={"sub": str(user.id)}
-        )
+        access_token = create_access_token(data={"sub": str(user.id)})
 
-        refresh_token = create_access_token(
-            data={"sub": str(user.id)},
-            expires_delta=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-        )
+        refresh_token = create_refresh_token(data={"sub": str(user.id)})
 
         return user, access_token, refresh_token
 
+    async def refresh(self, refresh_token: str) -> Tuple[User, str, str]:
+        """Exchange a refresh token for a new access/refresh token pair.
+
+        The presented refresh token is revoked (rotation), so each refresh
+        token can be used only once. Its revocation insert is the check:
+        of concurrent refreshes with the same token, on any worker, only
+        the one whose insert succeeds gets new tokens.
+
+        Args:
+            refresh_token: JWT refresh token issued by ``login`` or ``refresh``
+
+        Returns:
+            Tuple of (User instance, access token, refresh token)
+
+        Raises:
+            UnauthorizedException: If the token is invalid, revoked, or the
+                account is disabled
+
+        Example:
+            >>> user, access_token, refresh_token = await service.refresh(token)
+        """
+        try:
+            payload = verify_token(refresh_token)
+            user_id = uuid.UUID(payload["sub"])
+            jti = payload["jti"]
+        except (JWTError, KeyError, TypeError, ValueError):
+            raise UnauthorizedException("Invalid or expired refresh token")
+
+        if payload.get("type") != "refresh":
+            raise UnauthorizedException("Invalid or expired refresh token")
+
+        user = await self.user_repository.get(user_id)
+        if not user or not user.is_active:
+            raise UnauthorizedException("Account is disabled")
+
+        if not await self._revoke(payload):
+            raise UnauthorizedException("Refresh token has been revoked")
+
+        access_token = create_access_token(data={"sub": str(user.id)})
+        new_refresh_token = create_refresh_token(data={"sub": str(user.id)})
+
+        return user, access_token, new_refresh_token
+
+    async def logout(self, access_token: str, refresh_token: Optional[str] = None) -> None:
+        """Revoke the caller's access token and, optionally, its refresh token.
+
+        Args:
+            access_token: The (already authenticated) bearer access token
+            refresh_token: Refresh token to revoke as well; ignored if invalid
+                or issued to another user
+        """
+        payload = verify_token(access_token)
+        await self._revoke(payload)
+
+        if refresh_token:
+            try:
+                refresh_payload = verify_token(refresh_token)
+            except JWTError:
+                return
+            if (
+                refresh_payload.get("type") == "refresh"
+                and refresh_payload.get("sub") == payload.get("sub")
+            ):
+                await self._revoke(refresh_payload)
+
+    async def _revoke(self, payload: Dict[str, Any]) -> bool:
+        """Persist a token's revocation.
+
+        Access tokens are also added to this worker's revocation list.
+        Tokens issued without a ``jti`` cannot be revoked and are skipped.
+        Revocations of expired tokens are purged here periodically.
+
+        Args:
+            payload: Decoded claims of the token to revoke
+
+        Returns:
+            True if this call revoked the token, False if it was already
+            revoked or has no ``jti``
+        """
+        jti = payload.get("jti")
+        if not jti:
+            return False
+
+        repository = RevokedTokenRepository(self.session)
+        revoked = await repository.revoke(
+            jti,
+            uuid.UUID(payload["sub"]),
+            datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+        )
+        if payload.get("type") != "refresh":
+            revocation_list.add(jti)
+        if revocation_list.purge_due():
+            await repository.delete_expired()
+        return revoked
+
+    def _evict_after_commit(self, user_id: uuid.UUID) -> None:
+        """Drop a user from ``user_cache`` once this session commits.
+
+        Evicting earlier would let a concurrent request re-cache the row
+        as it was before the commit.
+
+        Args:
+            user_id: ID of the user being changed
+        """
+        event.listen(
+            self.session.sync_session,
+            "after_commit",
+            lambda session: user_cache.pop(user_id),
+            once=True,
+        )
+
     async def get_current_user(self, token: str) -> User:
         """Get user from JWT token.
 
+        Users are served from the per-worker ``user_cache`` when possible and
+        only loaded from the database on a miss. Refresh tokens and revoked
+        tokens are rejected; the revocation check is answered in memory for
+        unrevoked tokens.
+
         Args:
             token: JWT access token
 
@@ -145,11 +304,24 @@ class AuthService:
             if not user_id:
                 raise UnauthorizedException("Invalid token payload")
 
-            user = await self.user_repository.get(uuid.UUID(user_id))
+            if payload.get("type") == "refresh":
+                raise UnauthorizedException("Refresh tokens cannot be used for API access")
+
+            jti = payload.get("jti")
+            if jti and await revocation_list.is_revoked(jti, self.session):
+                raise UnauthorizedException("Token has been revoked")
+
+            user_id = uuid.UUID(user_id)
+            cached = user_cache.get(user_id)
+            if cached is not None:
+                return await self.session.merge(cached, load=False)
+
+            user = await self.user_repository.get(user_id)
 
             if not user:
                 raise NotFoundException("User not found")
 
+            user_cache.set(user_id, _detached_snapshot(user))
             return user
 
         except Exception as e:
@@ -182,4 +354,30 @@ class AuthService:
             raise NotFoundException(f"User with id {user_id} not found")
 
         user.full_name = full_name
+        self._evict_after_commit(user_id)
+        return await self.user_repository.update(user)
+
+    async def deactivate_user(self, user_id: uuid.UUID) -> User:
+        """Deactivate a user account.
+
+        The user is evicted from this worker's ``user_cache`` once the
+        session commits; other workers pick up the change once their entry
+        expires.
+
+        Args:
+            user_id: ID of the user to deactivate
+
+        Returns:
+            Updated User instance
+
+        Raises:
+            NotFoundException: If user not found
+        """
+        user = await self.user_repository.get(user_id)
+
+        if not user:
+            raise NotFoundException(f"User with id {user_id} not found")
+
+        user.is_active = False
+        self._evict_after_commit(user_id)
         return await self.user_repository.update(user)
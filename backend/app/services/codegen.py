@@ -1,9 +1,21 @@
 """Code generation service using AI."""
 
 import re
+import time
 from typing import Dict, Any, Optional
 from anthropic import Anthropic
 from app.core.config import settings
+from app.core.metrics import Histogram
+from app.core.request_metrics import current_request_stats
+from app.core.tracing import traced
+
+
+RENDER_DURATION = Histogram(
+    "codegen_render_seconds",
+    "Time to render code from a template",
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+_render_duration = RENDER_DURATION.labels()
 
 
 class CodeGenService:
@@ -28,6 +40,7 @@ class CodeGenService:
         close_count = template.count('}}')
         return open_count == close_count
 
+    @traced("CodeGenService.generate_code")
     async def generate_code(
         self,
         template_content: str,
@@ -48,7 +61,13 @@ class CodeGenService:
             raise ValueError("Invalid template: mismatched brackets")
 
         # Basic variable substitution
+        start = time.perf_counter()
         code = self.process_variables(template_content, variables)
+        elapsed = time.perf_counter() - start
+        _render_duration.observe(elapsed)
+        stats = current_request_stats()
+        if stats is not None:
+            stats.render_time += elapsed
 
         # AI enhancement (placeholder for future implementation)
         if use_ai:
@@ -2,6 +2,7 @@
 
 import uuid
 from typing import List
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.project import Project
@@ -9,7 +10,7 @@ from app.repositories.project import ProjectRepository
 from app.repositories.template import TemplateRepository
 from app.schemas.project import ProjectCreate, ProjectUpdate
 from app.services.codegen import CodeGenService
-from app.core.exceptions import NotFoundException, UnauthorizedException
+from app.core.exceptions import ForbiddenException, NotFoundException
 
 
 class ProjectService:
@@ -42,39 +43,66 @@ class ProjectService:
         )
         return await self.repository.create(project)
 
+    async def get_project(self, project_id: uuid.UUID) -> Project:
+        """Get a single project by ID."""
+        project = await self.repository.get(project_id)
+
+        if not project:
+            raise NotFoundException(f"Project {project_id} not found")
+
+        return project
+
+    async def get_project_validator(self, project_id: uuid.UUID) -> Row:
+        """Get the id and timestamps of a project without its generated code."""
+        row = await self.repository.get_validator(project_id)
+
+        if not row:
+            raise NotFoundException(f"Project {project_id} not found")
+
+        return row
+
     async def generate_code_for_project(
         self,
         project_id: uuid.UUID,
         user_id: uuid.UUID,
         variables: dict
     ) -> Project:
-        """Generate code for a project using its template."""
-        project = await self.repository.get(project_id)
+        """Generate code for a project using its template.
 
-        if not project:
+        Reads the project's owner and template content in one joined query
+        and stores the result with one ``UPDATE ... RETURNING``.
+        """
+        row = await self.repository.get_for_generation(project_id)
+
+        if not row:
             raise NotFoundException(f"Project {project_id} not found")
 
-        if project.user_id != user_id:
-            raise UnauthorizedException("Not authorized to modify this project")
+        if row.user_id != user_id:
+            raise ForbiddenException("Not authorized to modify this project")
 
         # Get template
-        if not project.template_id:
+        if not row.template_id:
             raise ValueError("Project has no associated template")
 
-        template = await self.template_repository.get(project.template_id)
-        if not template:
+        if row.template_content is None:
             raise NotFoundException("Template not found")
 
         # Generate code
         generated_code = await self.codegen_service.generate_code(
-            template.content,
+            row.template_content,
             variables
         )
 
-        project.generated_code = generated_code
-        project.status = "generated"
+        project = await self.repository.update_owned(
+            project_id,
+            user_id,
+            {"generated_code": generated_code, "status": "generated"}
+        )
+
+        if not project:
+            raise NotFoundException(f"Project {project_id} not found")
 
-        return await self.repository.update(project)
+        return project
 
     async def update_project(
         self,
@@ -82,41 +110,38 @@ class ProjectService:
         data: ProjectUpdate,
         user_id: uuid.UUID
     ) -> Project:
-        """Update a project."""
-        project = await self.repository.get(project_id)
+        """Update a project owned by the user in a single statement."""
+        values = data.model_dump(exclude_none=True)
 
-        if not project:
-            raise NotFoundException(f"Project {project_id} not found")
+        if values:
+            project = await self.repository.update_owned(project_id, user_id, values)
+        else:
+            project = await self.repository.get(project_id)
+            if project and project.user_id != user_id:
+                project = None
 
-        if project.user_id != user_id:
-            raise UnauthorizedException("Not authorized to modify this project")
-
-        if data.name is not None:
-            project.name = data.name
-        if data.description is not None:
-            project.description = data.description
-        if data.config is not None:
-            project.config = data.config
-        if data.status is not None:
-            project.status = data.status
+        if not project:
+            await self._raise_not_owned(project_id, "modify")
 
-        return await self.repository.update(project)
+        return project
 
     async def delete_project(
         self,
         project_id: uuid.UUID,
         user_id: uuid.UUID
     ) -> bool:
-        """Delete a project."""
-        project = await self.repository.get(project_id)
+        """Delete a project owned by the user in a single statement."""
+        if not await self.repository.delete_owned(project_id, user_id):
+            await self._raise_not_owned(project_id, "delete")
 
-        if not project:
-            raise NotFoundException(f"Project {project_id} not found")
+        return True
 
-        if project.user_id != user_id:
-            raise UnauthorizedException("Not authorized to delete this project")
+    async def _raise_not_owned(self, project_id: uuid.UUID, action: str) -> None:
+        """Explain why an ownership-checked write matched no row."""
+        if not await self.repository.get_validator(project_id):
+            raise NotFoundException(f"Project {project_id} not found")
 
-        return await self.repository.delete(project_id)
+        raise ForbiddenException(f"Not authorized to {action} this project")
 
     async def get_project_history(
         self,
@@ -0,0 +1,176 @@
+"""Token revocation checks.
+
+This module provides the RevocationList, an in-memory Bloom filter and LRU
+in front of the ``revoked_tokens`` table. The common "not revoked" answer
+comes from the Bloom filter without touching the database; only filter hits
+(real revocations or rare false positives) are confirmed with a query.
+
+Each worker keeps its own filter and pulls revocations made by other workers
+every ``REVOCATION_SYNC_SECONDS``, so it is only used for access tokens.
+Refresh token reuse must be rejected at once on every worker, which the
+revoke insert itself decides (see ``AuthService.refresh``).
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import BloomFilter, TTLCache
+from app.core.config import settings
+from app.core.metrics import Counter, track_cache
+from app.repositories.revoked_token import RevokedTokenRepository
+
+
+# Revocations committed by slow transactions may carry a revoked_at earlier
+# than the previous sync; re-reading this window catches them.
+SYNC_OVERLAP = timedelta(seconds=60)
+
+# How often each worker deletes revocations of already expired tokens
+PURGE_INTERVAL_SECONDS = 3600
+
+REVOCATION_CHECKS = Counter(
+    "token_revocation_checks",
+    "Token revocation checks by where they were answered",
+    ("source",),
+)
+_answered_by_bloom = REVOCATION_CHECKS.labels("bloom")
+_answered_by_cache = REVOCATION_CHECKS.labels("cache")
+_answered_by_db = REVOCATION_CHECKS.labels("db")
+
+
+class RevocationList:
+    """Fast revoked-token lookup backed by the revoked_tokens table.
+
+    Attributes:
+        bloom: Filter containing every known revoked jti
+        lookups: LRU of database-confirmed answers for filter hits
+
+    Example:
+        >>> if await revocation_list.is_revoked(payload["jti"], session):
+        ...     raise UnauthorizedException("Token has been revoked")
+    """
+
+    def __init__(self, capacity: int, error_rate: float, sync_interval: float):
+        """Initialize an empty revocation list.
+
+        Args:
+            capacity: Number of revocations the Bloom filter is sized for
+            error_rate: Target false-positive rate of the Bloom filter
+            sync_interval: Seconds between pulls of new revocations
+        """
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._sync_interval = sync_interval
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.lookups: TTLCache[str, bool] = TTLCache(maxsize=10_000, ttl=sync_interval)
+        self._synced_at: Optional[float] = None
+        self._since: Optional[datetime] = None
+        self._syncing = False
+        self._first_sync = asyncio.Lock()
+        self._purged_at: Optional[float] = None
+
+    def add(self, jti: str) -> None:
+        """Record a revocation made by this worker.
+
+        Args:
+            jti: The revoked token id
+        """
+        self.bloom.add(jti)
+        # Drop any cached "not revoked" answer; the next check confirms in the DB
+        self.lookups.pop(jti)
+
+    def purge_due(self) -> bool:
+        """Claim this worker's periodic purge of expired revocations.
+
+        Returns:
+            True at most once per ``PURGE_INTERVAL_SECONDS``; the caller
+            should then delete expired rows
+        """
+        now = time.monotonic()
+        if self._purged_at is not None and now - self._purged_at < PURGE_INTERVAL_SECONDS:
+            return False
+        self._purged_at = now
+        return True
+
+    async def is_revoked(self, jti: str, session: AsyncSession) -> bool:
+        """Check whether a token id has been revoked.
+
+        Args:
+            jti: Token id from the token's claims
+            session: Database session used for syncs and confirmations
+
+        Returns:
+            True if the token was revoked
+        """
+        await self._maybe_sync(session)
+
+        if jti not in self.bloom:
+            _answered_by_bloom.inc()
+            return False
+
+        cached = self.lookups.get(jti)
+        if cached is not None:
+            _answered_by_cache.inc()
+            return cached
+
+        _answered_by_db.inc()
+        revoked = await RevokedTokenRepository(session).is_revoked(jti)
+        self.lookups.set(jti, revoked)
+        return revoked
+
+    async def _maybe_sync(self, session: AsyncSession) -> None:
+        """Pull revocations made since the last sync, if it is due.
+
+        Until the first sync has finished the filter knows no revocations,
+        so concurrent callers wait for it; later syncs are skipped by
+        callers that overlap one already running.
+        """
+        if self._synced_at is None:
+            async with self._first_sync:
+                if self._synced_at is None:
+                    await self._sync(session)
+            return
+
+        if self._syncing or time.monotonic() - self._synced_at < self._sync_interval:
+            return
+
+        self._syncing = True
+        try:
+            await self._sync(session)
+        finally:
+            self._syncing = False
+
+    async def _sync(self, session: AsyncSession) -> None:
+        """Pull revocations made since the last sync into the filter."""
+        now = time.monotonic()
+        started = datetime.now(timezone.utc)
+        # Rebuild from scratch on first use, and once the filter is
+        # over capacity, so expired revocations are dropped
+        rebuild = self._since is None or self.bloom.count > self._capacity
+        rows = await RevokedTokenRepository(session).get_unexpired_since(
+            None if rebuild else self._since - SYNC_OVERLAP
+        )
+
+        if rebuild:
+            self.bloom = BloomFilter(self._capacity, self._error_rate)
+        for row in rows:
+            # The overlap window re-reads known revocations; adding them
+            # again would inflate the count and trigger early rebuilds
+            if row.jti not in self.bloom:
+                self.bloom.add(row.jti)
+            self.lookups.pop(row.jti)
+
+        self._since = started
+        self._synced_at = now
+
+
+# Per-worker revocation list shared by all requests
+revocation_list = RevocationList(
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+    sync_interval=settings.REVOCATION_SYNC_SECONDS,
+)
+track_cache("revocation", revocation_list.lookups)
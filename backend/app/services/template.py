@@ -1,13 +1,53 @@
 """Template service for business logic."""
 
+import logging
 import uuid
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.template import Template
 from app.repositories.template import TemplateRepository
-from app.schemas.template import TemplateCreate, TemplateUpdate
-from app.core.exceptions import NotFoundException, UnauthorizedException
+from app.schemas.template import (
+    TemplateCreate,
+    TemplateUpdate,
+    TemplateExportRecord,
+    TemplateImportError,
+    TemplateImportBatch,
+    TemplateImportReport,
+)
+from app.core.config import settings
+from app.core.exceptions import ForbiddenException, NotFoundException
+
+
+logger = logging.getLogger(__name__)
+
+# Client-facing reasons for failed import batches, by SQLSTATE class
+_BATCH_FAILURE_REASONS = {
+    "22": "a value is invalid or too long for its column",
+    "23": "it conflicts with existing data",
+}
+
+
+def _describe_batch_failure(error: Exception) -> str:
+    """Classify a failed import batch without exposing database details.
+
+    COPY raises the driver's exception directly, while statements run
+    through SQLAlchemy wrap it in ``orig``; both carry a SQLSTATE.
+    """
+    sqlstate = getattr(error, "sqlstate", None) or getattr(getattr(error, "orig", None), "sqlstate", None)
+    reason = _BATCH_FAILURE_REASONS.get((sqlstate or "")[:2], "of a database error")
+    return f"Batch not imported because {reason}"
+
+
+def _describe_validation_error(error: ValidationError) -> str:
+    """Flatten a pydantic validation error into one line."""
+    messages = []
+    for detail in error.errors(include_url=False):
+        location = ".".join(str(part) for part in detail["loc"])
+        messages.append(f"{location}: {detail['msg']}" if location else detail["msg"])
+    return "; ".join(messages)
 
 
 class TemplateService:
@@ -41,50 +81,38 @@ class TemplateService:
         data: TemplateUpdate,
         user_id: uuid.UUID
     ) -> Template:
-        """Update a template."""
-        template = await self.repository.get(template_id)
+        """Update a template owned by the user in a single statement."""
+        values = data.model_dump(exclude_none=True)
+
+        if values:
+            template = await self.repository.update_owned(template_id, user_id, values)
+        else:
+            template = await self.repository.get(template_id)
+            if template and template.user_id != user_id:
+                template = None
 
         if not template:
-            raise NotFoundException(f"Template {template_id} not found")
+            await self._raise_not_owned(template_id, "update")
 
-        # Check ownership
-        if template.user_id != user_id:
-            raise UnauthorizedException("You don't have permission to update this template")
-
-        # Update fields
-        if data.name is not None:
-            template.name = data.name
-        if data.description is not None:
-            template.description = data.description
-        if data.content is not None:
-            template.content = data.content
-        if data.category is not None:
-            template.category = data.category
-        if data.language is not None:
-            template.language = data.language
-        if data.variables is not None:
-            template.variables = data.variables
-        if data.is_public is not None:
-            template.is_public = data.is_public
-
-        return await self.repository.update(template)
+        return template
 
     async def delete_template(
         self,
         template_id: uuid.UUID,
         user_id: uuid.UUID
     ) -> bool:
-        """Delete a template."""
-        template = await self.repository.get(template_id)
+        """Delete a template owned by the user in a single statement."""
+        if not await self.repository.delete_owned(template_id, user_id):
+            await self._raise_not_owned(template_id, "delete")
 
-        if not template:
-            raise NotFoundException(f"Template {template_id} not found")
+        return True
 
-        # Check ownership
-        if template.user_id != user_id:
-            raise UnauthorizedException("You don't have permission to delete this template")
+    async def _raise_not_owned(self, template_id: uuid.UUID, action: str) -> None:
+        """Explain why an ownership-checked write matched no row."""
+        if not await self.repository.get_validator(template_id):
+            raise NotFoundException(f"Template {template_id} not found")
 
-        return await self.repository.delete(template_id)
+        raise ForbiddenException(f"You don't have permission to {action} this template")
 
     async def get_template(self, template_id: uuid.UUID) -> Template:
         """Get a single template by ID."""
@@ -95,6 +123,15 @@ class TemplateService:
 
         return template
 
+    async def get_template_validator(self, template_id: uuid.UUID) -> Row:
+        """Get the id and timestamps of a template without its content."""
+        row = await self.repository.get_validator(template_id)
+
+        if not row:
+            raise NotFoundException(f"Template {template_id} not found")
+
+        return row
+
     async def list_templates(
         self,
         user_id: Optional[uuid.UUID] = None,
@@ -122,3 +159,116 @@ class TemplateService:
     ) -> List[Template]:
         """Search templates."""
         return await self.repository.search(query, skip, limit)
+
+    async def export_templates(
+        self,
+        user_id: Optional[uuid.UUID]
+    ) -> AsyncIterator[bytes]:
+        """Export templates as NDJSON, one chunk per cursor batch.
+
+        Memory use is bounded by ``TEMPLATE_EXPORT_BATCH_SIZE`` whatever
+        the number of templates.
+
+        Args:
+            user_id: Export this user's templates, or public ones if None
+
+        Yields:
+            NDJSON-encoded chunks of ``TemplateExportRecord`` lines
+        """
+        async for rows in self.repository.stream_for_export(
+            user_id, settings.TEMPLATE_EXPORT_BATCH_SIZE
+        ):
+            yield b"".join(
+                TemplateExportRecord.model_validate(row._mapping).model_dump_json().encode()
+                + b"\n"
+                for row in rows
+            )
+
+    async def import_templates(
+        self,
+        lines: AsyncIterator[Tuple[int, Optional[bytes]]],
+        user_id: uuid.UUID
+    ) -> TemplateImportReport:
+        """Import NDJSON template lines in batches owned by the user.
+
+        Each line is validated as ``TemplateCreate``; invalid lines are
+        reported and skipped. Valid lines are bulk-loaded and committed
+        ``TEMPLATE_IMPORT_BATCH_SIZE`` at a time, so a failing batch is
+        rolled back on its own and earlier batches stay imported.
+
+        Args:
+            lines: ``(line number, line)`` pairs, ``None`` for oversized lines
+            user_id: Owner of the imported templates
+
+        Returns:
+            Totals and per-batch results
+        """
+        batches: List[TemplateImportBatch] = []
+        values: List[Dict] = []
+        errors: List[TemplateImportError] = []
+        first_line = None
+        last_line = 0
+
+        async def flush_batch() -> None:
+            nonlocal values, errors, first_line
+            imported = 0
+            failed = len(errors) + len(values)
+            if values:
+                try:
+                    imported = await self.repository.copy_many(values)
+                    await self.session.commit()
+                except Exception as e:
+                    await self.session.rollback()
+                    logger.exception(
+                        "Template import batch (lines %s-%s) failed", first_line, last_line
+                    )
+                    errors.append(TemplateImportError(
+                        line=first_line,
+                        error=_describe_batch_failure(e),
+                    ))
+            batches.append(TemplateImportBatch(
+                batch=len(batches) + 1,
+                first_line=first_line,
+                last_line=last_line,
+                imported=imported,
+                failed=failed - imported,
+                errors=errors,
+            ))
+            values, errors, first_line = [], [], None
+
+        async for number, line in lines:
+            if first_line is None:
+                first_line = number
+            last_line = number
+
+            if line is None:
+                errors.append(TemplateImportError(
+                    line=number,
+                    error=f"Line exceeds {settings.TEMPLATE_IMPORT_MAX_LINE_BYTES} bytes",
+                ))
+            else:
+                try:
+                    data = TemplateCreate.model_validate_json(line)
+                except ValidationError as e:
+                    errors.append(TemplateImportError(
+                        line=number,
+                        error=_describe_validation_error(e),
+                    ))
+                else:
+                    values.append({
+                        **data.model_dump(),
+                        "variables": data.variables or {},
+                        "user_id": user_id,
+                    })
+
+            if len(values) + len(errors) >= settings.TEMPLATE_IMPORT_BATCH_SIZE:
+                await flush_batch()
+
+        if first_line is not None:
+            await flush_batch()
+
+        return TemplateImportReport(
+            imported=sum(batch.imported for batch in batches),
+            failed=sum(batch.failed for batch in batches),
+            batches=batches,
+        )
@@ -0,0 +1,6 @@
+"""Standalone performance benchmarks for the backend.
+
+Run individual benchmarks from the ``backend`` directory, e.g.::
+
+    python -m benchmarks.auth_overhead
+"""
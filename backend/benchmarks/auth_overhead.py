@@ -0,0 +1,149 @@
+"""Microbenchmark of per-request authentication overhead.
+
+Measures ``verify_token`` with a cold token cache (every call verifies the
+HMAC signature and decodes the token, as before the cache existed) against a
+warm cache, and the full ``AuthService.get_current_user`` hot path once both
+the token and user caches are populated.
+
+The hot path is not query-free in production: the revocation check runs a
+sync query against ``revoked_tokens`` on the first check and again every
+``REVOCATION_SYNC_SECONDS``. Those syncs are stubbed out here, so no
+database is needed and the figure is the cost between syncs. Before timing,
+the benchmark checks that requests overlapping the first sync wait for it
+instead of passing an empty revocation filter.
+
+Usage:
+    python -m benchmarks.auth_overhead [--iterations N] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.database import async_session
+from app.core.security import create_access_token, token_cache, verify_token
+from app.models.user import User
+from app.services import revocation
+from app.services.auth import AuthService, _detached_snapshot, user_cache
+from app.services.revocation import RevocationList, revocation_list
+
+
+def _per_call_us(func, iterations: int) -> float:
+    """Time a synchronous callable, returning microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def bench_verify_cold(token: str, iterations: int) -> float:
+    def call():
+        token_cache.clear()
+        verify_token(token)
+    return _per_call_us(call, iterations)
+
+
+def bench_verify_warm(token: str, iterations: int) -> float:
+    token_cache.clear()
+    verify_token(token)
+    return _per_call_us(lambda: verify_token(token), iterations)
+
+
+class _SlowRevokedTokens:
+    """Stand-in for RevokedTokenRepository whose sync query takes a while."""
+
+    revoked = {"revoked-jti"}
+
+    def __init__(self, session):
+        pass
+
+    async def get_unexpired_since(self, since=None):
+        await asyncio.sleep(0.05)
+        return [SimpleNamespace(jti=jti) for jti in self.revoked]
+
+    async def is_revoked(self, jti: str) -> bool:
+        return jti in self.revoked
+
+
+async def check_first_sync_blocks() -> None:
+    """Check that callers overlapping the first sync see its revocations."""
+    revocations = RevocationList(capacity=1000, error_rate=0.01, sync_interval=60)
+    with mock.patch.object(revocation, "RevokedTokenRepository", _SlowRevokedTokens):
+        answers = await asyncio.gather(
+            *(revocations.is_revoked("revoked-jti", None) for _ in range(10))
+        )
+    if not all(answers):
+        raise AssertionError(
+            f"revoked token accepted by {answers.count(False)} of "
+            f"{len(answers)} checks overlapping the first sync"
+        )
+
+
+async def _synced(session) -> None:
+    pass
+
+
+async def bench_current_user_warm(token: str, user: User, iterations: int) -> float:
+    user_cache.set(user.id, _detached_snapshot(user))
+    verify_token(token)
+    # Serve every revocation check from the (empty) Bloom filter, as between syncs
+    revocation_list._maybe_sync = _synced
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        async with async_session() as session:
+            await AuthService(session).get_current_user(token)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--json", action="store_true", help="Emit JSON results")
+    args = parser.parse_args()
+
+    user = User(
+        id=uuid.uuid4(),
+        email="bench@example.com",
+        hashed_password="x",
+        full_name="Bench User",
+        is_active=True,
+        created_at=datetime.now(timezone.utc),
+        updated_at=None,
+    )
+    make_transient_to_detached(user)
+    token = create_access_token({"sub": str(user.id)})
+
+    asyncio.run(check_first_sync_blocks())
+
+    results = {
+        "verify_token_cold_us": bench_verify_cold(token, args.iterations),
+        "verify_token_warm_us": bench_verify_warm(token, args.iterations),
+        "get_current_user_warm_us": asyncio.run(
+            bench_current_user_warm(token, user, args.iterations)
+        ),
+        "iterations": args.iterations,
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, value in results.items():
+        if name.endswith("_us"):
+            print(f"{name:<28} {value:10.2f} us/call")
+    print(
+        "verify_token speedup        "
+        f"{results['verify_token_cold_us'] / results['verify_token_warm_us']:10.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""Benchmark suite for the code generation engine.
+
+Times ``CodeGenService.process_variables``, ``validate_template`` and
+``generate_code`` over synthetic templates, sweeping one dimension at a time
+around a baseline case (100 KB template, 100 placeholders, 10 variables,
+16-byte values):
+
+- template size: 1 KB to 10 MB
+- placeholder count: 1 to 10k
+- variable count: 1 to 1k
+- value size: 1 B to 64 KB
+
+Each case reports latency percentiles, throughput (calls/s and template
+MB/s) and the peak memory allocated by one call, measured in a separate
+run under ``tracemalloc`` so tracing does not skew the timings. Results
+are keyed by a stable case id, so JSON files from two commits can be
+compared with ``--compare``. No database is needed.
+
+Usage:
+    python -m benchmarks.codegen [--min-time SECONDS] [--max-iterations N]
+        [--max-template-bytes N] [--only SUBSTRING] [--output FILE]
+        [--compare BASELINE.json] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from app.services.codegen import CodeGenService
+
+
+BASELINE = {"template_bytes": 100_000, "placeholders": 100, "variables": 10, "value_bytes": 16}
+
+SWEEPS = {
+    "template_bytes": [1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+    "placeholders": [1, 10, 100, 1_000, 10_000],
+    "variables": [1, 10, 100, 1_000],
+    "value_bytes": [1, 16, 1_024, 65_536],
+}
+
+OPERATIONS = ("process_variables", "validate_template", "generate_code")
+
+_FILLER = "    result = compute(items, options)  # generated body\n"
+
+
+def build_case(template_bytes: int, placeholders: int, variables: int, value_bytes: int):
+    """Build a template with evenly spaced placeholders and its variables.
+
+    Args:
+        template_bytes: Approximate template size before substitution
+        placeholders: Number of ``{{name}}`` occurrences
+        variables: Number of distinct variable names
+        value_bytes: Length of each variable's value
+
+    Returns:
+        ``(template, variables)`` tuple
+    """
+    names = [f"var{i}" for i in range(variables)]
+    tokens = [f"{{{{{names[i % variables]}}}}}" for i in range(placeholders)]
+    filler_bytes = max(template_bytes - sum(map(len, tokens)), 0)
+    gap = filler_bytes // (placeholders + 1)
+    filler = (_FILLER * (gap // len(_FILLER) + 1))[:gap]
+
+    parts = [filler]
+    for token in tokens:
+        parts.append(token)
+        parts.append(filler)
+    values = {name: ("v" * value_bytes) for name in names}
+    return "".join(parts), values
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def _time_calls(call: Callable[[], Any], min_time: float, max_iterations: int) -> List[float]:
+    """Call repeatedly until ``min_time`` has passed, returning seconds per call."""
+    call()  # Warm up regex and allocator caches
+    samples: List[float] = []
+    deadline = time.perf_counter() + min_time
+    while len(samples) < max_iterations and (not samples or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _peak_bytes(call: Callable[[], Any]) -> int:
+    """Peak memory allocated during one call."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        call()
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(params: Dict[str, int], min_time: float, max_iterations: int) -> Dict[str, Any]:
+    """Benchmark every operation for one case.
+
+    Args:
+        params: ``build_case`` arguments
+        min_time: Minimum seconds spent timing each operation
+        max_iterations: Upper bound on timed calls per operation
+
+    Returns:
+        Case parameters plus per-operation results
+    """
+    service = CodeGenService()
+    template, variables = build_case(**params)
+    loop = asyncio.new_event_loop()
+    calls = {
+        "process_variables": lambda: service.process_variables(template, variables),
+        "validate_template": lambda: service.validate_template(template),
+        "generate_code": lambda: loop.run_until_complete(
+            service.generate_code(template, variables)
+        ),
+    }
+
+    results: Dict[str, Any] = {}
+    try:
+        for operation in OPERATIONS:
+            samples = sorted(_time_calls(calls[operation], min_time, max_iterations))
+            mean = sum(samples) / len(samples)
+            results[operation] = {
+                "iterations": len(samples),
+                "mean_us": mean * 1e6,
+                "min_us": samples[0] * 1e6,
+                "p50_us": _percentile(samples, 0.50) * 1e6,
+                "p95_us": _percentile(samples, 0.95) * 1e6,
+                "p99_us": _percentile(samples, 0.99) * 1e6,
+                "calls_per_s": 1 / mean,
+                "template_mb_per_s": len(template) / mean / 1e6,
+                "peak_bytes": _peak_bytes(calls[operation]),
+            }
+    finally:
+        loop.close()
+
+    return {**params, "actual_template_bytes": len(template), "operations": results}
+
+
+def cases(max_template_bytes: int) -> Dict[str, Dict[str, int]]:
+    """Get the sweep's cases keyed by a stable id, skipping duplicates of the baseline."""
+    selected: Dict[str, Dict[str, int]] = {}
+    for dimension, values in SWEEPS.items():
+        for value in values:
+            params = {**BASELINE, dimension: value}
+            if params["template_bytes"] > max_template_bytes:
+                continue
+            case_id = "bytes={template_bytes},placeholders={placeholders},vars={variables},value={value_bytes}".format(**params)
+            selected.setdefault(case_id, params)
+    return selected
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(min_time: float, max_iterations: int, max_template_bytes: int, only: Optional[str]) -> dict:
+    results = {}
+    for case_id, params in cases(max_template_bytes).items():
+        if only and only not in case_id:
+            continue
+        results[case_id] = run_case(params, min_time, max_iterations)
+
+    return {
+        "benchmark": "codegen",
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "min_time": min_time,
+        "cases": results,
+    }
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Print per-operation p50 speedups of ``current`` over ``baseline``."""
+    print(f"baseline {baseline.get('commit')} -> current {current.get('commit')} (p50 speedup)")
+    for case_id, case in current["cases"].items():
+        before = baseline["cases"].get(case_id)
+        if before is None:
+            continue
+        ratios = "  ".join(
+            f"{operation}={before['operations'][operation]['p50_us'] / row['p50_us']:.2f}x"
+            for operation, row in case["operations"].items()
+            if operation in before["operations"]
+        )
+        print(f"{case_id:<56} {ratios}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds timed per operation")
+    parser.add_argument("--max-iterations", type=int, default=10_000)
+    parser.add_argument("--max-template-bytes", type=int, default=10_000_000)
+    parser.add_argument("--only", help="Run cases whose id contains this substring")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare with")
+    parser.add_argument("--json", action="store_true", help="Emit JSON results")
+    args = parser.parse_args()
+
+    results = run(args.min_time, args.max_iterations, args.max_template_bytes, args.only)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+        return
+
+    print(f"{'case':<56} {'operation':<18} {'p50':>10} {'p99':>10} {'MB/s':>8} {'peak':>10}")
+    for case_id, case in results["cases"].items():
+        for operation, row in case["operations"].items():
+            print(
+                f"{case_id:<56} {operation:<18} {row['p50_us']:7.0f} us {row['p99_us']:7.0f} us "
+                f"{row['template_mb_per_s']:8.1f} {row['peak_bytes'] / 1024:7.0f} KB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+"""End-to-end load test of one API worker.
+
+Seeds a dataset into PostgreSQL, serves the app built by ``create_app`` in
+a single uvicorn worker (a child process, so the client does not compete
+with it for the interpreter), and drives a weighted mix of requests from
+concurrent virtual users with ``httpx``:
+
+- ``login``: ``POST /api/v1/auth/login``
+- ``list_templates``: ``GET /api/v1/templates``
+- ``generate``: ``POST /api/v1/projects/{id}/generate``
+- ``get_code``: ``GET /api/v1/projects/{id}/code``
+
+Each virtual user logs in as one of the seeded users and then issues
+requests back to back. Requests completed during the warm-up are not
+counted. Throughput and p50/p95/p99 latency are reported per endpoint.
+
+The database is either the one at ``--database-url`` (default:
+``DATABASE_URL``), which must be a disposable database, or, with
+``--embedded``, a throwaway cluster started with the optional
+``testing.postgresql`` package (needs PostgreSQL's ``initdb`` on PATH).
+The app relies on PostgreSQL features (COPY, ON CONFLICT, arrays,
+``gen_random_uuid``), so SQLite cannot stand in for it.
+
+Usage:
+    python -m benchmarks.load_test [--database-url URL | --embedded]
+        [--mix login=1,list_templates=4,generate=2,get_code=3]
+        [--concurrency N] [--duration SECONDS] [--warmup SECONDS]
+        [--users N] [--templates-per-user N] [--projects-per-user N]
+        [--template-bytes N] [--reset] [--port N] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+
+PASSWORD = "load-test-password"
+ENDPOINTS = ("login", "list_templates", "generate", "get_code")
+DEFAULT_MIX = "login=1,list_templates=4,generate=2,get_code=3"
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse ``name=weight,...`` into endpoint weights.
+
+    Raises:
+        ValueError: For unknown endpoints or non-positive total weight
+    """
+    weights: Dict[str, float] = {}
+    for item in mix.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint {name!r}; choose from {', '.join(ENDPOINTS)}")
+        weights[name] = float(weight or 1)
+    if sum(weights.values()) <= 0:
+        raise ValueError("The mix needs at least one positive weight")
+    return weights
+
+
+def _template_content(size: int, variables: List[str]) -> str:
+    line = "def {{%s}}_handler(request):\n    return render(request, {{%s}})\n"
+    lines = []
+    total = 0
+    i = 0
+    while total < size:
+        name = variables[i % len(variables)]
+        piece = line % (name, variables[(i + 1) % len(variables)])
+        lines.append(piece)
+        total += len(piece)
+        i += 1
+    return "".join(lines)
+
+
+async def seed(args) -> List[Dict]:
+    """Create the schema and seed users, templates and projects.
+
+    Returns:
+        Per user: ``{"email", "projects": [project ids]}``
+    """
+    from sqlalchemy import func, select, text
+
+    from app.core.database import Base, async_session, engine
+    from app.core.security import hash_password
+    from app.models.revoked_token import RevokedToken  # noqa: F401 - registers the table
+    from app.models.user import User
+    from app.repositories.project import ProjectRepository
+    from app.repositories.template import TemplateRepository
+    from app.repositories.user import UserRepository
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if args.reset:
+            tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+            await conn.execute(text(f"TRUNCATE {tables} CASCADE"))
+
+    rng = random.Random(42)
+    variables = ["name", "route", "model", "field"]
+    hashed_password = hash_password(PASSWORD)
+    users, templates, projects, plan = [], [], [], []
+
+    for u in range(args.users):
+        user_id = uuid.uuid4()
+        email = f"load-user-{u}@example.com"
+        users.append({
+            "id": user_id,
+            "email": email,
+            "hashed_password": hashed_password,
+            "full_name": f"Load User {u}",
+        })
+        template_ids = []
+        for t in range(args.templates_per_user):
+            template_id = uuid.uuid4()
+            template_ids.append(template_id)
+            templates.append({
+                "id": template_id,
+                "name": f"Template {u}-{t}",
+                "description": "Seeded for load testing",
+                "content": _template_content(args.template_bytes, variables),
+                "category": rng.choice(["API", "CLI", "Web"]),
+                "language": rng.choice(["Python", "TypeScript", "Go"]),
+                "variables": {name: "str" for name in variables},
+                "user_id": user_id,
+                "is_public": rng.random() < 0.5,
+            })
+        project_ids = []
+        for p in range(args.projects_per_user):
+            project_id = uuid.uuid4()
+            project_ids.append(str(project_id))
+            projects.append({
+                "id": project_id,
+                "name": f"Project {u}-{p}",
+                "description": "Seeded for load testing",
+                "template_id": rng.choice(template_ids),
+                "user_id": user_id,
+                "config": {"framework": "fastapi"},
+                "status": "draft",
+            })
+        plan.append({"email": email, "projects": project_ids})
+
+    async with async_session() as session:
+        if await session.scalar(select(func.count()).select_from(User)):
+            raise SystemExit("Database already has users; pass --reset to truncate it first")
+        await UserRepository(session).copy_many(users)
+        if templates:
+            await TemplateRepository(session).copy_many(templates)
+        if projects:
+            await ProjectRepository(session).copy_many(projects)
+        await session.commit()
+
+    await engine.dispose()
+    return plan
+
+
+class Stats:
+    """Latencies and outcomes per endpoint."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.recording = False
+
+    def record(self, endpoint: str, latency: float, outcome: str) -> None:
+        if self.recording:
+            self.latencies[endpoint].append(latency)
+            self.statuses[endpoint][outcome] += 1
+
+
+async def _login(client, email: str) -> Optional[str]:
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": email, "password": PASSWORD}
+    )
+    if response.status_code != 200:
+        return None
+    return response.json()["data"]["access_token"]
+
+
+async def virtual_user(client, user: Dict, weights: Dict[str, float], stats: Stats, stop: asyncio.Event, seed_value: int) -> None:
+    rng = random.Random(seed_value)
+    token = await _login(client, user["email"])
+    names = list(weights)
+    name_weights = list(weights.values())
+
+    while not stop.is_set():
+        endpoint = rng.choices(names, weights=name_weights)[0]
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        project_id = rng.choice(user["projects"]) if user["projects"] else str(uuid.uuid4())
+
+        start = time.perf_counter()
+        try:
+            if endpoint == "login":
+                response = await client.post(
+                    "/api/v1/auth/login", json={"email": user["email"], "password": PASSWORD}
+                )
+                if response.status_code == 200:
+                    token = response.json()["data"]["access_token"]
+            elif endpoint == "list_templates":
+                response = await client.get("/api/v1/templates", params={"limit": 20}, headers=headers)
+            elif endpoint == "generate":
+                response = await client.post(
+                    f"/api/v1/projects/{project_id}/generate",
+                    json={"name": "orders", "route": "/orders", "model": "Order", "field": "total"},
+                    headers=headers,
+                )
+            else:
+                response = await client.get(f"/api/v1/projects/{project_id}/code", headers=headers)
+            outcome = str(response.status_code)
+        except Exception as e:
+            outcome = type(e).__name__
+        stats.record(endpoint, time.perf_counter() - start, outcome)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(stats: Stats, duration: float) -> Dict:
+    results = {}
+    for endpoint, latencies in stats.latencies.items():
+        latencies.sort()
+        statuses = dict(stats.statuses[endpoint])
+        results[endpoint] = {
+            "requests": len(latencies),
+            "rps": len(latencies) / duration,
+            "p50_ms": _percentile(latencies, 0.50) * 1000,
+            "p95_ms": _percentile(latencies, 0.95) * 1000,
+            "p99_ms": _percentile(latencies, 0.99) * 1000,
+            "mean_ms": sum(latencies) / len(latencies) * 1000,
+            "errors": sum(n for status, n in statuses.items() if not status.startswith(("2", "3"))),
+            "statuses": statuses,
+        }
+    total = sum(row["requests"] for row in results.values())
+    results["total"] = {"requests": total, "rps": total / duration}
+    return results
+
+
+async def drive(base_url: str, plan: List[Dict], args) -> Dict:
+    import httpx
+
+    weights = parse_mix(args.mix)
+    stats = Stats()
+    stop = asyncio.Event()
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        users = [
+            asyncio.create_task(
+                virtual_user(client, plan[i % len(plan)], weights, stats, stop, seed_value=i)
+            )
+            for i in range(args.concurrency)
+        ]
+        await asyncio.sleep(args.warmup)
+        stats.recording = True
+        await asyncio.sleep(args.duration)
+        stats.recording = False
+        stop.set()
+        await asyncio.gather(*users)
+
+    results = summarize(stats, args.duration)
+    results["config"] = {
+        "mix": weights,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "warmup": args.warmup,
+        "users": args.users,
+        "templates_per_user": args.templates_per_user,
+        "projects_per_user": args.projects_per_user,
+        "template_bytes": args.template_bytes,
+    }
+    return results
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int, env: Dict[str, str]) -> subprocess.Popen:
+    """Serve ``create_app()`` with one uvicorn worker and wait until it answers."""
+    import httpx
+
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:create_app", "--factory",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--log-level", "warning", "--no-access-log",
+        ],
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit("The server exited during startup")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return server
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    server.terminate()
+    raise SystemExit("The server did not become healthy within 30s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    database = parser.add_mutually_exclusive_group()
+    database.add_argument("--database-url", help="Disposable PostgreSQL database (asyncpg URL)")
+    database.add_argument("--embedded", action="store_true", help="Start a throwaway PostgreSQL")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Endpoint weights, name=weight,...")
+    parser.add_argument("--concurrency", type=int, default=32, help="Virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Unmeasured seconds first")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--templates-per-user", type=int, default=5)
+    parser.add_argument("--projects-per-user", type=int, default=5)
+    parser.add_argument("--template-bytes", type=int, default=4096)
+    parser.add_argument("--reset", action="store_true", help="Truncate all tables before seeding")
+    parser.add_argument("--port", type=int, help="Server port (default: a free port)")
+    parser.add_argument("--json", action="store_true", help="Emit JSON results")
+    args = parser.parse_args()
+    parse_mix(args.mix)
+
+    embedded = None
+    if args.embedded:
+        import testing.postgresql  # optional dependency, only needed here
+
+        embedded = testing.postgresql.Postgresql()
+        database_url = embedded.url().replace("postgresql://", "postgresql+asyncpg://", 1)
+    else:
+        database_url = args.database_url or os.environ.get("DATABASE_URL")
+        if not database_url:
+            raise SystemExit("Pass --database-url, set DATABASE_URL, or use --embedded")
+
+    # Settings are read at import time, so the app must be imported after this
+    os.environ["DATABASE_URL"] = database_url
+
+    server = None
+    try:
+        plan = asyncio.run(seed(args))
+        port = args.port or _free_port()
+        server = start_server(port, dict(os.environ))
+        results = asyncio.run(drive(f"http://127.0.0.1:{port}", plan, args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        if embedded is not None:
+            embedded.stop()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'endpoint':<16} {'requests':>9} {'rps':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>7}")
+    for endpoint in ENDPOINTS:
+        row = results.get(endpoint)
+        if row is None:
+            continue
+        print(
+            f"{endpoint:<16} {row['requests']:9d} {row['rps']:9.1f} {row['p50_ms']:6.1f} ms "
+            f"{row['p95_ms']:6.1f} ms {row['p99_ms']:6.1f} ms {row['errors']:7d}"
+        )
+    print(f"{'total':<16} {results['total']['requests']:9d} {results['total']['rps']:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Microbenchmark of per-query Python overhead in the repositories.
+
+Compares plain ``select()`` statements rebuilt on every call (as the
+repositories did before) against the cached ``lambda_stmt`` statements they
+use now, for ``TemplateRepository.get_public``, ``ProjectRepository.get_by_user``
+and ``UserRepository.get_by_email``. Each call builds the statement and runs
+it through the same compile-cache lookup ``Connection.execute`` performs with
+the asyncpg dialect, so the numbers cover construction, cache-key generation
+and parameter extraction, but not the network round trip. No database is
+needed.
+
+Usage:
+    python -m benchmarks.query_overhead [--iterations N] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.util import LRUCache
+
+from app.core.database import engine
+from app.models.project import Project
+from app.models.template import Template
+from app.models.user import User
+from app.repositories.project import ProjectRepository
+from app.repositories.template import TemplateRepository
+from app.repositories.user import UserRepository
+
+
+class _CompileOnlyResult:
+    """Empty result standing in for a database response."""
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+    def scalar_one_or_none(self):
+        return None
+
+
+class _CompileOnlySession:
+    """Session stand-in that compiles statements the way a connection does."""
+
+    def __init__(self):
+        self.dialect = engine.dialect
+        self.compiled_cache = LRUCache(500)
+        self.cache_hits = 0
+        self.last_sql = None
+
+    async def execute(self, stmt):
+        compiled, extracted, cache_hit = stmt._compile_w_cache(
+            dialect=self.dialect,
+            compiled_cache=self.compiled_cache,
+            column_keys=[],
+        )
+        compiled.construct_params(extracted_parameters=extracted)
+        if cache_hit == self.dialect.CACHE_HIT:
+            self.cache_hits += 1
+        self.last_sql = compiled.string
+        return _CompileOnlyResult()
+
+
+# Statements as the repositories built them before lambda_stmt
+async def _select_get_public(session, skip: int = 0, limit: int = 100):
+    stmt = (
+        select(Template)
+        .where(Template.is_public == True)
+        .offset(skip)
+        .limit(limit)
+        .order_by(Template.created_at.desc())
+    )
+    return list((await session.execute(stmt)).scalars().all())
+
+
+async def _select_get_by_user(session, user_id: uuid.UUID, skip: int = 0, limit: int = 100):
+    stmt = (
+        select(Project)
+        .where(Project.user_id == user_id)
+        .offset(skip)
+        .limit(limit)
+        .order_by(Project.created_at.desc())
+    )
+    return list((await session.execute(stmt)).scalars().all())
+
+
+async def _select_get_by_email(session, email: str):
+    stmt = select(User).where(User.email == email)
+    return (await session.execute(stmt)).scalar_one_or_none()
+
+
+async def _per_call_us(call, iterations: int) -> float:
+    """Time an async callable, returning microseconds per call."""
+    await call(0)  # Warm the compiled cache
+    start = time.perf_counter()
+    for i in range(iterations):
+        await call(i)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def run(iterations: int) -> dict:
+    user_ids = [uuid.uuid4() for _ in range(64)]
+    emails = [f"user{i}@example.com" for i in range(64)]
+
+    select_session = _CompileOnlySession()
+    lambda_session = _CompileOnlySession()
+    templates = TemplateRepository(lambda_session)
+    projects = ProjectRepository(lambda_session)
+    users = UserRepository(lambda_session)
+
+    cases = {
+        "get_public": (
+            lambda i: _select_get_public(select_session, skip=i % 5 * 20, limit=20),
+            lambda i: templates.get_public(skip=i % 5 * 20, limit=20),
+        ),
+        "get_by_user": (
+            lambda i: _select_get_by_user(select_session, user_ids[i % 64]),
+            lambda i: projects.get_by_user(user_ids[i % 64]),
+        ),
+        "get_by_email": (
+            lambda i: _select_get_by_email(select_session, emails[i % 64]),
+            lambda i: users.get_by_email(emails[i % 64]),
+        ),
+    }
+
+    results = {}
+    for name, (select_call, lambda_call) in cases.items():
+        select_us = await _per_call_us(select_call, iterations)
+        lambda_us = await _per_call_us(lambda_call, iterations)
+        if select_session.last_sql != lambda_session.last_sql:
+            raise RuntimeError(f"{name}: lambda statement renders different SQL")
+        results[name] = {
+            "select_us": select_us,
+            "lambda_stmt_us": lambda_us,
+            "speedup": select_us / lambda_us,
+        }
+
+    results["iterations"] = iterations
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--json", action="store_true", help="Emit JSON results")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.iterations))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'query':<16} {'select()':>12} {'lambda_stmt':>12} {'speedup':>9}")
+    for name, row in results.items():
+        if name == "iterations":
+            continue
+        print(
+            f"{name:<16} {row['select_us']:9.2f} us {row['lambda_stmt_us']:9.2f} us "
+            f"{row['speedup']:8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
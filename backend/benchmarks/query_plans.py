@@ -0,0 +1,350 @@
+"""Query plan regression check for the repositories.
+
+Calls every query method of ``UserRepository``, ``TemplateRepository`` and
+``ProjectRepository`` against a seeded database and captures the plan of
+each statement it sends, by running ``EXPLAIN (FORMAT JSON)`` with the same
+SQL and parameters on the same connection just before it executes. Each
+method runs in a transaction that is rolled back, so write methods are
+covered too (insert-only paths such as ``create_many`` and the COPY-based
+``copy_many`` have no plan worth tracking and are skipped).
+
+Plans are normalized to their shape (node types, relations, indexes, join
+types, sort keys, scan directions); costs and row estimates are dropped.
+They are compared with the snapshots in ``query_plans.json`` next to this
+module, and the run exits with status 1 on a regression:
+
+- a relation that was read through an index is now sequentially scanned
+- a plan gained a ``Sort`` or ``Incremental Sort`` node
+- a method has no snapshot yet
+
+Other shape changes are reported but do not fail the run. Record or accept
+plans with ``--update`` and commit the snapshot file. No snapshot file is
+committed yet; until one is recorded against the seeded dataset, the run
+lists every method as ``missing`` and exits with status 0, so it catches
+nothing. Parallel query is
+disabled for the session, so plans do not depend on the machine's worker
+settings.
+
+Snapshots are only comparable on the same dataset: build it with
+``python -m benchmarks.seed`` using the default sizes and seed.
+
+Usage:
+    python -m benchmarks.query_plans [--database-url URL] [--update]
+        [--only SUBSTRING] [--snapshots FILE] [--json]
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+SNAPSHOTS = Path(__file__).with_name("query_plans.json")
+
+# Plan node properties that make up its shape
+SHAPE_KEYS = (
+    "Node Type",
+    "Parent Relationship",
+    "Operation",
+    "Relation Name",
+    "Index Name",
+    "Scan Direction",
+    "Join Type",
+    "Strategy",
+    "Sort Key",
+    "Presorted Key",
+)
+SORT_NODES = ("Sort", "Incremental Sort")
+
+# Repository, method, arguments built from sample rows
+Case = Tuple[str, str, Callable[[Dict[str, Any]], tuple]]
+
+CASES: Dict[str, Case] = {
+    "UserRepository.get": ("user", "get", lambda s: (s["user_id"],)),
+    "UserRepository.get_validator": ("user", "get_validator", lambda s: (s["user_id"],)),
+    "UserRepository.get_all": ("user", "get_all", lambda s: (0, 100)),
+    "UserRepository.get_by_email": ("user", "get_by_email", lambda s: (s["email"],)),
+    "UserRepository.create_if_email_available": (
+        "user", "create_if_email_available",
+        lambda s: ({"email": s["email"], "hashed_password": "x", "full_name": "x"},),
+    ),
+    "UserRepository.update_many": (
+        "user", "update_many", lambda s: ([{"id": s["user_id"], "full_name": "x"}],),
+    ),
+    "UserRepository.delete": ("user", "delete", lambda s: (s["user_id"],)),
+    "UserRepository.delete_many": ("user", "delete_many", lambda s: ([s["user_id"]],)),
+    "TemplateRepository.get": ("template", "get", lambda s: (s["template_id"],)),
+    "TemplateRepository.get_validator": ("template", "get_validator", lambda s: (s["template_id"],)),
+    "TemplateRepository.get_all": ("template", "get_all", lambda s: (0, 100)),
+    "TemplateRepository.get_by_user": ("template", "get_by_user", lambda s: (s["template_user_id"],)),
+    "TemplateRepository.get_public": ("template", "get_public", lambda s: ()),
+    "TemplateRepository.get_by_category": ("template", "get_by_category", lambda s: (s["category"],)),
+    "TemplateRepository.filter_by_language": ("template", "filter_by_language", lambda s: (s["language"],)),
+    "TemplateRepository.search": ("template", "search", lambda s: (s["search"],)),
+    "TemplateRepository.stream_for_export[user]": (
+        "template", "stream_for_export", lambda s: (s["template_user_id"], 100),
+    ),
+    "TemplateRepository.stream_for_export[public]": (
+        "template", "stream_for_export", lambda s: (None, 100),
+    ),
+    "TemplateRepository.update_owned": (
+        "template", "update_owned",
+        lambda s: (s["template_id"], s["template_user_id"], {"is_public": True}),
+    ),
+    "TemplateRepository.update_many": (
+        "template", "update_many", lambda s: ([{"id": s["template_id"], "is_public": True}],),
+    ),
+    "TemplateRepository.delete_owned": (
+        "template", "delete_owned", lambda s: (s["template_id"], s["template_user_id"]),
+    ),
+    "TemplateRepository.delete": ("template", "delete", lambda s: (s["template_id"],)),
+    "TemplateRepository.delete_many": ("template", "delete_many", lambda s: ([s["template_id"]],)),
+    "ProjectRepository.get": ("project", "get", lambda s: (s["project_id"],)),
+    "ProjectRepository.get_validator": ("project", "get_validator", lambda s: (s["project_id"],)),
+    "ProjectRepository.get_all": ("project", "get_all", lambda s: (0, 100)),
+    "ProjectRepository.get_for_generation": ("project", "get_for_generation", lambda s: (s["project_id"],)),
+    "ProjectRepository.get_by_user": ("project", "get_by_user", lambda s: (s["project_user_id"],)),
+    "ProjectRepository.get_by_template": ("project", "get_by_template", lambda s: (s["project_template_id"],)),
+    "ProjectRepository.get_recent": ("project", "get_recent", lambda s: (s["project_user_id"],)),
+    "ProjectRepository.update_owned": (
+        "project", "update_owned",
+        lambda s: (s["project_id"], s["project_user_id"], {"status": "archived"}),
+    ),
+    "ProjectRepository.update_many": (
+        "project", "update_many", lambda s: ([{"id": s["project_id"], "status": "archived"}],),
+    ),
+    "ProjectRepository.delete_owned": (
+        "project", "delete_owned", lambda s: (s["project_id"], s["project_user_id"]),
+    ),
+    "ProjectRepository.delete": ("project", "delete", lambda s: (s["project_id"],)),
+    "ProjectRepository.delete_many": ("project", "delete_many", lambda s: ([s["project_id"]],)),
+}
+
+# Lowest ids, so the same seeded dataset always gives the same samples
+SAMPLE_QUERIES = {
+    "user": "SELECT id AS user_id, email FROM users ORDER BY id LIMIT 1",
+    "template": (
+        "SELECT id AS template_id, user_id AS template_user_id, category, language, name "
+        # The search term is the name's first word, so the name needs one
+        "FROM templates WHERE is_public AND name ~ '[^[:space:]]' ORDER BY id LIMIT 1"
+    ),
+    "project": (
+        "SELECT id AS project_id, user_id AS project_user_id, template_id AS project_template_id "
+        "FROM projects WHERE template_id IS NOT NULL ORDER BY id LIMIT 1"
+    ),
+}
+
+
+def normalize(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an ``EXPLAIN (FORMAT JSON)`` plan node to its shape.
+
+    Args:
+        node: Plan node, including its ``Plans`` children
+
+    Returns:
+        The node's ``SHAPE_KEYS`` properties and normalized children
+    """
+    shape = {key: node[key] for key in SHAPE_KEYS if key in node}
+    children = [normalize(child) for child in node.get("Plans", ())]
+    if children:
+        shape["Plans"] = children
+    return shape
+
+
+def _walk(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", ()):
+        yield from _walk(child)
+
+
+def _scans(plan: Dict[str, Any]) -> Dict[str, set]:
+    """Node types reading each relation."""
+    scans: Dict[str, set] = {}
+    for node in _walk(plan):
+        if "Relation Name" in node and node["Node Type"] != "ModifyTable":
+            scans.setdefault(node["Relation Name"], set()).add(node["Node Type"])
+    return scans
+
+
+def regressions(before: List[Dict[str, Any]], after: List[Dict[str, Any]]) -> List[str]:
+    """Describe how the plans of one method regressed.
+
+    Args:
+        before: Snapshotted plans, one per statement
+        after: Current plans
+
+    Returns:
+        Human readable regressions; empty if there are none
+    """
+    found = []
+    for index, (old, new) in enumerate(zip(before, after)):
+        prefix = f"statement {index + 1}: " if len(after) > 1 else ""
+        old_scans, new_scans = _scans(old), _scans(new)
+        for relation, types in new_scans.items():
+            previous = old_scans.get(relation, set())
+            if "Seq Scan" in types and previous and "Seq Scan" not in previous:
+                found.append(f"{prefix}{' / '.join(sorted(previous))} -> Seq Scan on {relation}")
+
+        old_sorts = [node for node in _walk(old) if node["Node Type"] in SORT_NODES]
+        new_sorts = [node for node in _walk(new) if node["Node Type"] in SORT_NODES]
+        if len(new_sorts) > len(old_sorts):
+            keys = ", ".join(new_sorts[-1].get("Sort Key", ()))
+            found.append(f"{prefix}new {new_sorts[-1]['Node Type']} node ({keys})")
+    return found
+
+
+def render(plan: Dict[str, Any], depth: int = 0) -> str:
+    """Render a normalized plan as an indented tree."""
+    line = plan["Node Type"]
+    if "Index Name" in plan:
+        line += f" using {plan['Index Name']}"
+    if "Relation Name" in plan:
+        line += f" on {plan['Relation Name']}"
+    if "Sort Key" in plan:
+        line += f" [{', '.join(plan['Sort Key'])}]"
+    lines = ["  " * depth + line]
+    lines += [render(child, depth + 1) for child in plan.get("Plans", ())]
+    return "\n".join(lines)
+
+
+async def capture_plans(url: str, only: Optional[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Run the selected cases and collect their normalized plans.
+
+    Returns:
+        Normalized plans of each case's statements, keyed by case id
+    """
+    from sqlalchemy import event, text
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from app.repositories.project import ProjectRepository
+    from app.repositories.template import TemplateRepository
+    from app.repositories.user import UserRepository
+
+    repositories = {"user": UserRepository, "template": TemplateRepository, "project": ProjectRepository}
+    engine = create_async_engine(url, poolclass=NullPool)
+    captured: List[Dict[str, Any]] = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")):
+            return
+        if executemany:
+            parameters = parameters[0]
+        # A separate cursor: the statement's own may be a server-side one
+        explain_cursor = conn.connection.cursor()
+        try:
+            explain_cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = explain_cursor.fetchone()[0]
+        finally:
+            explain_cursor.close()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        captured.append(normalize(plan[0]["Plan"]))
+
+    async with engine.connect() as conn:
+        samples: Dict[str, Any] = {}
+        for query in SAMPLE_QUERIES.values():
+            row = (await conn.execute(text(query))).mappings().one_or_none()
+            if row is None:
+                raise SystemExit("The database has no data; seed it with python -m benchmarks.seed")
+            samples.update(row)
+        samples["search"] = samples.pop("name").split()[0].lower()
+
+    event.listen(engine.sync_engine, "before_cursor_execute", explain)
+    plans: Dict[str, List[Dict[str, Any]]] = {}
+    try:
+        for case_id, (repository, method, arguments) in CASES.items():
+            if only and only not in case_id:
+                continue
+            async with engine.connect() as conn:
+                await conn.execute(text("SET max_parallel_workers_per_gather = 0"))
+                session = AsyncSession(bind=conn, expire_on_commit=False)
+                captured.clear()
+                result = getattr(repositories[repository](session), method)(*arguments(samples))
+                if inspect.isasyncgen(result):
+                    async for _ in result:
+                        break
+                    await result.aclose()
+                else:
+                    await result
+                plans[case_id] = list(captured)
+                await session.close()
+                await conn.rollback()
+    finally:
+        await engine.dispose()
+    return plans
+
+
+def check(current: Dict[str, list], snapshots: Dict[str, list]) -> Dict[str, Dict[str, Any]]:
+    """Compare current plans with the snapshots.
+
+    Returns:
+        Per case: ``status`` (``ok``, ``changed``, ``regressed`` or
+        ``missing``) and, for regressions, their ``details``
+    """
+    report = {}
+    for case_id, plans in current.items():
+        before = snapshots.get(case_id)
+        if before is None:
+            report[case_id] = {"status": "missing", "details": ["no snapshot; run with --update"]}
+        elif before == plans:
+            report[case_id] = {"status": "ok", "details": []}
+        else:
+            details = regressions(before, plans)
+            if len(before) != len(plans):
+                details.append(f"{len(before)} statements -> {len(plans)}")
+            report[case_id] = {"status": "regressed" if details else "changed", "details": details}
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="Seeded database (default: DATABASE_URL)")
+    parser.add_argument("--update", action="store_true", help="Record the current plans as snapshots")
+    parser.add_argument("--only", help="Check cases whose id contains this substring")
+    parser.add_argument("--snapshots", type=Path, default=SNAPSHOTS, help="Snapshot file")
+    parser.add_argument("--json", action="store_true", help="Emit the report as JSON")
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    from app.core.config import settings
+
+    current = asyncio.run(capture_plans(settings.DATABASE_URL, args.only))
+    recorded = args.snapshots.exists()
+    snapshots = json.loads(args.snapshots.read_text()) if recorded else {}
+
+    if args.update:
+        if not args.only:
+            snapshots = {}
+        snapshots.update(current)
+        args.snapshots.write_text(json.dumps(snapshots, indent=2, sort_keys=True) + "\n")
+        print(f"Recorded plans of {len(current)} methods in {args.snapshots}")
+        return
+
+    report = check(current, snapshots)
+    # Without a snapshot file there is no baseline yet, so missing is no failure
+    failing = ("regressed", "missing") if recorded else ("regressed",)
+    failed = [case_id for case_id, row in report.items() if row["status"] in failing]
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for case_id, row in report.items():
+            print(f"{row['status']:<10} {case_id}")
+            for detail in row["details"]:
+                print(f"           {detail}")
+            if row["status"] != "ok":
+                for plan in current[case_id]:
+                    print("\n".join("           | " + line for line in render(plan).splitlines()))
+        print(f"{len(report)} methods, {len(failed)} failed")
+        if not recorded:
+            print(f"No snapshots in {args.snapshots}; record them with --update")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+"""Deterministic synthetic dataset seeder for performance databases.
+
+Generates users, templates and projects at scale (millions of rows) from a
+seed and loads them with PostgreSQL ``COPY`` from parallel worker
+processes. Rows are produced in fixed-size batches, each from its own
+random generator seeded with ``(seed, table, batch)``, and ids are derived
+from ``(seed, table, row number)``, so the same arguments always produce
+the same dataset whatever the number of workers.
+
+The data is shaped for the hot queries rather than uniform:
+
+- template sizes are log-normal (median ~2 KB, 64 B to 256 KB), with
+  ``{{placeholders}}`` throughout
+- categories and languages are skewed, ~30% of templates are public
+- template ownership and project popularity follow a power law, so some
+  users own many templates and some templates back many projects
+- names and descriptions are built from a word list, so ``search`` has
+  both common and rare terms to match
+- ``created_at`` is spread over two years, for realistic pagination order
+
+Every seeded user's password is ``SEED_PASSWORD``. Secondary indexes are
+dropped during the load and rebuilt in parallel afterwards, and the
+tables are analyzed, so the planner sees the final statistics.
+
+The target database must be disposable. The schema must exist
+(``alembic upgrade head``), or pass ``--create-schema``.
+
+Usage:
+    python -m benchmarks.seed [--database-url URL] [--seed N]
+        [--users N] [--templates N] [--projects N] [--batch-size N]
+        [--workers N] [--truncate] [--create-schema] [--keep-indexes]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+
+SEED_PASSWORD = "perf-seed-password"
+# Fixed salt, so the seeded password hash is deterministic too
+_PASSWORD_SALT = "perfseedperfseedperfse"
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_HISTORY_SECONDS = 2 * 365 * 24 * 3600
+
+CATEGORIES = (("API", 30), ("Web", 20), ("CLI", 12), ("Data", 12), ("DevOps", 10), ("Testing", 10), ("ML", 6))
+LANGUAGES = (("Python", 35), ("TypeScript", 25), ("Go", 12), ("Java", 10), ("Rust", 8), ("Ruby", 5), ("C#", 5))
+STATUSES = (("draft", 50), ("generated", 45), ("archived", 5))
+
+_WORDS = (
+    "async order user payment invoice cache queue event stream report auth token session "
+    "gateway service handler router model schema client worker batch export import search "
+    "index metrics logging config deploy pipeline webhook notification billing inventory "
+    "catalog checkout profile admin dashboard graphql rest grpc kafka redis postgres"
+).split()
+_FIRST_NAMES = "Ada Alan Barbara Claude Dennis Edsger Frances Grace Guido Ken Linus Margaret Niklaus Radia Tim".split()
+_LAST_NAMES = "Lovelace Turing Liskov Shannon Ritchie Dijkstra Allen Hopper Rossum Thompson Torvalds Hamilton Wirth Perlman Berners-Lee".split()
+_VARIABLES = ("name", "entity", "route", "table", "field", "module")
+
+COLUMNS = {
+    "users": ("id", "email", "hashed_password", "full_name", "is_active", "created_at"),
+    "templates": (
+        "id", "name", "description", "content", "category", "language",
+        "variables", "user_id", "is_public", "created_at",
+    ),
+    "projects": (
+        "id", "name", "description", "template_id", "user_id", "config",
+        "status", "generated_code", "created_at",
+    ),
+}
+
+
+class DatasetSpec(NamedTuple):
+    """Parameters that fully determine a generated dataset."""
+
+    seed: int
+    users: int
+    templates: int
+    projects: int
+    batch_size: int
+    password_hash: str
+
+
+def entity_id(seed: int, table: str, index: int) -> uuid.UUID:
+    """Derive the id of a generated row.
+
+    Args:
+        seed: Dataset seed
+        table: Table name
+        index: Row number within the table
+
+    Returns:
+        A version 4 UUID that is stable for the same arguments
+    """
+    digest = hashlib.blake2b(f"{seed}:{table}:{index}".encode(), digest_size=16).digest()
+    return uuid.UUID(bytes=digest, version=4)
+
+
+def _weighted(choices: Sequence[Tuple[str, int]]) -> Callable[[random.Random], str]:
+    values = [value for value, _ in choices]
+    cumulative = list(accumulate(weight for _, weight in choices))
+    return lambda rng: rng.choices(values, cum_weights=cumulative)[0]
+
+
+_category = _weighted(CATEGORIES)
+_language = _weighted(LANGUAGES)
+_status = _weighted(STATUSES)
+
+
+def _skewed(rng: random.Random, count: int, exponent: float = 2.5) -> int:
+    """Pick an index in ``range(count)`` with a power-law bias towards 0."""
+    return min(int(count * rng.random() ** exponent), count - 1)
+
+
+def _created_at(rng: random.Random) -> datetime:
+    return EPOCH - timedelta(seconds=rng.random() * _HISTORY_SECONDS)
+
+
+def _log_normal_size(rng: random.Random, median: int, low: int, high: int) -> int:
+    return int(min(max(rng.lognormvariate(math.log(median), 1.0), low), high))
+
+
+def _build_corpus(seed: int, size: int = 1 << 20) -> str:
+    """Template-like source text that generated contents are sliced from."""
+    rng = random.Random(f"{seed}:corpus")
+    lines = (
+        "def {{%(var)s}}_%(word)s(request):\n",
+        "    %(word)s = await {{%(var)s}}.fetch(request.%(other)s)\n",
+        "    return render(\"{{%(var)s}}\", %(word)s=%(other)s)\n",
+        "class {{%(var)s}}%(word)s(Base):\n",
+        "    __tablename__ = \"{{%(var)s}}_%(other)s\"\n",
+        "# %(word)s {{%(var)s}} %(other)s\n",
+    )
+    parts, total = [], 0
+    while total < size:
+        text = rng.choice(lines) % {
+            "var": rng.choice(_VARIABLES),
+            "word": rng.choice(_WORDS),
+            "other": rng.choice(_WORDS),
+        }
+        parts.append(text)
+        total += len(text)
+    return "".join(parts)
+
+
+_corpus_cache: Dict[int, str] = {}
+
+
+def _corpus(seed: int) -> str:
+    corpus = _corpus_cache.get(seed)
+    if corpus is None:
+        corpus = _corpus_cache[seed] = _build_corpus(seed)
+    return corpus
+
+
+def _slice(rng: random.Random, corpus: str, size: int) -> str:
+    if size >= len(corpus):
+        return (corpus * (size // len(corpus) + 1))[:size]
+    start = rng.randrange(len(corpus) - size)
+    return corpus[start:start + size]
+
+
+def user_rows(spec: DatasetSpec, rng: random.Random, start: int, stop: int) -> List[tuple]:
+    rows = []
+    for i in range(start, stop):
+        rows.append((
+            entity_id(spec.seed, "users", i),
+            f"user{i}@perf.example.com",
+            spec.password_hash,
+            f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}",
+            rng.random() < 0.98,
+            _created_at(rng),
+        ))
+    return rows
+
+
+def template_rows(spec: DatasetSpec, rng: random.Random, start: int, stop: int) -> List[tuple]:
+    corpus = _corpus(spec.seed)
+    rows = []
+    for i in range(start, stop):
+        category = _category(rng)
+        language = _language(rng)
+        words = rng.sample(_WORDS, 3)
+        rows.append((
+            entity_id(spec.seed, "templates", i),
+            f"{words[0].title()} {words[1].title()} {category} {i}",
+            f"{language} {category.lower()} template for {words[0]} {words[1]} {words[2]}",
+            _slice(rng, corpus, _log_normal_size(rng, 2048, 64, 256 * 1024)),
+            category,
+            language,
+            json.dumps({name: "str" for name in rng.sample(_VARIABLES, rng.randint(1, 4))}),
+            entity_id(spec.seed, "users", _skewed(rng, spec.users)),
+            rng.random() < 0.3,
+            _created_at(rng),
+        ))
+    return rows
+
+
+def project_rows(spec: DatasetSpec, rng: random.Random, start: int, stop: int) -> List[tuple]:
+    corpus = _corpus(spec.seed)
+    rows = []
+    for i in range(start, stop):
+        status = _status(rng)
+        words = rng.sample(_WORDS, 2)
+        rows.append((
+            entity_id(spec.seed, "projects", i),
+            f"{words[0].title()} {words[1]} project {i}",
+            f"Generated {words[0]} {words[1]} code" if rng.random() < 0.7 else None,
+            entity_id(spec.seed, "templates", _skewed(rng, spec.templates, 3.0)),
+            entity_id(spec.seed, "users", _skewed(rng, spec.users)),
+            json.dumps({"framework": rng.choice(_WORDS), "features": rng.sample(_WORDS, 2)}),
+            status,
+            _slice(rng, corpus, _log_normal_size(rng, 4096, 64, 256 * 1024))
+            if status != "draft" else None,
+            _created_at(rng),
+        ))
+    return rows
+
+
+GENERATORS = {"users": user_rows, "templates": template_rows, "projects": project_rows}
+
+
+def generate_batch(spec: DatasetSpec, table: str, batch: int) -> List[tuple]:
+    """Generate one batch of rows; the same arguments give the same rows.
+
+    Args:
+        spec: Dataset parameters
+        table: ``users``, ``templates`` or ``projects``
+        batch: Batch number
+
+    Returns:
+        Row tuples in ``COLUMNS[table]`` order
+    """
+    total = getattr(spec, table)
+    start = batch * spec.batch_size
+    stop = min(start + spec.batch_size, total)
+    rng = random.Random(f"{spec.seed}:{table}:{batch}")
+    return GENERATORS[table](spec, rng, start, stop)
+
+
+async def _copy_batches(dsn: str, spec: DatasetSpec, table: str, batches: List[int]) -> int:
+    import asyncpg
+
+    connection = await asyncpg.connect(dsn)
+    copied = 0
+    try:
+        for batch in batches:
+            rows = generate_batch(spec, table, batch)
+            await connection.copy_records_to_table(table, records=rows, columns=COLUMNS[table])
+            copied += len(rows)
+    finally:
+        await connection.close()
+    return copied
+
+
+def _load_worker(dsn: str, spec: DatasetSpec, table: str, batches: List[int]) -> int:
+    """Process pool entry point: COPY a share of a table's batches."""
+    return asyncio.run(_copy_batches(dsn, spec, table, batches))
+
+
+def load_table(pool: ProcessPoolExecutor, dsn: str, spec: DatasetSpec, table: str, workers: int) -> int:
+    """COPY all batches of a table, spread over the worker processes.
+
+    Returns:
+        Number of rows loaded
+    """
+    batches = list(range(math.ceil(getattr(spec, table) / spec.batch_size)))
+    shares = [batches[w::workers] for w in range(workers) if batches[w::workers]]
+    futures = [pool.submit(_load_worker, dsn, spec, table, share) for share in shares]
+    return sum(future.result() for future in futures)
+
+
+def _metadata():
+    from app.core.database import Base
+    from app.models.project import Project  # noqa: F401 - registers the tables
+    from app.models.revoked_token import RevokedToken  # noqa: F401
+    from app.models.template import Template  # noqa: F401
+    from app.models.user import User  # noqa: F401
+
+    return Base.metadata
+
+
+def _secondary_indexes():
+    tables = _metadata().tables
+    return [index for name in COLUMNS for index in tables[name].indexes]
+
+
+async def prepare(url: str, truncate: bool, create_schema: bool, drop_indexes: bool) -> None:
+    """Create or empty the tables and drop secondary indexes before loading."""
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.begin() as conn:
+        if create_schema:
+            await conn.run_sync(_metadata().create_all)
+        if truncate:
+            await conn.execute(text("TRUNCATE users, templates, projects CASCADE"))
+        if drop_indexes:
+            for index in _secondary_indexes():
+                await conn.execute(text(f'DROP INDEX IF EXISTS "{index.name}"'))
+    await engine.dispose()
+
+
+async def finalize(url: str, create_indexes: bool) -> None:
+    """Rebuild secondary indexes in parallel, then analyze the tables."""
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+    from sqlalchemy.schema import CreateIndex
+
+    engine = create_async_engine(url, poolclass=NullPool)
+
+    async def create(index) -> None:
+        async with engine.begin() as conn:
+            await conn.execute(CreateIndex(index, if_not_exists=True))
+
+    if create_indexes:
+        await asyncio.gather(*(create(index) for index in _secondary_indexes()))
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE users, templates, projects"))
+    await engine.dispose()
+
+
+def _password_hash() -> str:
+    from passlib.hash import bcrypt
+
+    return bcrypt.using(salt=_PASSWORD_SALT).hash(SEED_PASSWORD)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="Disposable database (default: DATABASE_URL)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--templates", type=int, default=2_000_000)
+    parser.add_argument("--projects", type=int, default=2_000_000)
+    parser.add_argument("--batch-size", type=int, default=10_000, help="Rows per COPY")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Loader processes")
+    parser.add_argument("--truncate", action="store_true", help="Empty the tables first")
+    parser.add_argument("--create-schema", action="store_true", help="Create missing tables")
+    parser.add_argument("--keep-indexes", action="store_true", help="Load with indexes in place")
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    from sqlalchemy.engine import make_url
+
+    from app.core.config import settings
+
+    url = settings.DATABASE_URL
+    dsn = make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+    spec = DatasetSpec(
+        seed=args.seed,
+        users=args.users,
+        templates=args.templates if args.users else 0,
+        projects=args.projects if args.templates and args.users else 0,
+        batch_size=args.batch_size,
+        password_hash=_password_hash(),
+    )
+
+    started = time.perf_counter()
+    asyncio.run(prepare(url, args.truncate, args.create_schema, not args.keep_indexes))
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        # Tables in foreign key order; each is loaded fully before the next
+        for table in ("users", "templates", "projects"):
+            table_started = time.perf_counter()
+            rows = load_table(pool, dsn, spec, table, args.workers)
+            elapsed = time.perf_counter() - table_started
+            print(f"{table:<10} {rows:>10,} rows in {elapsed:6.1f}s ({rows / max(elapsed, 1e-9):,.0f} rows/s)")
+
+    index_started = time.perf_counter()
+    asyncio.run(finalize(url, not args.keep_indexes))
+    print(f"indexes and ANALYZE in {time.perf_counter() - index_started:.1f}s")
+    print(f"total {time.perf_counter() - started:.1f}s; password for all users: {SEED_PASSWORD}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Microbenchmark of response serialization for the list endpoints.
+
+Builds the ``GET /templates`` and ``GET /projects`` payloads from in-memory
+ORM objects the way the endpoints do, then runs them through FastAPI's
+response serialization and renders the body. It compares the untyped dict
+envelope rendered by ``JSONResponse`` (as before) with the typed
+``ApiResponse`` envelope rendered by ``ORJSONResponse`` (as now). No
+database is needed.
+
+Usage:
+    python -m benchmarks.serialization [--iterations N] [--items N]
+        [--content-bytes N] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.models.project import Project
+from app.models.template import Template
+from app.schemas.common import ApiResponse
+from app.schemas.project import ProjectResponse
+from app.schemas.template import TemplateListResponse, TemplateResponse
+
+
+def _templates(count: int, content_bytes: int):
+    now = datetime.now(timezone.utc)
+    user_id = uuid.uuid4()
+    return [
+        Template(
+            id=uuid.uuid4(),
+            name=f"Template {i}",
+            description="Benchmark template " * 10,
+            content="def {{name}}():\n    return {{value}}\n" * (content_bytes // 36 + 1),
+            category="API",
+            language="Python",
+            variables={"name": "str", "value": "int"},
+            user_id=user_id,
+            is_public=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def _projects(count: int, content_bytes: int):
+    now = datetime.now(timezone.utc)
+    user_id = uuid.uuid4()
+    return [
+        Project(
+            id=uuid.uuid4(),
+            name=f"Project {i}",
+            description="Benchmark project",
+            template_id=uuid.uuid4(),
+            user_id=user_id,
+            config={"framework": "fastapi", "features": ["auth", "crud"]},
+            status="generated",
+            generated_code="x = 1\n" * (content_bytes // 6),
+            created_at=now,
+            updated_at=None,
+        )
+        for i in range(count)
+    ]
+
+
+def _dict_templates(templates):
+    return {
+        "success": True,
+        "message": "Templates retrieved successfully",
+        "data": {
+            "items": [TemplateResponse.model_validate(t) for t in templates],
+            "total": len(templates),
+            "page": 1,
+            "size": len(templates),
+            "pages": 1,
+        },
+    }
+
+
+def _typed_templates(templates):
+    return ApiResponse[TemplateListResponse](
+        message="Templates retrieved successfully",
+        data=TemplateListResponse(
+            items=[TemplateResponse.model_validate(t) for t in templates],
+            total=len(templates),
+            page=1,
+            size=len(templates),
+            pages=1,
+        ),
+    )
+
+
+def _dict_projects(projects):
+    return {
+        "success": True,
+        "message": "Projects retrieved successfully",
+        "data": [ProjectResponse.model_validate(p) for p in projects],
+    }
+
+
+def _typed_projects(projects):
+    return ApiResponse[list[ProjectResponse]](
+        message="Projects retrieved successfully",
+        data=[ProjectResponse.model_validate(p) for p in projects],
+    )
+
+
+async def _per_call_us(build, records, response_model, response_class, iterations: int):
+    """Time building, serializing and rendering one response."""
+    field = create_response_field(name="response", type_=response_model)
+    size = 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        content = await serialize_response(field=field, response_content=build(records))
+        size = len(response_class(content).body)
+    return (time.perf_counter() - start) / iterations * 1e6, size
+
+
+async def run(iterations: int, items: int, content_bytes: int) -> dict:
+    cases = {
+        "list_templates": (
+            _templates(items, content_bytes),
+            (_dict_templates, dict, JSONResponse),
+            (_typed_templates, ApiResponse[TemplateListResponse], ORJSONResponse),
+        ),
+        "list_projects": (
+            _projects(items, content_bytes),
+            (_dict_projects, dict, JSONResponse),
+            (_typed_projects, ApiResponse[list[ProjectResponse]], ORJSONResponse),
+        ),
+    }
+
+    results = {}
+    for name, (records, before, after) in cases.items():
+        build, response_model, response_class = before
+        before_us, before_size = await _per_call_us(
+            build, records, response_model, response_class, iterations
+        )
+        build, response_model, response_class = after
+        after_us, after_size = await _per_call_us(
+            build, records, response_model, response_class, iterations
+        )
+        results[name] = {
+            "dict_json_us": before_us,
+            "typed_orjson_us": after_us,
+            "speedup": before_us / after_us,
+            "body_bytes": after_size,
+            "identical_size": before_size == after_size,
+        }
+
+    results["iterations"] = iterations
+    results["items"] = items
+    results["content_bytes"] = content_bytes
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--content-bytes", type=int, default=4096)
+    parser.add_argument("--json", action="store_true", help="Emit JSON results")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.iterations, args.items, args.content_bytes))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'endpoint':<16} {'dict+json':>12} {'typed+orjson':>14} {'speedup':>9}")
+    for name, row in results.items():
+        if not isinstance(row, dict):
+            continue
+        print(
+            f"{name:<16} {row['dict_json_us']:9.0f} us {row['typed_orjson_us']:11.0f} us "
+            f"{row['speedup']:8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()